@@ -1,16 +1,19 @@
 """
 SuperAgent - Voice-Controlled Multi-Agent Testing System
 """
-from agent_system.error_recovery import (
-    retry_with_backoff,
-    get_circuit_breaker,
-    get_agent_recovery_decorator,
-    GracefulDegradation,
-    ErrorCategory,
-    ErrorClassifier,
-    CircuitBreaker,
-    CircuitBreakerOpenError
-)
+import importlib
+
+# Error recovery helpers are imported lazily on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    'retry_with_backoff': 'agent_system.error_recovery',
+    'get_circuit_breaker': 'agent_system.error_recovery',
+    'get_agent_recovery_decorator': 'agent_system.error_recovery',
+    'GracefulDegradation': 'agent_system.error_recovery',
+    'ErrorCategory': 'agent_system.error_recovery',
+    'ErrorClassifier': 'agent_system.error_recovery',
+    'CircuitBreaker': 'agent_system.error_recovery',
+    'CircuitBreakerOpenError': 'agent_system.error_recovery'
+}
 
 __all__ = [
     'retry_with_backoff',
@@ -22,3 +25,15 @@ __all__ = [
     'CircuitBreaker',
     'CircuitBreakerOpenError'
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,23 @@
 """
 SuperAgent Agents
 All specialized AI agents for the multi-agent testing system.
+
+Agents are imported lazily on first attribute access (PEP 562), so using
+one agent doesn't pay the import cost of all the others.
 """
+import importlib
 
-from agent_system.agents.base_agent import BaseAgent, AgentResult
-from agent_system.agents.kaya import KayaAgent
-from agent_system.agents.scribe_full import ScribeAgent
-from agent_system.agents.runner import RunnerAgent
-from agent_system.agents.critic import CriticAgent
-from agent_system.agents.medic import MedicAgent
-from agent_system.agents.gemini import GeminiAgent
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    'BaseAgent': 'agent_system.agents.base_agent',
+    'AgentResult': 'agent_system.agents.base_agent',
+    'KayaAgent': 'agent_system.agents.kaya',
+    'ScribeAgent': 'agent_system.agents.scribe_full',
+    'RunnerAgent': 'agent_system.agents.runner',
+    'CriticAgent': 'agent_system.agents.critic',
+    'MedicAgent': 'agent_system.agents.medic',
+    'GeminiAgent': 'agent_system.agents.gemini'
+}
 
 __all__ = [
     'BaseAgent',
@@ -21,3 +29,15 @@ __all__ = [
     'MedicAgent',
     'GeminiAgent'
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,16 +2,37 @@
 Base Agent class for SuperAgent
 Provides common functionality for all agents.
 """
+import copy
+import sys
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 import time
 
 from agent_system.secrets_manager import get_secrets_manager
 
+# Use the libyaml C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-@dataclass
+
+@lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime: float) -> Any:
+    """
+    Parse a YAML file once per (path, mtime).
+
+    Keying on mtime means edited configs are re-parsed on next load.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+# slots=True (Python 3.10+) drops the per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AgentResult:
     """Standard result format for all agents."""
     success: bool
@@ -49,15 +70,33 @@ class BaseAgent:
             # Default to .claude/agents/{agent_name}.yaml
             config_path = Path(__file__).parent.parent.parent / '.claude' / 'agents' / f'{agent_name}.yaml'
 
-        self.config = self._load_config(config_path) if Path(config_path).exists() else {}
-
-        # Initialize secrets manager for API key management
-        self.secrets_manager = get_secrets_manager()
+        self.config = self._load_config(config_path)
 
         # Track costs and execution time
         self.total_cost = 0.0
         self.execution_count = 0
 
+    # Secrets manager shared by all agents, resolved on first access
+    _secrets_manager = None
+
+    @property
+    def secrets_manager(self):
+        """
+        Global SecretsManager for API key management.
+
+        Looked up lazily so agents that never need keys (e.g. Critic) skip it.
+        Assigning to it overrides the manager for this agent only.
+        """
+        # Instance override if one was assigned, else the shared manager
+        manager = self._secrets_manager
+        if manager is None:
+            manager = BaseAgent._secrets_manager = get_secrets_manager()
+        return manager
+
+    @secrets_manager.setter
+    def secrets_manager(self, manager) -> None:
+        self._secrets_manager = manager
+
     def _load_config(self, config_path: Path) -> Dict[str, Any]:
         """
         Load agent configuration from YAML.
@@ -66,11 +105,14 @@ class BaseAgent:
             config_path: Path to config file
 
         Returns:
-            Config dict
+            Config dict (empty if the file doesn't exist)
         """
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            path = Path(config_path).resolve()
+            # Copy so agents can't mutate the shared cached config
+            return copy.deepcopy(_load_yaml_cached(str(path), path.stat().st_mtime))
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             print(f"Warning: Could not load config from {config_path}: {e}")
             return {}
@@ -87,15 +129,15 @@ class BaseAgent:
         """
         raise NotImplementedError("Subclasses must implement execute()")
 
-    def _track_execution(self, start_time: float, cost: float = 0.0):
+    def _track_execution(self, start_time: int, cost: float = 0.0):
         """
         Track execution metrics.
 
         Args:
-            start_time: Start time from time.time()
+            start_time: Start time from time.perf_counter_ns()
             cost: Cost in USD
         """
-        execution_time_ms = int((time.time() - start_time) * 1000)
+        execution_time_ms = (time.perf_counter_ns() - start_time) // 1_000_000
         self.total_cost += cost
         self.execution_count += 1
         return execution_time_ms
@@ -2,13 +2,29 @@
 Critic Agent - Pre-Validator
 Quality gate before expensive Gemini validation.
 """
+import copy
+import hashlib
+import mmap
+import os
 import re
 import time
-from typing import Dict, Any, List, Tuple
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from agent_system.agents.base_agent import BaseAgent, AgentResult
 
+# Optional RE2 engine (google-re2): DFA-based, linear-time matching with no
+# backtracking. Falls back to the stdlib re module when not installed.
+try:
+    import re2 as _regex
+    RE2_AVAILABLE = True
+except ImportError:
+    _regex = re
+    RE2_AVAILABLE = False
+
 
 class CriticAgent(BaseAgent):
     """
@@ -26,34 +42,93 @@ class CriticAgent(BaseAgent):
     ANTI_PATTERNS = [
         {
             'pattern': r'\.nth\(\d+\)',
-            'reason': 'Index-based selectors are flaky'
+            'reason': 'Index-based selectors are flaky',
+            'fix': 'Replace with data-testid selector: await page.locator(\'[data-testid="element-name"]\').click()'
         },
         {
             'pattern': r'\.css-[a-z0-9]+',
-            'reason': 'Generated CSS classes change frequently'
+            'reason': 'Generated CSS classes change frequently',
+            'fix': 'Use data-testid attribute instead of CSS class: <div data-testid="element-name">'
         },
         {
             'pattern': r'waitForTimeout',
-            'reason': 'Use waitForSelector instead'
+            'reason': 'Use waitForSelector instead',
+            'fix': 'Replace with waitForSelector: await page.waitForSelector(\'[data-testid="element"]\', { timeout: 5000 })'
         },
         {
-            'pattern': r'hard[_-]?coded.*credential',
+            # Case-insensitive via ASCII character classes rather than IGNORECASE,
+            # with a bounded gap instead of .* to cap backtracking on long lines
+            'pattern': r'[Hh][Aa][Rr][Dd][_-]?[Cc][Oo][Dd][Ee][Dd][^\n]{0,60}?[Cc][Rr][Ee][Dd][Ee][Nn][Tt][Ii][Aa][Ll]',
             'reason': 'Use environment variables',
-            'flags': re.IGNORECASE
+            'fix': 'Use environment variable: process.env.TEST_USERNAME'
         },
         {
             'pattern': r'localhost|127\.0\.0\.1',
-            'reason': 'Use process.env.BASE_URL'
+            'reason': 'Use process.env.BASE_URL',
+            'fix': 'Use environment variable: await page.goto(process.env.BASE_URL!)'
         }
     ]
 
+    # Each anti-pattern as a bytes regex; per-pattern flags are scoped inline,
+    # e.g. (?i:...), so they don't leak when the patterns are combined below
+    _ANTI_PATTERN_SOURCES = tuple(
+        f'(?i:{p["pattern"]})' if p.get('flags', 0) & re.IGNORECASE else p['pattern']
+        for p in ANTI_PATTERNS
+    )
+    _ANTI_PATTERN_REGEXES = tuple(_regex.compile(source.encode()) for source in _ANTI_PATTERN_SOURCES)
+
+    # All anti-patterns fused into one alternation (named group p<index>) so a
+    # single pass over the file finds every violation. Patterns are matched
+    # against the raw file contents. ANTI_PATTERNS must not contain capturing
+    # groups: match.lastindex - 1 is the index of the pattern that matched.
+    _ANTI_PATTERN_UNION = _regex.compile('|'.join(
+        f'(?P<p{i}>{source})' for i, source in enumerate(_ANTI_PATTERN_SOURCES)
+    ).encode())
+
+    # Lowercase literals, at least one of which appears (in some letter case)
+    # in any ANTI_PATTERNS match. Keep in sync when adding patterns.
+    _ANTI_PATTERN_LITERALS = (
+        b'.nth(', b'.css-', b'waitfortimeout', b'credential', b'localhost', b'127.0.0.1'
+    )
+
+    # Byte classes for the expect() scanner, matching regex \w and \s on bytes
+    _WORD_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+    _SPACE_BYTES = frozenset(b' \t\n\r\f\v')
+
+    # Test actions counted toward cost/duration estimates (one alternation, one pass)
+    _ACTION_RE = _regex.compile(
+        rb'\.click\(|\.fill\(|\.type\(|\.press\(|\.goto\(|waitFor|\.screenshot\('
+    )
+
     MAX_STEPS = 10
     MAX_DURATION_MS = 60000
 
+    # Files at least this large are memory-mapped instead of read into memory
+    MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+    # Max reviews remembered by content hash (LRU eviction)
+    RESULT_CACHE_SIZE = 256
+
     def __init__(self):
         """Initialize Critic agent."""
         super().__init__('critic')
 
+        # Fields shared by every issue for a given anti-pattern, indexed like
+        # ANTI_PATTERNS; each match only adds its line and matched text
+        self._anti_pattern_issues = [
+            {
+                'type': 'anti_pattern',
+                'pattern': p['pattern'],
+                'reason': p['reason'],
+                'severity': 'critical',
+                'fix': self._suggest_fix(p)
+            }
+            for p in self.ANTI_PATTERNS
+        ]
+
+        # Review results keyed by BLAKE2b digest of the file contents
+        self._result_cache: Dict[bytes, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
     def execute(self, test_path: str) -> AgentResult:
         """
         Review test for quality issues.
@@ -64,12 +139,32 @@ class CriticAgent(BaseAgent):
         Returns:
             AgentResult with approved/rejected and feedback
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
+        test_code = None
 
         try:
-            # Read test file
-            with open(test_path, 'r') as f:
-                test_code = f.read()
+            # Read test file as raw bytes (patterns are byte-mode, no decode needed)
+            test_code = self._read_test_code(test_path)
+
+            # Review depends only on file contents, so unchanged files reuse it
+            cache_key = hashlib.blake2b(test_code, digest_size=16).digest()
+            cached = self._result_cache.pop(cache_key, None)
+            if cached is not None:
+                # Re-insert to mark as most recently used
+                self._result_cache[cache_key] = cached
+                data, metadata = copy.deepcopy(cached)
+                data['test_path'] = test_path
+                return AgentResult(
+                    success=True,
+                    data=data,
+                    metadata=metadata,
+                    execution_time_ms=self._track_execution(start_time)
+                )
+
+            # Scan once; results are reused by every check below
+            assertion_count = self._count_assertions(test_code)
+            cost_estimate = self._estimate_cost(test_code)
+            duration_estimate = self._estimate_duration(cost_estimate['steps'])
 
             # Run all checks
             issues = []
@@ -79,13 +174,10 @@ class CriticAgent(BaseAgent):
             issues.extend(pattern_issues)
 
             # 2. Check for minimum assertions
-            assertion_issues = self._check_assertions(test_code)
+            assertion_issues = self._check_assertions(assertion_count)
             issues.extend(assertion_issues)
 
-            # 3. Estimate cost and duration
-            cost_estimate = self._estimate_cost(test_code)
-            duration_estimate = self._estimate_duration(test_code)
-
+            # 3. Check estimated cost and duration
             if cost_estimate['steps'] > self.MAX_STEPS:
                 issues.append({
                     'type': 'excessive_steps',
@@ -112,25 +204,34 @@ class CriticAgent(BaseAgent):
             # Generate formatted feedback
             feedback = self._format_feedback(issues, cost_estimate, duration_estimate) if not approved else None
 
+            data = {
+                'status': 'approved' if approved else 'rejected',
+                'test_path': test_path,
+                'issues_found': issues,
+                'feedback': feedback,
+                'estimated_cost_usd': cost_estimate['cost_usd'],
+                'estimated_duration_ms': duration_estimate,
+                'estimated_steps': cost_estimate['steps']
+            }
+            metadata = {
+                'anti_patterns_found': len(pattern_issues),
+                'assertion_count': assertion_count,
+                'critical_issues': len([i for i in issues if i.get('severity') == 'critical']),
+                'warnings': len([i for i in issues if i.get('severity') == 'warning'])
+            }
+
+            # Cache a private copy (LRU eviction if full)
+            if len(self._result_cache) >= self.RESULT_CACHE_SIZE:
+                oldest_key = next(iter(self._result_cache))
+                del self._result_cache[oldest_key]
+            self._result_cache[cache_key] = copy.deepcopy((data, metadata))
+
             execution_time = self._track_execution(start_time)
 
             return AgentResult(
                 success=True,
-                data={
-                    'status': 'approved' if approved else 'rejected',
-                    'test_path': test_path,
-                    'issues_found': issues,
-                    'feedback': feedback,
-                    'estimated_cost_usd': cost_estimate['cost_usd'],
-                    'estimated_duration_ms': duration_estimate,
-                    'estimated_steps': cost_estimate['steps']
-                },
-                metadata={
-                    'anti_patterns_found': len(pattern_issues),
-                    'assertion_count': self._count_assertions(test_code),
-                    'critical_issues': len([i for i in issues if i.get('severity') == 'critical']),
-                    'warnings': len([i for i in issues if i.get('severity') == 'warning'])
-                },
+                data=data,
+                metadata=metadata,
                 execution_time_ms=execution_time
             )
 
@@ -146,53 +247,146 @@ class CriticAgent(BaseAgent):
                 error=f"Critic error: {str(e)}",
                 execution_time_ms=self._track_execution(start_time)
             )
+        finally:
+            if isinstance(test_code, mmap.mmap):
+                test_code.close()
+
+    def execute_batch(self, test_paths: List[str], max_workers: Optional[int] = None) -> List[AgentResult]:
+        """
+        Review multiple test files in parallel across processes.
+
+        Regex scanning holds the GIL, so files are fanned out to a process
+        pool rather than threads. Results are returned in input order.
+
+        Args:
+            test_paths: Paths to test files
+            max_workers: Pool size (defaults to os.cpu_count())
+
+        Returns:
+            List of AgentResult, one per test path
+        """
+        if len(test_paths) <= 1:
+            return [self.execute(path) for path in test_paths]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_critic_worker, test_paths))
+
+        # Workers track their own stats; fold the runs into this agent's
+        self.execution_count += len(results)
+        self.total_cost += sum(result.cost_usd for result in results)
+
+        return results
+
+    def _read_test_code(self, test_path: str):
+        """
+        Load test file contents for scanning.
+
+        Files of MMAP_THRESHOLD_BYTES or more are memory-mapped so the kernel
+        pages them in on demand rather than copying the whole file into memory.
+
+        Args:
+            test_path: Path to test file
+
+        Returns:
+            File bytes, or a read-only mmap for large files (caller closes it)
+        """
+        with open(test_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self.MMAP_THRESHOLD_BYTES:
+                return f.read()
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-    def _check_anti_patterns(self, code: str) -> List[Dict[str, Any]]:
+    def _check_anti_patterns(self, code: bytes) -> List[Dict[str, Any]]:
         """
         Check for anti-patterns in test code with line numbers.
 
         Args:
-            code: Test code content
+            code: Test code content (bytes)
 
         Returns:
             List of issue dictionaries with line numbers and details
         """
         issues = []
-        lines = code.split('\n')
-
-        for pattern_def in self.ANTI_PATTERNS:
-            pattern = pattern_def['pattern']
-            reason = pattern_def['reason']
-            flags = pattern_def.get('flags', 0)
-
-            # Find all matches with line numbers
-            for line_num, line in enumerate(lines, start=1):
-                matches = re.finditer(pattern, line, flags)
-                for match in matches:
-                    issues.append({
-                        'type': 'anti_pattern',
-                        'line': line_num,
-                        'pattern': pattern,
-                        'matched': match.group(),
-                        'reason': reason,
-                        'severity': 'critical',
-                        'fix': self._suggest_fix(pattern, reason)
-                    })
+
+        # Cheap substring prefilter: most files contain none of the literals,
+        # so the regex scan can be skipped entirely. Lowering makes the check
+        # safe for the case-insensitive credential pattern. Memory-mapped
+        # files skip this since lower() would copy the whole file.
+        if isinstance(code, bytes):
+            lowered = code.lower()
+            if not any(literal in lowered for literal in self._ANTI_PATTERN_LITERALS):
+                return issues
+
+        matches = list(self._ANTI_PATTERN_UNION.finditer(code))
+        if not matches:
+            return issues
+
+        # Offsets where each line begins; bisect maps a match offset to its line
+        line_starts = self._line_starts(code)
+
+        for match in matches:
+            index = match.lastindex - 1
+            issues.append(self._anti_pattern_issue(index, match, line_starts))
+
+            # The alternation reports one pattern per span; other patterns
+            # starting inside it (e.g. localhost inside a hardcoded
+            # credential) are still reported, as when scanned one by one
+            start, end = match.span()
+            for other, regex in enumerate(self._ANTI_PATTERN_REGEXES):
+                if other == index:
+                    continue
+                inner = regex.search(code, start)
+                while inner is not None and inner.start() < end:
+                    issues.append(self._anti_pattern_issue(other, inner, line_starts))
+                    inner = regex.search(code, max(inner.end(), inner.start() + 1))
 
         return issues
 
-    def _check_assertions(self, code: str) -> List[Dict[str, Any]]:
+    def _anti_pattern_issue(self, index: int, match: Any, line_starts: array) -> Dict[str, Any]:
+        """
+        Build the issue for one anti-pattern match.
+
+        Args:
+            index: Index of the matched pattern in ANTI_PATTERNS
+            match: Regex match over the file contents
+            line_starts: Table from _line_starts
+
+        Returns:
+            Issue dict with line number and matched text
+        """
+        return {
+            **self._anti_pattern_issues[index],
+            'line': bisect_right(line_starts, match.start()),
+            'matched': match.group().decode('utf-8', errors='replace')
+        }
+
+    @staticmethod
+    def _line_starts(code: bytes) -> array:
+        """
+        Build the table of offsets at which each line of code begins.
+
+        Args:
+            code: Test code content (bytes)
+
+        Returns:
+            Offsets in ascending order, starting with 0 for line 1
+        """
+        line_starts = array('q', [0])
+        pos = code.find(b'\n')
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = code.find(b'\n', pos + 1)
+        return line_starts
+
+    def _check_assertions(self, assertion_count: int) -> List[Dict[str, Any]]:
         """
         Check for minimum assertions.
 
         Args:
-            code: Test code content
+            assertion_count: Number of expect() calls from _count_assertions
 
         Returns:
             List of issues (empty if assertions found)
         """
-        assertion_count = self._count_assertions(code)
-
         if assertion_count < 1:
             return [{
                 'type': 'missing_assertions',
@@ -205,41 +399,43 @@ class CriticAgent(BaseAgent):
 
         return []
 
-    def _count_assertions(self, code: str) -> int:
+    def _count_assertions(self, code: bytes) -> int:
         """
         Count expect() calls in code.
 
         Args:
-            code: Test code
+            code: Test code (bytes)
 
         Returns:
             Number of assertions
         """
-        # Count expect(...) patterns
-        return len(re.findall(r'\bexpect\s*\(', code))
-
-    def _estimate_cost(self, code: str) -> Dict[str, Any]:
+        # Equivalent to counting \bexpect\s*\( matches, but find() jumps
+        # straight between 'expect' occurrences instead of running the regex
+        count = 0
+        size = len(code)
+        pos = code.find(b'expect')
+        while pos != -1:
+            end = pos + 6
+            if pos == 0 or code[pos - 1] not in self._WORD_BYTES:
+                while end < size and code[end] in self._SPACE_BYTES:
+                    end += 1
+                if end < size and code[end] == 0x28:  # '('
+                    count += 1
+            pos = code.find(b'expect', end)
+        return count
+
+    def _estimate_cost(self, code: bytes) -> Dict[str, Any]:
         """
         Estimate execution cost.
 
         Args:
-            code: Test code
+            code: Test code (bytes)
 
         Returns:
             Dict with steps and cost_usd estimate
         """
-        # Count test actions
-        action_patterns = [
-            r'\.click\(',
-            r'\.fill\(',
-            r'\.type\(',
-            r'\.press\(',
-            r'\.goto\(',
-            r'waitFor',
-            r'\.screenshot\('
-        ]
-
-        step_count = sum(len(re.findall(pattern, code)) for pattern in action_patterns)
+        # Count test actions in one pass without building a list of matches
+        step_count = sum(1 for _ in self._ACTION_RE.finditer(code))
 
         # Rough cost estimate: $0.01 per 10 steps
         cost_usd = (step_count / 10) * 0.01
@@ -249,46 +445,30 @@ class CriticAgent(BaseAgent):
             'cost_usd': cost_usd
         }
 
-    def _estimate_duration(self, code: str) -> int:
+    def _estimate_duration(self, steps: int) -> int:
         """
         Estimate execution duration in milliseconds.
 
         Args:
-            code: Test code
+            steps: Action count from _estimate_cost
 
         Returns:
             Estimated duration in ms
         """
         # Rough estimate: 2 seconds per action
-        cost_estimate = self._estimate_cost(code)
-        steps = cost_estimate['steps']
-
         return steps * 2000  # 2s per step
 
-    def _suggest_fix(self, pattern: str, reason: str) -> str:
+    def _suggest_fix(self, anti_pattern: Dict[str, Any]) -> str:
         """
         Suggest a fix for detected anti-pattern.
 
         Args:
-            pattern: Regex pattern that was matched
-            reason: Reason for rejection
+            anti_pattern: ANTI_PATTERNS entry that was matched
 
         Returns:
-            Actionable fix suggestion
+            Actionable fix suggestion, or the rejection reason if it has none
         """
-        fix_suggestions = {
-            r'\.nth\(\d+\)': 'Replace with data-testid selector: await page.locator(\'[data-testid="element-name"]\').click()',
-            r'\.css-[a-z0-9]+': 'Use data-testid attribute instead of CSS class: <div data-testid="element-name">',
-            r'waitForTimeout': 'Replace with waitForSelector: await page.waitForSelector(\'[data-testid="element"]\', { timeout: 5000 })',
-            r'hard[_-]?coded.*credential': 'Use environment variable: process.env.TEST_USERNAME',
-            r'localhost|127\.0\.0\.1': 'Use environment variable: await page.goto(process.env.BASE_URL!)'
-        }
-
-        for pattern_key, suggestion in fix_suggestions.items():
-            if pattern == pattern_key:
-                return suggestion
-
-        return reason
+        return anti_pattern.get('fix', anti_pattern['reason'])
 
     def _format_feedback(self, issues: List[Dict[str, Any]], cost_estimate: Dict[str, Any], duration_estimate: int) -> str:
         """
@@ -352,3 +532,15 @@ class CriticAgent(BaseAgent):
         feedback_lines.append(f'  - Estimated duration: {duration_estimate / 1000:.1f}s')
 
         return '\n'.join(feedback_lines)
+
+
+# Per-process CriticAgent used by execute_batch pool workers
+_worker_critic: Optional[CriticAgent] = None
+
+
+def _critic_worker(test_path: str) -> AgentResult:
+    """Review one test file inside a pool worker process."""
+    global _worker_critic
+    if _worker_critic is None:
+        _worker_critic = CriticAgent()
+    return _worker_critic.execute(test_path)
@@ -7,22 +7,191 @@ Two-phase validation:
 2. AI-powered screenshot analysis with Gemini 2.5 Pro (optional, for critical paths)
 """
 import asyncio
+import atexit
+import collections
+import queue
+import threading
 import time
 import subprocess
 import json
 import os
 import base64
+import copy
+import io
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from agent_system.agents.base_agent import BaseAgent, AgentResult
 from agent_system.validation_rubric import ValidationRubric
-from agent_system.rate_limiter import limit_gemini
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from agent_system.rate_limiter import limit_gemini, get_rate_limiter, RateLimitExceeded
+from agent_system.observability.event_stream import emit_event
+
+# Optional: orjson for faster Playwright report parsing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional: Pillow for downscaling screenshots before upload
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    Image = None
+    PIL_AVAILABLE = False
+
+# Logging is configured by the application entrypoint, not on import
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# SuperAgent root; cache dependencies resolve here regardless of the CWD
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class BrowserPool:
+    """
+    Pool of pre-warmed Playwright browsers shared across validations.
+
+    Each slot is a long-lived Node sidecar running ``chromium.launchServer()``.
+    ``npx playwright test`` connects to a free slot's WebSocket endpoint
+    (via ``PW_TEST_CONNECT_WS_ENDPOINT``) and gets a fresh context in the
+    already-running browser, so browser launch is paid once per pool
+    instead of once per test.
+    """
+
+    LAUNCH_SCRIPT = (
+        "const { chromium } = require('playwright');"
+        "chromium.launchServer({ headless: process.env.PW_POOL_HEADLESS !== '0' })"
+        ".then(server => { console.log(server.wsEndpoint()); });"
+    )
+
+    # Max seconds to wait for a sidecar to report its endpoint
+    START_TIMEOUT_SECONDS = 30
+
+    def __init__(self, size: int, headless: bool = True):
+        """
+        Initialize browser pool.
+
+        Args:
+            size: Number of browsers to keep warm
+            headless: Launch browsers in headless mode
+        """
+        self.size = size
+        self.headless = headless
+        self._processes: List[subprocess.Popen] = []
+        self._available: queue.Queue = queue.Queue()
+
+    def start(self) -> None:
+        """
+        Launch all browser sidecars and wait for their endpoints.
+
+        Raises:
+            RuntimeError: If a sidecar exits or times out before reporting its endpoint
+        """
+        env = {**os.environ, 'PW_POOL_HEADLESS': '1' if self.headless else '0'}
+
+        for _ in range(self.size):
+            process = subprocess.Popen(
+                ['node', '-e', self.LAUNCH_SCRIPT],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                env=env
+            )
+            self._processes.append(process)
+
+            endpoint = self._read_endpoint(process)
+            if endpoint is None:
+                process.kill()
+                self.close()
+                raise RuntimeError(
+                    f"Browser sidecar did not report an endpoint within {self.START_TIMEOUT_SECONDS}s"
+                )
+            if not endpoint.startswith('ws'):
+                self.close()
+                raise RuntimeError("Browser sidecar exited before reporting an endpoint")
+
+            self._available.put(endpoint)
+
+        logger.info(f"Browser pool started with {self.size} browser(s)")
+
+    def _read_endpoint(self, process: subprocess.Popen) -> Optional[str]:
+        """
+        Read the endpoint line from a sidecar, giving up after START_TIMEOUT_SECONDS.
+
+        Args:
+            process: Sidecar process with a text stdout pipe
+
+        Returns:
+            Stripped first line of output, or None on timeout
+        """
+        lines: List[str] = []
+        reader = threading.Thread(target=lambda: lines.append(process.stdout.readline()), daemon=True)
+        reader.start()
+        reader.join(self.START_TIMEOUT_SECONDS)
+
+        return lines[0].strip() if lines else None
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Borrow a browser endpoint for the duration of a test run.
+
+        Args:
+            timeout: Seconds to wait for a free browser
+
+        Yields:
+            WebSocket endpoint of the borrowed browser
+        """
+        endpoint = self._available.get(timeout=timeout)
+        try:
+            yield endpoint
+        finally:
+            self._available.put(endpoint)
+
+    def close(self) -> None:
+        """Terminate all browser sidecars."""
+        for process in self._processes:
+            if process.poll() is None:
+                process.terminate()
+        self._processes.clear()
+        self._available = queue.Queue()
+
+
+# Global browser pool instance
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool(size: int, headless: bool = True) -> BrowserPool:
+    """
+    Get or create the global browser pool.
+
+    Args:
+        size: Number of browsers to keep warm
+        headless: Launch browsers in headless mode
+
+    Returns:
+        Global BrowserPool instance
+    """
+    global _browser_pool
+
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                pool = BrowserPool(size, headless=headless)
+                pool.start()
+                atexit.register(pool.close)
+                _browser_pool = pool
+
+    return _browser_pool
 
 
 class GeminiAgent(BaseAgent):
@@ -41,6 +210,51 @@ class GeminiAgent(BaseAgent):
     Tools: Playwright browser automation + Google Gemini API
     """
 
+    # Max passed validations kept in the content-addressed result cache
+    RESULT_CACHE_SIZE = 128
+
+    # Seconds a cached pass is reused (the app under test can change too)
+    DEFAULT_RESULT_CACHE_TTL = 600
+
+    # Max Gemini screenshot analyses kept in the re-judge cache
+    JUDGE_CACHE_SIZE = 256
+
+    # Bump when the screenshot analysis prompt changes
+    PROMPT_VERSION = 1
+
+    # Judge inputs persisted per test so analysis can re-run without a browser
+    JUDGE_INPUT_FILE = 'judge_input.json'
+
+    # Default model for screenshot analysis
+    DEFAULT_ANALYSIS_MODEL = 'gemini-2.5-flash'
+
+    # USD per 1M (input, output) tokens, <=200k-token prompts
+    MODEL_PRICING = {
+        'gemini-2.5-pro': (1.25, 10.00),
+        'gemini-2.5-flash': (0.30, 2.50),
+    }
+
+    # Screenshots are downscaled to fit this box before upload
+    MAX_SCREENSHOT_DIMENSION = 1024
+
+    # At most this many screenshots are attached to one analysis request
+    MAX_ANALYSIS_SCREENSHOTS = 3
+
+    # Playwright JSON report file written into each test's artifacts dir
+    REPORT_FILE = 'report.json'
+
+    # Concurrent validations when no browser pool is configured
+    DEFAULT_CONCURRENCY = 4
+
+    # Files besides the test itself that change how a test runs
+    CACHE_DEPENDENCIES = (
+        'playwright.config.ts',
+        'node_modules/@playwright/test/package.json',
+    )
+
+    # Environment read by the tests themselves (target app and test account)
+    CACHE_ENV_VARS = ('BASE_URL', 'BACKEND_URL', 'TEST_EMAIL', 'TEST_USERNAME')
+
     def __init__(self):
         """Initialize Gemini agent."""
         super().__init__('gemini')
@@ -48,6 +262,41 @@ class GeminiAgent(BaseAgent):
         self.default_timeout = 60  # seconds (includes browser startup time)
         self.max_test_duration_ms = 45000  # 45 seconds for test execution
 
+        # Resolve config once; validations read these plain attributes
+        contracts = self.config.get('contracts', {})
+        browser_config = contracts.get('browser', {})
+        self._gemini_config = contracts.get('gemini_api', {})
+        self._headless = browser_config.get('headless', True)
+        self._browser_config_key = repr(sorted(browser_config.items())).encode()
+
+        # Pre-warmed browser pool (0 disables pooling)
+        self.browser_pool_size = browser_config.get('pool_size', 0)
+
+        # Playwright child environment, built once instead of per validation
+        self._playwright_env = {**os.environ, 'PWTEST_SKIP_TEST_OUTPUT': '1'}
+
+        # Concurrent validations match the browser pool (threads start lazily)
+        self.validation_concurrency = self.browser_pool_size or self.DEFAULT_CONCURRENCY
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.validation_concurrency,
+            thread_name_prefix='gemini'
+        )
+
+        # Cache of passed validations: key digest -> (stored at, result data).
+        # Opt-in: the key cannot see changes to the app under test, so a
+        # cached pass could hide a regression until it expires
+        cache_config = contracts.get('validation_cache', {})
+        self.result_cache_enabled = cache_config.get('enabled', False)
+        self.result_cache_ttl = cache_config.get('ttl_seconds', self.DEFAULT_RESULT_CACHE_TTL)
+        self._result_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+
+        # Cache of screenshot analyses: judge key digest -> analysis
+        self._judge_cache: Dict[bytes, Dict[str, Any]] = {}
+
+        # Guards both caches; execute() runs concurrently on the executor
+        self._cache_lock = threading.Lock()
+        self.analysis_model = self._gemini_config.get('model', self.DEFAULT_ANALYSIS_MODEL)
+
         # Gemini API configuration
         self.gemini_enabled = self._check_gemini_api_available()
         self.gemini_client = None
@@ -57,7 +306,7 @@ class GeminiAgent(BaseAgent):
                 from google import genai
                 from google.genai import types
 
-                api_key = self.secrets_manager.get_secret('GEMINI_API_KEY')
+                api_key = self._gemini_api_key
                 if api_key:
                     self.gemini_client = genai.Client(api_key=api_key)
                     self.genai_types = types
@@ -80,15 +329,24 @@ class GeminiAgent(BaseAgent):
             True if Gemini API should be used
         """
         # Check config
-        gemini_config = self.config.get('contracts', {}).get('gemini_api', {})
-        if not gemini_config.get('enabled', False):
+        if not self._gemini_config.get('enabled', False):
             return False
 
         # Check for API key
-        api_key = self.secrets_manager.get_secret('GEMINI_API_KEY')
-        return api_key is not None
+        return self._gemini_api_key is not None
+
+    @cached_property
+    def _gemini_api_key(self) -> Optional[str]:
+        """Gemini API key, fetched from the secrets manager once per agent."""
+        return self.secrets_manager.get_secret('GEMINI_API_KEY')
 
-    def execute(self, test_path: str, timeout: Optional[int] = None, enable_ai_analysis: bool = False) -> AgentResult:
+    def execute(
+        self,
+        test_path: str,
+        timeout: Optional[int] = None,
+        enable_ai_analysis: bool = False,
+        use_cache: bool = True
+    ) -> AgentResult:
         """
         Validate test in real browser with screenshots.
 
@@ -96,11 +354,12 @@ class GeminiAgent(BaseAgent):
             test_path: Path to Playwright test file
             timeout: Optional timeout in seconds (default 60s)
             enable_ai_analysis: Enable Gemini API screenshot analysis (default False)
+            use_cache: Reuse a recent passing validation if the cache is enabled (default True)
 
         Returns:
             AgentResult with validation result and screenshots
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         timeout = timeout or self.default_timeout
         api_cost = 0.0
 
@@ -113,24 +372,32 @@ class GeminiAgent(BaseAgent):
                     execution_time_ms=self._track_execution(start_time)
                 )
 
-            # Prepare artifacts directory
-            test_name = Path(test_path).stem
-            artifacts_dir = Path('artifacts') / test_name
-            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            # Unchanged test + environment reuses the last passing validation
+            use_cache = use_cache and self.result_cache_enabled
+            cached = None
+            if use_cache:
+                cache_key = self._validation_cache_key(test_path, enable_ai_analysis)
+                cached = self._get_cached_validation(cache_key)
+            if cached is not None:
+                data = cached
+                data['test_path'] = test_path
+                return AgentResult(
+                    success=True,
+                    data=data,
+                    metadata={'cache_hit': True},
+                    execution_time_ms=self._track_execution(start_time)
+                )
 
             # Phase 1: Execute test with Playwright
-            logger.info(f"Phase 1: Executing test in browser: {test_path}")
-            validation_result = self._execute_test_in_browser(test_path, timeout, artifacts_dir)
+            artifacts_dir = Path('artifacts') / Path(test_path).stem
+            validation_result = self.validate_only(test_path, timeout, artifacts_dir)
 
             # Phase 2: Optional AI analysis with Gemini API
             ai_analysis = None
             if enable_ai_analysis and self.gemini_enabled and validation_result.get('screenshots'):
                 logger.info("Phase 2: Analyzing screenshots with Gemini API")
                 try:
-                    ai_analysis = self._analyze_screenshots_with_gemini(
-                        validation_result.get('screenshots', []),
-                        test_path
-                    )
+                    ai_analysis = self.rejudge(artifacts_dir)
                     api_cost = ai_analysis.get('cost_usd', 0.0)
                 except Exception as e:
                     logger.warning(f"Gemini API analysis failed: {e}")
@@ -145,21 +412,27 @@ class GeminiAgent(BaseAgent):
             success = rubric_result.passed
             error = None if success else '; '.join(rubric_result.errors)
 
+            data = {
+                'validation_result': validation_result,
+                'rubric_validation': {
+                    'passed': rubric_result.passed,
+                    'errors': rubric_result.errors,
+                    'warnings': rubric_result.warnings
+                },
+                'ai_analysis': ai_analysis,
+                'test_path': test_path,
+                'screenshots': validation_result.get('screenshots', []),
+                'artifacts_dir': str(artifacts_dir),
+                'gemini_enabled': self.gemini_enabled
+            }
+
+            # Only passes are cached; failures may be transient and must re-run
+            if success and use_cache:
+                self._store_cached_validation(cache_key, data)
+
             return AgentResult(
                 success=success,
-                data={
-                    'validation_result': validation_result,
-                    'rubric_validation': {
-                        'passed': rubric_result.passed,
-                        'errors': rubric_result.errors,
-                        'warnings': rubric_result.warnings
-                    },
-                    'ai_analysis': ai_analysis,
-                    'test_path': test_path,
-                    'screenshots': validation_result.get('screenshots', []),
-                    'artifacts_dir': str(artifacts_dir),
-                    'gemini_enabled': self.gemini_enabled
-                },
+                data=data,
                 error=error,
                 execution_time_ms=execution_time,
                 cost_usd=api_cost
@@ -180,6 +453,195 @@ class GeminiAgent(BaseAgent):
                 execution_time_ms=self._track_execution(start_time)
             )
 
+    def validate_only(
+        self,
+        test_path: str,
+        timeout: Optional[int] = None,
+        artifacts_dir: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """
+        Run Phase 1 (browser execution) and persist judge inputs.
+
+        Writes the screenshot list to judge_input.json in the artifacts
+        directory so rejudge() can analyze them later without a browser.
+
+        Args:
+            test_path: Path to Playwright test file
+            timeout: Optional timeout in seconds (default 60s)
+            artifacts_dir: Directory for artifacts (default artifacts/<test name>)
+
+        Returns:
+            Validation result dict matching VALIDATION_SCHEMA
+        """
+        timeout = timeout or self.default_timeout
+        artifacts_dir = Path(artifacts_dir or Path('artifacts') / Path(test_path).stem)
+        artifacts_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Phase 1: Executing test in browser: {test_path}")
+        validation_result = self._execute_test_in_browser(test_path, timeout, artifacts_dir)
+
+        judge_input = {
+            'test_path': test_path,
+            'screenshots': validation_result.get('screenshots', [])
+        }
+        (artifacts_dir / self.JUDGE_INPUT_FILE).write_text(json.dumps(judge_input, indent=2))
+
+        return validation_result
+
+    def rejudge(self, artifacts_dir: Path, model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run Phase 2 (Gemini screenshot analysis) on persisted judge inputs.
+
+        Analyses are cached by screenshot contents, prompt version and model,
+        so re-judging unchanged screenshots costs nothing, and switching model
+        or prompt only re-runs the API call, never the browser.
+
+        Args:
+            artifacts_dir: Artifacts directory written by validate_only()
+            model: Gemini model to judge with (default from config)
+
+        Returns:
+            Analysis result dict with confidence scores and findings
+        """
+        judge_input, model, cache_key = self._load_judge_request(artifacts_dir, model)
+        cached = self._get_cached_judgement(cache_key)
+        if cached is not None:
+            return cached
+
+        analysis = self._analyze_screenshots_with_gemini(
+            judge_input['screenshots'],
+            judge_input['test_path'],
+            model=model
+        )
+        self._store_judgement(cache_key, analysis)
+        return analysis
+
+    async def rejudge_async(self, artifacts_dir: Path, model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async version of rejudge using the Gemini SDK's native async client.
+
+        Args:
+            artifacts_dir: Artifacts directory written by validate_only()
+            model: Gemini model to judge with (default from config)
+
+        Returns:
+            Analysis result dict with confidence scores and findings
+        """
+        judge_input, model, cache_key = await asyncio.to_thread(
+            self._load_judge_request, artifacts_dir, model
+        )
+        cached = self._get_cached_judgement(cache_key)
+        if cached is not None:
+            return cached
+
+        analysis = await self._analyze_screenshots_with_gemini_async(
+            judge_input['screenshots'],
+            judge_input['test_path'],
+            model=model
+        )
+        self._store_judgement(cache_key, analysis)
+        return analysis
+
+    def _load_judge_request(
+        self,
+        artifacts_dir: Path,
+        model: Optional[str]
+    ) -> Tuple[Dict[str, Any], str, bytes]:
+        """
+        Load persisted judge inputs and compute their cache key.
+
+        Args:
+            artifacts_dir: Artifacts directory written by validate_only()
+            model: Gemini model to judge with (default from config)
+
+        Returns:
+            Tuple of (judge input, resolved model, cache key)
+        """
+        judge_input = json.loads((Path(artifacts_dir) / self.JUDGE_INPUT_FILE).read_text())
+        model = model or self.analysis_model
+        return judge_input, model, self._judge_cache_key(judge_input['screenshots'], model)
+
+    def _get_cached_judgement(self, cache_key: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached screenshot analysis.
+
+        Args:
+            cache_key: Key from _judge_cache_key
+
+        Returns:
+            Copy of the cached analysis marked free and cached, or None on miss
+        """
+        with self._cache_lock:
+            cached = self._judge_cache.pop(cache_key, None)
+            if cached is None:
+                return None
+
+            # Re-insert to mark as most recently used
+            self._judge_cache[cache_key] = cached
+
+        # Entries are never mutated once stored, so copy outside the lock
+        return {**copy.deepcopy(cached), 'cost_usd': 0.0, 'cached': True}
+
+    def _store_judgement(self, cache_key: bytes, analysis: Dict[str, Any]) -> None:
+        """
+        Cache a screenshot analysis, evicting the least recently used entry.
+
+        Errors are not cached so a later re-judge retries the API.
+
+        Args:
+            cache_key: Key from _judge_cache_key
+            analysis: Analysis result dict
+        """
+        if 'error' in analysis:
+            return
+
+        analysis = copy.deepcopy(analysis)
+        with self._cache_lock:
+            if cache_key not in self._judge_cache and len(self._judge_cache) >= self.JUDGE_CACHE_SIZE:
+                oldest_key = next(iter(self._judge_cache))
+                del self._judge_cache[oldest_key]
+            self._judge_cache[cache_key] = analysis
+
+    def _judge_cache_key(self, screenshot_paths: List[str], model: str) -> bytes:
+        """
+        Compute cache key for a screenshot analysis.
+
+        Args:
+            screenshot_paths: Screenshot file paths
+            model: Gemini model name
+
+        Returns:
+            Key digest
+        """
+        digest = hashlib.sha256()
+        for screenshot_path in screenshot_paths:
+            digest.update(self._file_digest(screenshot_path))
+        digest.update(f'{self.PROMPT_VERSION}:{model}'.encode())
+        return digest.digest()
+
+    @staticmethod
+    def _file_digest(path: str) -> bytes:
+        """
+        Hash a file without loading it into memory.
+
+        Uses hashlib.file_digest (zero-copy, Python 3.11+) when available,
+        otherwise streams the file in fixed-size chunks.
+
+        Args:
+            path: File path
+
+        Returns:
+            blake2b digest of the file contents
+        """
+        with open(path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'blake2b').digest()
+
+            digest = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+            return digest.digest()
+
     def _execute_test_in_browser(
         self,
         test_path: str,
@@ -203,18 +665,19 @@ class GeminiAgent(BaseAgent):
         screenshots = []
         console_errors = []
         network_failures = []
-        execution_start = time.time()
+        execution_start = time.perf_counter_ns()
 
         try:
-            # Get browser config from YAML
-            browser_config = self.config.get('contracts', {}).get('browser', {})
-            headless = browser_config.get('headless', True)
-
-            # Run Playwright test with JSON reporter
-            env = {
-                **subprocess.os.environ.copy(),
-                'PWTEST_SKIP_TEST_OUTPUT': '1'
-            }
+            headless = self._headless
+
+            # Run Playwright test with JSON reporter writing to a file; the
+            # overlay avoids copying the whole environment per run
+            report_path = Path(artifacts_dir).absolute() / self.REPORT_FILE
+            report_path.unlink(missing_ok=True)
+            env = collections.ChainMap(
+                {'PLAYWRIGHT_JSON_OUTPUT_NAME': str(report_path)},
+                self._playwright_env
+            )
 
             # Build Playwright command
             playwright_args = [
@@ -228,29 +691,36 @@ class GeminiAgent(BaseAgent):
             if not headless:
                 playwright_args.append('--headed')
 
-            result = subprocess.run(
-                playwright_args,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                env=env
-            )
+            pool = self._get_browser_pool(headless)
+            if pool is not None:
+                # Connect to a pre-warmed browser instead of launching one
+                with pool.acquire(timeout=timeout) as endpoint:
+                    result = subprocess.run(
+                        playwright_args,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        timeout=timeout,
+                        env=env.new_child({'PW_TEST_CONNECT_WS_ENDPOINT': endpoint})
+                    )
+            else:
+                result = subprocess.run(
+                    playwright_args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    timeout=timeout,
+                    env=env
+                )
 
             browser_launched = True
             test_executed = True
 
-            # Parse Playwright JSON output
+            # Parse Playwright JSON report
             try:
-                # Playwright outputs JSON to stdout when using --reporter=json
-                report_data = json.loads(result.stdout) if result.stdout else {}
+                report_data = self._load_report(report_path, result.stdout)
 
-                # Check test results
+                # Check test results, console errors and network failures
                 suites = report_data.get('suites', [])
-                test_passed = self._check_tests_passed(suites)
-
-                # Extract console errors and network failures from report
-                console_errors = self._extract_console_errors(suites)
-                network_failures = self._extract_network_failures(suites)
+                test_passed, console_errors, network_failures = self._parse_report(suites)
 
             except json.JSONDecodeError:
                 # Fallback: parse text output
@@ -259,18 +729,17 @@ class GeminiAgent(BaseAgent):
             # Collect screenshots from artifacts directory
             screenshots = self._collect_screenshots(artifacts_dir, test_path)
 
-            # Broadcast screenshot events for dashboard streaming
-            for i, screenshot_path in enumerate(screenshots):
-                self.event_emitter.emit('screenshot_captured', {
+            # Broadcast all screenshots to the dashboard in a single event
+            if screenshots:
+                emit_event('screenshots_captured_batch', {
                     'test_path': test_path,
-                    'screenshot_path': screenshot_path,
-                    'screenshot_number': i + 1,
+                    'screenshots': screenshots,
                     'total_screenshots': len(screenshots),
                     'timestamp': time.time()
                 })
 
             # Calculate execution time
-            execution_time_ms = int((time.time() - execution_start) * 1000)
+            execution_time_ms = (time.perf_counter_ns() - execution_start) // 1_000_000
 
             return {
                 'browser_launched': browser_launched,
@@ -284,7 +753,7 @@ class GeminiAgent(BaseAgent):
 
         except subprocess.TimeoutExpired:
             # Test exceeded timeout
-            execution_time_ms = int((time.time() - execution_start) * 1000)
+            execution_time_ms = (time.perf_counter_ns() - execution_start) // 1_000_000
             screenshots = self._collect_screenshots(artifacts_dir, test_path)
 
             return {
@@ -299,7 +768,7 @@ class GeminiAgent(BaseAgent):
 
         except Exception as e:
             # Browser launch or execution failed
-            execution_time_ms = int((time.time() - execution_start) * 1000)
+            execution_time_ms = (time.perf_counter_ns() - execution_start) // 1_000_000
 
             return {
                 'browser_launched': browser_launched,
@@ -311,55 +780,228 @@ class GeminiAgent(BaseAgent):
                 'execution_time_ms': execution_time_ms
             }
 
-    def _check_tests_passed(self, suites: List[Dict]) -> bool:
+    def _validation_cache_key(self, test_path: str, enable_ai_analysis: bool) -> bytes:
         """
-        Check if all tests passed in Playwright JSON report.
+        Compute content-addressed cache key for a validation run.
+
+        Covers the test file, Playwright config and version, browser
+        contract, the environment the tests read, and whether AI analysis
+        was requested.
 
         Args:
-            suites: Test suites from Playwright JSON report
+            test_path: Path to test file
+            enable_ai_analysis: Whether Gemini API analysis is enabled
 
         Returns:
-            True if all tests passed
+            Key digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(Path(test_path).read_bytes())
+
+        for dependency in self.CACHE_DEPENDENCIES:
+            try:
+                digest.update((_PROJECT_ROOT / dependency).read_bytes())
+            except OSError:
+                digest.update(b'\0')
+
+        for name in self.CACHE_ENV_VARS:
+            value = self._playwright_env.get(name)
+            digest.update(b'\0' if value is None else value.encode() + b'\1')
+
+        digest.update(self._browser_config_key)
+        digest.update(b'ai' if enable_ai_analysis else b'-')
+        return digest.digest()
+
+    def _get_cached_validation(self, cache_key: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached passing validation.
+
+        Entries older than the TTL, or whose screenshots no longer exist on
+        disk, are dropped, since the screenshots are the proof of correctness.
+
+        Args:
+            cache_key: Key from _validation_cache_key
+
+        Returns:
+            Copy of cached result data, or None on miss
+        """
+        with self._cache_lock:
+            entry = self._result_cache.pop(cache_key, None)
+        if entry is None:
+            return None
+
+        stored_at, cached = entry
+        if time.monotonic() - stored_at > self.result_cache_ttl:
+            return None
+
+        if not all(os.path.exists(path) for path in cached['screenshots']):
+            return None
+
+        # Re-insert to mark as most recently used
+        with self._cache_lock:
+            self._result_cache[cache_key] = entry
+        return copy.deepcopy(cached)
+
+    def _store_cached_validation(self, cache_key: bytes, data: Dict[str, Any]) -> None:
+        """
+        Store a passing validation, evicting the least recently used entry.
+
+        Args:
+            cache_key: Key from _validation_cache_key
+            data: Result data to cache
+        """
+        entry = (time.monotonic(), copy.deepcopy(data))
+        with self._cache_lock:
+            if cache_key not in self._result_cache and len(self._result_cache) >= self.RESULT_CACHE_SIZE:
+                oldest_key = next(iter(self._result_cache))
+                del self._result_cache[oldest_key]
+            self._result_cache[cache_key] = entry
+
+    @staticmethod
+    def _load_report(report_path: Path, stdout: Optional[bytes]) -> Dict[str, Any]:
+        """
+        Load the Playwright JSON report.
+
+        Reads the report file as raw bytes (no str decode), falling back to
+        stdout for Playwright setups that ignore PLAYWRIGHT_JSON_OUTPUT_NAME.
+
+        Args:
+            report_path: Report file path
+            stdout: Captured Playwright stdout (raw bytes)
+
+        Returns:
+            Parsed report dict
+
+        Raises:
+            json.JSONDecodeError: If the report is not valid JSON
+        """
+        try:
+            report_bytes = report_path.read_bytes()
+        except OSError:
+            report_bytes = b''
+
+        if report_bytes:
+            return _json_loads(report_bytes)
+        return _json_loads(stdout) if stdout else {}
+
+    def _get_browser_pool(self, headless: bool) -> Optional[BrowserPool]:
+        """
+        Get the shared browser pool, starting it on first use.
+
+        Falls back to per-test browser launch (returns None) when pooling is
+        disabled or the pool cannot be started.
+
+        Args:
+            headless: Launch pooled browsers in headless mode
+
+        Returns:
+            BrowserPool instance or None
+        """
+        if self.browser_pool_size <= 0:
+            return None
+
+        try:
+            return get_browser_pool(self.browser_pool_size, headless=headless)
+        except Exception as e:
+            logger.warning(f"Browser pool unavailable: {e} - launching browser per test")
+            self.browser_pool_size = 0
+            return None
+
+    def warmup(self) -> None:
+        """
+        Start the shared browser pool ahead of the first validation.
+
+        A no-op when browser pooling is disabled.
+        """
+        self._get_browser_pool(self._headless)
+
+    def close(self) -> None:
+        """
+        Shut down the agent's validation thread pool.
+
+        Queued validations are cancelled; running ones finish in the
+        background. The shared browser pool is left to its atexit hook.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # Markers of a network failure in a result error, matched in one scan
+    # ('net::'/'ERR_' case-sensitive, 'timeout' case-insensitive)
+    NETWORK_ERROR_RE = re.compile(r'net::|ERR_|(?i:timeout)')
+
+    @staticmethod
+    def _iter_results(suites: List[Dict]) -> Iterator[Dict]:
+        """
+        Yield every test result in a Playwright JSON report.
+
+        Args:
+            suites: Test suites from Playwright JSON report
+
+        Yields:
+            Result dicts (suites -> specs -> tests -> results)
         """
         for suite in suites:
             for spec in suite.get('specs', []):
                 for test in spec.get('tests', []):
-                    for result in test.get('results', []):
-                        status = result.get('status', 'failed')
-                        if status not in ['passed', 'skipped']:
-                            return False
-        return True
+                    yield from test.get('results', [])
 
-    def _extract_console_errors(self, suites: List[Dict]) -> List[str]:
+    def _parse_report(self, suites: List[Dict]) -> Tuple[bool, List[str], List[str]]:
         """
-        Extract console errors from test results.
+        Extract pass status, console errors and network failures in one pass.
 
         Args:
             suites: Test suites from Playwright JSON report
 
         Returns:
-            List of console error messages
+            Tuple of (all tests passed, console errors, network failures)
         """
-        errors = []
+        test_passed = True
+        console_errors = []
+        network_failures = []
+        is_network_error = self.NETWORK_ERROR_RE.search
 
-        for suite in suites:
-            for spec in suite.get('specs', []):
-                for test in spec.get('tests', []):
-                    for result in test.get('results', []):
-                        # Look for console errors in stdout/stderr
-                        stdout = result.get('stdout', [])
-                        stderr = result.get('stderr', [])
+        for result in self._iter_results(suites):
+            if test_passed and result.get('status', 'failed') not in ('passed', 'skipped'):
+                test_passed = False
 
-                        for log in stderr:
-                            if isinstance(log, dict):
-                                text = log.get('text', '')
-                            else:
-                                text = str(log)
+            for log in result.get('stderr', []):
+                text = log.get('text', '') if isinstance(log, dict) else str(log)
+                if text and 'error' in text.lower():
+                    console_errors.append(text[:200])  # Truncate long errors
 
-                            if text and 'error' in text.lower():
-                                errors.append(text[:200])  # Truncate long errors
+            error = result.get('error', {})
+            if error:
+                message = error.get('message', '')
+                if is_network_error(message):
+                    network_failures.append(message[:200])
 
-        return errors
+        return test_passed, console_errors, network_failures
+
+    def _check_tests_passed(self, suites: List[Dict]) -> bool:
+        """
+        Check if all tests passed in Playwright JSON report.
+
+        Args:
+            suites: Test suites from Playwright JSON report
+
+        Returns:
+            True if all tests passed
+        """
+        return all(
+            result.get('status', 'failed') in ('passed', 'skipped')
+            for result in self._iter_results(suites)
+        )
+
+    def _extract_console_errors(self, suites: List[Dict]) -> List[str]:
+        """
+        Extract console errors from test results.
+
+        Args:
+            suites: Test suites from Playwright JSON report
+
+        Returns:
+            List of console error messages
+        """
+        return self._parse_report(suites)[1]
 
     def _extract_network_failures(self, suites: List[Dict]) -> List[str]:
         """
@@ -371,19 +1013,7 @@ class GeminiAgent(BaseAgent):
         Returns:
             List of network failure messages
         """
-        failures = []
-
-        for suite in suites:
-            for spec in suite.get('specs', []):
-                for test in spec.get('tests', []):
-                    for result in test.get('results', []):
-                        error = result.get('error', {})
-                        if error:
-                            message = error.get('message', '')
-                            if 'net::' in message or 'ERR_' in message or 'timeout' in message.lower():
-                                failures.append(message[:200])
-
-        return failures
+        return self._parse_report(suites)[2]
 
     def _collect_screenshots(self, artifacts_dir: Path, test_path: str) -> List[str]:
         """
@@ -396,37 +1026,150 @@ class GeminiAgent(BaseAgent):
         Returns:
             List of absolute screenshot paths
         """
-        screenshots = []
+        # Absolute path -> mtime (dict also de-duplicates overlapping roots)
+        found = self._scan_artifact_screenshots(artifacts_dir)
+        found.update(self._scan_test_result_screenshots(test_path))
 
-        # Look in artifacts directory
-        if artifacts_dir.exists():
-            for screenshot_file in artifacts_dir.glob('**/*.png'):
-                screenshots.append(str(screenshot_file.absolute()))
+        # Sort by modification time (chronological order)
+        return sorted(found, key=found.__getitem__)
 
-        # Also check Playwright's default test-results directory
-        test_results_dir = Path('test-results')
-        if test_results_dir.exists():
-            test_name = Path(test_path).stem
-            for screenshot_file in test_results_dir.glob(f'**/*{test_name}*/*.png'):
-                screenshots.append(str(screenshot_file.absolute()))
+    def _scan_artifact_screenshots(self, artifacts_dir: Path) -> Dict[str, int]:
+        """
+        Find screenshots anywhere under the artifacts directory.
 
-        # Sort by modification time (chronological order)
-        screenshots.sort(key=lambda p: Path(p).stat().st_mtime)
+        Args:
+            artifacts_dir: Directory containing artifacts
+
+        Returns:
+            Mapping of absolute screenshot path -> mtime_ns
+        """
+        found: Dict[str, int] = {}
+        self._scan_screenshots(os.path.abspath(artifacts_dir), found, recursive=True)
+        return found
+
+    def _scan_test_result_screenshots(self, test_path: str) -> Dict[str, int]:
+        """
+        Find screenshots in Playwright's per-test output folders in test-results.
+
+        Args:
+            test_path: Test file path
+
+        Returns:
+            Mapping of absolute screenshot path -> mtime_ns
+        """
+        found: Dict[str, int] = {}
+        test_name = Path(test_path).stem
+        try:
+            with os.scandir(os.path.abspath('test-results')) as entries:
+                for entry in entries:
+                    if test_name in entry.name and entry.is_dir():
+                        self._scan_screenshots(entry.path, found, recursive=False)
+        except OSError:
+            pass
+        return found
+
+    @staticmethod
+    def _scan_screenshots(root: str, found: Dict[str, int], recursive: bool) -> None:
+        """
+        Record PNG files under a directory with their mtimes.
 
-        return screenshots
+        Uses os.scandir so each file costs one cached stat and no Path objects.
+
+        Args:
+            root: Absolute directory path to scan
+            found: Mapping of path -> mtime_ns to update
+            recursive: Descend into subdirectories
+        """
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if recursive:
+                            GeminiAgent._scan_screenshots(entry.path, found, recursive)
+                    elif entry.name.endswith('.png'):
+                        found[entry.path] = entry.stat().st_mtime_ns
+        except OSError:
+            pass
+
+    def _load_screenshot(self, screenshot_path: str) -> bytes:
+        """
+        Load a screenshot as PNG bytes, downscaled for upload.
+
+        Vision models gain nothing from more than ~1M pixels, so images larger
+        than MAX_SCREENSHOT_DIMENSION on either side are shrunk to fit. Without
+        Pillow the original bytes are returned.
+
+        Args:
+            screenshot_path: Screenshot file path
+
+        Returns:
+            PNG image bytes
+        """
+        image_data = Path(screenshot_path).read_bytes()
+
+        if not PIL_AVAILABLE:
+            return image_data
+
+        limit = self.MAX_SCREENSHOT_DIMENSION
+        with Image.open(io.BytesIO(image_data)) as image:
+            if max(image.size) <= limit:
+                return image_data
+
+            image.thumbnail((limit, limit), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG')
+            return buffer.getvalue()
+
+    def _try_load_screenshot(self, screenshot_path: str) -> Optional[bytes]:
+        """
+        Load a screenshot for upload, logging instead of raising on failure.
 
-    @limit_gemini(model='gemini-2.5-pro')
+        Args:
+            screenshot_path: Screenshot file path
+
+        Returns:
+            PNG image bytes, or None if the file could not be read
+        """
+        try:
+            return self._load_screenshot(screenshot_path)
+        except Exception as e:
+            logger.warning(f"Failed to read screenshot {screenshot_path}: {e}")
+            return None
+
+    def _estimate_api_cost(self, response: Any, model: str) -> float:
+        """
+        Calculate API cost from the token counts Gemini reports.
+
+        Args:
+            response: generate_content response
+            model: Gemini model used
+
+        Returns:
+            Cost in USD
+        """
+        usage = getattr(response, 'usage_metadata', None)
+        input_tokens = getattr(usage, 'prompt_token_count', None) or 0
+        output_tokens = getattr(usage, 'candidates_token_count', None) or 0
+
+        input_price, output_price = self.MODEL_PRICING.get(
+            model, self.MODEL_PRICING['gemini-2.5-pro']
+        )
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+    @limit_gemini()
     def _analyze_screenshots_with_gemini(
         self,
         screenshot_paths: List[str],
-        test_path: str
+        test_path: str,
+        model: str = DEFAULT_ANALYSIS_MODEL
     ) -> Dict[str, Any]:
         """
-        Analyze screenshots using Gemini 2.5 Pro API (rate limited).
+        Analyze screenshots using Gemini API (rate limited).
 
         Args:
             screenshot_paths: List of screenshot file paths
             test_path: Path to test file for context
+            model: Gemini model to analyze with
 
         Returns:
             Analysis result dict with confidence scores and findings
@@ -435,29 +1178,112 @@ class GeminiAgent(BaseAgent):
             return {'error': 'Gemini API client not initialized'}
 
         try:
-            # Read test file for context
-            test_content = Path(test_path).read_text()[:2000]  # First 2000 chars
+            request = self._build_analysis_request(screenshot_paths, test_path)
+            if request is None:
+                return {'error': 'No screenshots could be loaded'}
+            contents, config, screenshots_analyzed = request
 
-            # Prepare screenshots for API
-            screenshot_parts = []
-            for screenshot_path in screenshot_paths[:3]:  # Limit to first 3 screenshots
-                try:
-                    with open(screenshot_path, 'rb') as f:
-                        image_data = f.read()
-                        screenshot_parts.append(
-                            self.genai_types.Part.from_bytes(
-                                data=image_data,
-                                mime_type='image/png'
-                            )
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to read screenshot {screenshot_path}: {e}")
+            # Call Gemini API
+            response = self.gemini_client.models.generate_content(
+                model=model,
+                contents=contents,
+                config=config
+            )
+
+            return self._parse_analysis_response(response, model, screenshots_analyzed)
 
-            if not screenshot_parts:
+        except Exception as e:
+            logger.error(f"Gemini API analysis failed: {e}")
+            return {
+                'error': str(e),
+                'cost_usd': 0.0
+            }
+
+    async def _analyze_screenshots_with_gemini_async(
+        self,
+        screenshot_paths: List[str],
+        test_path: str,
+        model: str = DEFAULT_ANALYSIS_MODEL
+    ) -> Dict[str, Any]:
+        """
+        Async version of _analyze_screenshots_with_gemini (rate limited).
+
+        Awaits the SDK's async client so concurrent analyses share the event
+        loop and its HTTP connections instead of each holding a thread.
+
+        Args:
+            screenshot_paths: List of screenshot file paths
+            test_path: Path to test file for context
+            model: Gemini model to analyze with
+
+        Returns:
+            Analysis result dict with confidence scores and findings
+        """
+        if not self.gemini_client:
+            return {'error': 'Gemini API client not initialized'}
+
+        try:
+            if not await asyncio.to_thread(get_rate_limiter().wait_for_capacity, 'gemini'):
+                raise RateLimitExceeded("Rate limit exceeded for gemini", retry_after_seconds=60.0)
+
+            request = await asyncio.to_thread(self._build_analysis_request, screenshot_paths, test_path)
+            if request is None:
                 return {'error': 'No screenshots could be loaded'}
+            contents, config, screenshots_analyzed = request
+
+            # Call Gemini API
+            response = await self.gemini_client.aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=config
+            )
+
+            return self._parse_analysis_response(response, model, screenshots_analyzed)
+
+        except Exception as e:
+            logger.error(f"Gemini API analysis failed: {e}")
+            return {
+                'error': str(e),
+                'cost_usd': 0.0
+            }
+
+    def _build_analysis_request(
+        self,
+        screenshot_paths: List[str],
+        test_path: str
+    ) -> Optional[Tuple[List[Any], Any, int]]:
+        """
+        Build Gemini request contents for a screenshot analysis.
+
+        Args:
+            screenshot_paths: List of screenshot file paths
+            test_path: Path to test file for context
+
+        Returns:
+            Tuple of (contents, generation config, screenshots attached), or
+            None if no screenshot could be loaded
+        """
+        # Read test file for context
+        with open(test_path, 'rb') as f:
+            # Only the prefix is used, so avoid reading large files in full
+            test_content = f.read(2048).decode('utf-8', errors='replace')[:2000]
+
+        # Prepare screenshots for API, reading them in parallel
+        selected = screenshot_paths[:self.MAX_ANALYSIS_SCREENSHOTS]
+        with ThreadPoolExecutor(max_workers=max(len(selected), 1)) as pool:
+            images = list(pool.map(self._try_load_screenshot, selected))
+
+        screenshot_parts = [
+            self.genai_types.Part.from_bytes(data=image_data, mime_type='image/png')
+            for image_data in images
+            if image_data is not None
+        ]
 
-            # Build analysis prompt
-            prompt = f"""Analyze these Playwright test screenshots for UI correctness and visual regressions.
+        if not screenshot_parts:
+            return None
+
+        # Build analysis prompt
+        prompt = f"""Analyze these Playwright test screenshots for UI correctness and visual regressions.
 
 Test File Context:
 ```typescript
@@ -479,72 +1305,85 @@ Provide a JSON response with:
   "screenshot_analysis": ["analysis of each screenshot"]
 }}"""
 
-            # Create content for API
-            contents = [
-                self.genai_types.Content(
-                    role="user",
-                    parts=[self.genai_types.Part(text=prompt)] + screenshot_parts
-                )
-            ]
-
-            # Configure API call
-            config = self.genai_types.GenerateContentConfig(
-                temperature=0.1,  # Low temperature for deterministic output
-                max_output_tokens=2048
+        # Create content for API
+        contents = [
+            self.genai_types.Content(
+                role="user",
+                parts=[self.genai_types.Part(text=prompt)] + screenshot_parts
             )
+        ]
 
-            # Call Gemini API
-            response = self.gemini_client.models.generate_content(
-                model='gemini-2.5-pro',
-                contents=contents,
-                config=config
-            )
+        # Configure API call
+        config = self.genai_types.GenerateContentConfig(
+            temperature=0.1,  # Low temperature for deterministic output
+            max_output_tokens=2048
+        )
 
-            # Extract response text
-            response_text = response.text if hasattr(response, 'text') else str(response)
+        return contents, config, len(screenshot_parts)
 
-            # Parse JSON response
-            try:
-                # Try to extract JSON from response
-                import re
-                json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text)
-                if json_match:
-                    analysis_data = json.loads(json_match.group())
-                else:
-                    analysis_data = {
-                        'findings': response_text,
-                        'confidence_score': 70,
-                        'ui_correctness': 'unknown'
-                    }
-            except json.JSONDecodeError:
-                analysis_data = {
-                    'findings': response_text,
-                    'confidence_score': 70,
-                    'ui_correctness': 'unknown'
-                }
-
-            # Calculate cost
-            # Gemini 2.5 Pro: $1.25/1M input tokens, $10/1M output tokens
-            # Estimated: ~5000 input tokens (screenshots + prompt), ~500 output tokens
-            estimated_input_tokens = 5000
-            estimated_output_tokens = 500
-            cost_usd = (estimated_input_tokens * 1.25 / 1_000_000) + \
-                       (estimated_output_tokens * 10.00 / 1_000_000)
+    def _parse_analysis_response(
+        self,
+        response: Any,
+        model: str,
+        screenshots_analyzed: int
+    ) -> Dict[str, Any]:
+        """
+        Turn a Gemini response into an analysis result dict.
 
-            return {
-                **analysis_data,
-                'cost_usd': cost_usd,
-                'screenshots_analyzed': len(screenshot_parts),
-                'model': 'gemini-2.5-pro'
-            }
+        Args:
+            response: generate_content response
+            model: Gemini model used
+            screenshots_analyzed: Number of screenshots sent
 
-        except Exception as e:
-            logger.error(f"Gemini API analysis failed: {e}")
-            return {
-                'error': str(e),
-                'cost_usd': 0.0
+        Returns:
+            Analysis result dict with confidence scores and findings
+        """
+        # Extract response text
+        response_text = response.text if hasattr(response, 'text') else str(response)
+
+        # Parse JSON response
+        analysis_data = self._extract_json_object(response_text)
+        if analysis_data is None:
+            analysis_data = {
+                'findings': response_text,
+                'confidence_score': 70,
+                'ui_correctness': 'unknown'
             }
 
+        return {
+            **analysis_data,
+            # Calculate cost from reported token usage
+            'cost_usd': self._estimate_api_cost(response, model),
+            'screenshots_analyzed': screenshots_analyzed,
+            'model': model
+        }
+
+    # Stateless, so one decoder is shared by every extraction
+    _JSON_DECODER = json.JSONDecoder()
+
+    @classmethod
+    def _extract_json_object(cls, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the first JSON object embedded in free-form model output.
+
+        Decodes with JSONDecoder.raw_decode from each '{' in turn, which is a
+        linear scan per candidate and handles arbitrary nesting and braces
+        inside strings.
+
+        Args:
+            text: Model response text
+
+        Returns:
+            Decoded object, or None if no valid JSON object is found
+        """
+        start = text.find('{')
+        while start != -1:
+            try:
+                return cls._JSON_DECODER.raw_decode(text, start)[0]
+            except json.JSONDecodeError:
+                start = text.find('{', start + 1)
+        return None
+
     async def execute_async(self, test_path: str, timeout: Optional[int] = None, enable_ai_analysis: bool = False) -> AgentResult:
         """
         Async version of execute for concurrent validation.
@@ -557,6 +1396,53 @@ Provide a JSON response with:
         Returns:
             AgentResult with validation result
         """
-        # Run synchronous execute in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.execute, test_path, timeout, enable_ai_analysis)
+        loop = asyncio.get_running_loop()
+        analyze = enable_ai_analysis and self.gemini_enabled
+
+        # Browser phase runs on the agent's own bounded thread pool
+        result = await loop.run_in_executor(
+            self._executor, self.execute, test_path, timeout, enable_ai_analysis and not analyze
+        )
+        if not analyze or not result.data or not result.data.get('screenshots'):
+            return result
+
+        # Gemini analysis is awaited natively rather than holding a thread
+        logger.info("Phase 2: Analyzing screenshots with Gemini API")
+        try:
+            ai_analysis = await self.rejudge_async(result.data['artifacts_dir'])
+        except Exception as e:
+            logger.warning(f"Gemini API analysis failed: {e}")
+            ai_analysis = {'error': str(e), 'analysis_skipped': True}
+
+        api_cost = ai_analysis.get('cost_usd', 0.0)
+        result.data['ai_analysis'] = ai_analysis
+        result.cost_usd += api_cost
+        self.total_cost += api_cost
+        return result
+
+    async def execute_many_async(
+        self,
+        test_paths: List[str],
+        concurrency: Optional[int] = None,
+        timeout: Optional[int] = None,
+        enable_ai_analysis: bool = False
+    ) -> List[AgentResult]:
+        """
+        Validate multiple tests concurrently.
+
+        Args:
+            test_paths: Paths to test files
+            concurrency: Max validations in flight (default: browser pool size)
+            timeout: Optional timeout in seconds per test
+            enable_ai_analysis: Enable Gemini API screenshot analysis
+
+        Returns:
+            AgentResults in the same order as test_paths
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.validation_concurrency)
+
+        async def validate(test_path: str) -> AgentResult:
+            async with semaphore:
+                return await self.execute_async(test_path, timeout, enable_ai_analysis)
+
+        return list(await asyncio.gather(*(validate(test_path) for test_path in test_paths)))
@@ -2,22 +2,141 @@
 Kaya - Router/Orchestrator Agent
 Coordinates all other agents, routes tasks, and manages session flow.
 """
+import collections
+import itertools
+import json
+import os
 import re
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 import time
 import logging
 
 from agent_system.agents.base_agent import BaseAgent, AgentResult
-from agent_system.router import Router
+from agent_system.router import Router, RoutingDecision
 from agent_system.lifecycle import get_lifecycle
 from agent_system.metrics_aggregator import get_metrics_aggregator
-from agent_system.coverage_analyzer import CoverageAnalyzer
 from agent_system.observability.event_stream import emit_event
 from agent_system.archon_client import get_archon_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Optional: orjson for faster --json CLI output
+try:
+    import orjson
+
+    def _dumps_cli_json(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    def _dumps_cli_json(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+# Optional RE2 engine (google-re2): linear-time intent matching on long
+# commands. Falls back to the stdlib re module when not installed.
+try:
+    import re2 as _re2
+    RE2_AVAILABLE = True
+except ImportError:
+    _re2 = None
+    RE2_AVAILABLE = False
+
+# Logging is configured by the application entrypoint, not on import
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# slots=True (Python 3.10+) drops the per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Punctuation stripped from feature names when building test file names
+_FEATURE_CLEAN_TABLE = str.maketrans('', '', ',.!?;:"\'()')
+
+
+def _compile_intent_pattern_list(
+    intent_patterns: Dict[str, List[str]], engine: Any
+) -> Tuple[Tuple[Any, str, bool], ...]:
+    """
+    Compile intent patterns one by one, keeping declaration order.
+
+    Args:
+        intent_patterns: Intent name -> list of regex patterns
+        engine: Regex module providing compile() (re, or re2)
+
+    Returns:
+        Ordered tuple of (compiled pattern, intent, has slot group)
+    """
+    compiled = []
+    for intent_type, patterns in intent_patterns.items():
+        for pattern in patterns:
+            # Inline flag: supported by every RE2 binding's compile()
+            regex = engine.compile(f'(?i){pattern}')
+            compiled.append((regex, intent_type, regex.groups > 0))
+    return tuple(compiled)
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class TaskRecord:
+    """One executed command, as kept in KayaAgent.task_history."""
+    command: str
+    intent: Optional[str]
+    success: bool
+    cost: float
+    timestamp: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'command': self.command,
+            'intent': self.intent,
+            'success': self.success,
+            'cost': self.cost,
+            'timestamp': self.timestamp
+        }
+
+
+@lru_cache(maxsize=1)
+def _default_project_dir() -> Optional[str]:
+    """
+    Cloppy_Ai project directory if it exists, checked once per process.
+
+    Returns:
+        Project directory path or None
+    """
+    cloppy_path = '/Users/rutledge/Documents/DevFolder/Cloppy_Ai'
+    return cloppy_path if os.path.exists(cloppy_path) else None
+
+
+@lru_cache(maxsize=None)
+def _get_agent_cached(agent_name: str):
+    """
+    Lazy load agent by name, once per process.
+
+    Imports are deferred to avoid circular imports, and every KayaAgent shares
+    the same agent instances (and their API clients).
+
+    Args:
+        agent_name: Name of agent to load
+
+    Returns:
+        Agent instance
+    """
+    if agent_name == 'scribe':
+        from agent_system.agents.scribe_full import ScribeAgent
+        return ScribeAgent()
+    elif agent_name == 'runner':
+        from agent_system.agents.runner import RunnerAgent
+        return RunnerAgent()
+    elif agent_name == 'critic':
+        from agent_system.agents.critic import CriticAgent
+        return CriticAgent()
+    elif agent_name == 'medic':
+        from agent_system.agents.medic import MedicAgent
+        return MedicAgent()
+    elif agent_name == 'gemini':
+        from agent_system.agents.gemini import GeminiAgent
+        return GeminiAgent()
+    else:
+        raise ValueError(f"Unknown agent: {agent_name}")
 
 
 class KayaAgent(BaseAgent):
@@ -101,15 +220,84 @@ class KayaAgent(BaseAgent):
         ],
     }
 
-    def __init__(self):
-        """Initialize Kaya orchestrator."""
+    # All intent patterns compiled once, searched in declaration order
+    _INTENT_PATTERN_LIST = _compile_intent_pattern_list(INTENT_PATTERNS, re)
+
+    # With RE2 installed, the same patterns searched in linear time
+    _INTENT_RE2_PATTERNS = (
+        _compile_intent_pattern_list(INTENT_PATTERNS, _re2) if RE2_AVAILABLE else None
+    )
+
+    # RE2 costs more per search and only pays off once backtracking grows
+    # (at 512 chars ~0.16 ms vs 3.4 ms); shorter commands use stdlib patterns
+    RE2_MIN_COMMAND_LENGTH = 128
+
+    # Every intent pattern contains at least one of these words, so a command
+    # with none of them cannot match and skips the full intent regex
+    INTENT_TRIGGER_WORDS = (
+        'build', 'create', 'implement', 'add', 'write', 'generate', 'run',
+        'execute', 'fix', 'patch', 'repair', 'iterate', 'test', 'validate',
+        'verify', 'status', 'coverage', 'full', 'complete', 'read', 'mission',
+        'start', 'use', 'switch', 'set', 'clear', 'reset',
+    )
+    _INTENT_TRIGGER_REGEX = re.compile('|'.join(INTENT_TRIGGER_WORDS), re.IGNORECASE)
+
+    # Max distinct commands kept in the parsed-intent LFU cache
+    INTENT_CACHE_SIZE = 512
+
+    # Pipeline status message per final stage ({chain} = agents run, in order)
+    PIPELINE_MESSAGES = {
+        'completed': "Pipeline completed successfully: {chain}",
+        'scribe_failed': "Pipeline failed at Scribe (test writing)",
+        'critic_rejected': "Pipeline stopped: Critic rejected test quality",
+        'execution_failed': "Pipeline failed: Test execution failed after {medic_attempts} Medic attempts",
+        'pipeline_error': "Pipeline encountered unexpected error",
+    }
+
+    # Most recent tasks kept in task_history (session stats cover all tasks)
+    TASK_HISTORY_SIZE = 1024
+
+    # Sub-agents loaded by preload_agents()
+    AGENT_NAMES = ('scribe', 'runner', 'critic', 'medic', 'gemini')
+
+    def __init__(self, history_window: Optional[int] = None):
+        """
+        Initialize Kaya orchestrator.
+
+        Args:
+            history_window: Number of recent tasks kept in task_history
+                (default TASK_HISTORY_SIZE)
+        """
         super().__init__('kaya')
         self.router = Router()
         self.archon = get_archon_client()
         self.session_cost = 0.0
-        self.task_history = []
+        self.task_history = collections.deque(
+            maxlen=self.TASK_HISTORY_SIZE if history_window is None else history_window
+        )
+
+        # Session totals, kept current by _record_task (the only writer of
+        # task_history) so stats never rescan the history.
+        # Per-intent rows are [total, success, cost].
+        self._intent_stats: Dict[str, List[Any]] = collections.defaultdict(lambda: [0, 0, 0.0])
+        self._total_tasks = 0
+        self._successful_tasks = 0
+        self._success_rate = 0.0
+
+        # get_session_stats result, rebuilt when a task is recorded or the
+        # session cost changes: (_stats_version, session_cost) it was built for
+        self._stats_version = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_key: Optional[Tuple[int, float]] = None
         self.current_project_id = None  # Track active project
 
+        # Parsed intents of repeated commands: command -> [result, hit count].
+        # Commands are also bucketed by hit count (oldest first) so the least
+        # frequently used one is found without scanning the cache
+        self._intent_cache: Dict[str, List[Any]] = {}
+        self._intent_freq: Dict[int, collections.OrderedDict] = {}
+        self._intent_min_freq = 0
+
         # Model override settings
         self.model_override = None  # None, or model name like 'opus', 'sonnet', 'haiku'
         self.model_override_scope = 'all'  # 'all' or specific agent name
@@ -117,16 +305,34 @@ class KayaAgent(BaseAgent):
         # Metrics aggregator for performance tracking
         self.metrics = get_metrics_aggregator()
 
-        # Lazy load agents to avoid circular imports
-        self._scribe = None
-        self._runner = None
-        self._critic = None
-        self._medic = None
-        self._gemini = None
+        # Process-wide lifecycle (shutdown state, active task tracking)
+        self._lifecycle = get_lifecycle()
+
+        # Background work that overlaps pipeline stages (e.g. Gemini warmup)
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='kaya')
+
+        # Agent name -> in-flight or finished background load (preload_agents)
+        self._agent_preloads: Dict[str, Future] = {}
+
+        # Intent type -> workflow handler
+        self._handlers = {
+            'create_test': self._handle_create_test,
+            'run_test': self._handle_run_test,
+            'fix_failure': self._handle_fix_failure,
+            'validate': self._handle_validate,
+            'status': self._handle_status,
+            'check_coverage': self._handle_check_coverage,
+            'full_pipeline': self._handle_full_pipeline,
+            'read_and_plan': self._handle_read_and_plan,
+            'iterative_fix': self._handle_iterative_fix,
+            'orchestrate_mission': self._handle_orchestrate_mission,
+            'set_model': self._handle_set_model,
+            'build_feature': self._handle_build_feature,
+        }
 
     def _get_agent(self, agent_name: str):
         """
-        Lazy load agent by name to avoid circular imports.
+        Get a shared agent instance by name.
 
         Args:
             agent_name: Name of agent to load
@@ -134,33 +340,31 @@ class KayaAgent(BaseAgent):
         Returns:
             Agent instance
         """
-        if agent_name == 'scribe':
-            if self._scribe is None:
-                from agent_system.agents.scribe_full import ScribeAgent
-                self._scribe = ScribeAgent()
-            return self._scribe
-        elif agent_name == 'runner':
-            if self._runner is None:
-                from agent_system.agents.runner import RunnerAgent
-                self._runner = RunnerAgent()
-            return self._runner
-        elif agent_name == 'critic':
-            if self._critic is None:
-                from agent_system.agents.critic import CriticAgent
-                self._critic = CriticAgent()
-            return self._critic
-        elif agent_name == 'medic':
-            if self._medic is None:
-                from agent_system.agents.medic import MedicAgent
-                self._medic = MedicAgent()
-            return self._medic
-        elif agent_name == 'gemini':
-            if self._gemini is None:
-                from agent_system.agents.gemini import GeminiAgent
-                self._gemini = GeminiAgent()
-            return self._gemini
-        else:
-            raise ValueError(f"Unknown agent: {agent_name}")
+        preload = self._agent_preloads.get(agent_name)
+        if preload is not None:
+            # Waits only if this agent is still loading in the background
+            return preload.result()
+        return _get_agent_cached(agent_name)
+
+    def preload_agents(self) -> None:
+        """
+        Import and construct all sub-agents in the background.
+
+        Lets an interactive session pay agent import/init cost while the user
+        is typing; _get_agent waits on a load only if it has not finished yet.
+        """
+        for agent_name in self.AGENT_NAMES:
+            if agent_name not in self._agent_preloads:
+                self._agent_preloads[agent_name] = self._pool.submit(_get_agent_cached, agent_name)
+
+    def close(self) -> None:
+        """
+        Shut down the background thread pool.
+
+        Queued work is cancelled; running tasks finish in the background.
+        Sub-agents are shared across KayaAgent instances and are left open.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     def execute(self, command: str, context: Optional[Dict[str, Any]] = None) -> AgentResult:
         """
@@ -173,8 +377,8 @@ class KayaAgent(BaseAgent):
         Returns:
             AgentResult with orchestration outcome
         """
-        start_time = time.time()
-        lifecycle = get_lifecycle()
+        start_time = time.perf_counter_ns()
+        lifecycle = self._lifecycle
 
         # Check if shutting down
         if lifecycle.is_shutting_down():
@@ -188,7 +392,7 @@ class KayaAgent(BaseAgent):
             # Check budget before starting
             budget_status = self.check_budget()
             if budget_status['status'] == 'exceeded':
-                logger.error(f"Budget exceeded: {budget_status['warning']}")
+                logger.error("Budget exceeded: %s", budget_status['warning'])
                 return AgentResult(
                     success=False,
                     error=budget_status['warning'],
@@ -212,33 +416,12 @@ class KayaAgent(BaseAgent):
             intent_type = intent_result['intent']
             slots = intent_result['slots']
 
-            logger.info(f"Parsed intent: {intent_type} with slots: {slots}")
+            logger.info("Parsed intent: %s with slots: %s", intent_type, slots)
 
             # 2. Route to appropriate workflow
-            if intent_type == 'create_test':
-                result = self._handle_create_test(slots, context)
-            elif intent_type == 'run_test':
-                result = self._handle_run_test(slots, context)
-            elif intent_type == 'fix_failure':
-                result = self._handle_fix_failure(slots, context)
-            elif intent_type == 'validate':
-                result = self._handle_validate(slots, context)
-            elif intent_type == 'status':
-                result = self._handle_status(slots, context)
-            elif intent_type == 'check_coverage':
-                result = self._handle_check_coverage(slots, context)
-            elif intent_type == 'full_pipeline':
-                result = self._handle_full_pipeline(slots, context)
-            elif intent_type == 'read_and_plan':
-                result = self._handle_read_and_plan(slots, context)
-            elif intent_type == 'iterative_fix':
-                result = self._handle_iterative_fix(slots, context)
-            elif intent_type == 'orchestrate_mission':
-                result = self._handle_orchestrate_mission(slots, context)
-            elif intent_type == 'set_model':
-                result = self._handle_set_model(slots, context)
-            elif intent_type == 'build_feature':
-                result = self._handle_build_feature(slots, context)
+            handler = self._handlers.get(intent_type)
+            if handler is not None:
+                result = handler(slots, context)
             else:
                 result = AgentResult(
                     success=False,
@@ -253,18 +436,18 @@ class KayaAgent(BaseAgent):
             result.execution_time_ms = execution_time
 
             # Add to task history
-            self.task_history.append({
-                'command': command,
-                'intent': intent_type,
-                'success': result.success,
-                'cost': result.cost_usd,
-                'timestamp': time.time()
-            })
+            self._record_task(TaskRecord(
+                command=command,
+                intent=intent_type,
+                success=result.success,
+                cost=result.cost_usd,
+                timestamp=time.time()
+            ))
 
             return result
 
         except Exception as e:
-            logger.exception(f"Orchestration error: {e}")
+            logger.exception("Orchestration error: %s", e)
             return AgentResult(
                 success=False,
                 error=f"Orchestration error: {str(e)}",
@@ -281,22 +464,70 @@ class KayaAgent(BaseAgent):
         Returns:
             Dict with success, intent, slots
         """
-        command_lower = command.lower().strip()
-        command_orig = command.strip()
-
-        for intent_type, patterns in self.INTENT_PATTERNS.items():
-            for pattern in patterns:
-                match = re.search(pattern, command_lower)
-                if match:
-                    # Extract slots from regex groups
-                    # Re-match on original command to preserve case for file paths
-                    match_orig = re.search(pattern, command_orig, re.IGNORECASE)
-                    slots = {'raw_value': match_orig.group(1) if match_orig and match_orig.groups() else ''}
-                    return {
-                        'success': True,
-                        'intent': intent_type,
-                        'slots': slots
-                    }
+        command = command.strip()
+
+        # Repeated commands (e.g. status polling) skip regex matching; LFU
+        # eviction keeps the most frequently sent commands resident
+        entry = self._intent_cache.get(command)
+        if entry is not None:
+            result, count = entry
+            bucket = self._intent_freq[count]
+            del bucket[command]
+            if not bucket:
+                del self._intent_freq[count]
+                if self._intent_min_freq == count:
+                    self._intent_min_freq = count + 1
+            entry[1] = count + 1
+            self._intent_freq.setdefault(count + 1, collections.OrderedDict())[command] = None
+        else:
+            result = self._match_intent(command)
+            if len(self._intent_cache) >= self.INTENT_CACHE_SIZE:
+                # Least frequently used; ties go to the oldest entry
+                bucket = self._intent_freq[self._intent_min_freq]
+                coldest, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del self._intent_freq[self._intent_min_freq]
+                del self._intent_cache[coldest]
+            self._intent_cache[command] = [result, 1]
+            self._intent_freq.setdefault(1, collections.OrderedDict())[command] = None
+            self._intent_min_freq = 1
+
+        # Callers get their own slots dict so the cached entry stays intact
+        return {**result, 'slots': dict(result['slots'])}
+
+    def _match_intent(self, command: str) -> Dict[str, Any]:
+        """
+        Match a stripped command against the compiled intent patterns.
+
+        Args:
+            command: Stripped user command text
+
+        Returns:
+            Dict with success, intent, slots
+        """
+        # Unknown commands are rejected by a cheap literal scan
+        if not self._INTENT_TRIGGER_REGEX.search(command):
+            return {
+                'success': False,
+                'intent': None,
+                'slots': {}
+            }
+
+        patterns = self._INTENT_PATTERN_LIST
+        if (self._INTENT_RE2_PATTERNS is not None
+                and len(command) >= self.RE2_MIN_COMMAND_LENGTH):
+            patterns = self._INTENT_RE2_PATTERNS
+
+        # Case-insensitive search on the original command preserves case in
+        # slots (e.g. file paths) without a second, case-sensitive pass
+        for regex, intent_type, has_slot in patterns:
+            match = regex.search(command)
+            if match:
+                return {
+                    'success': True,
+                    'intent': intent_type,
+                    'slots': {'raw_value': match.group(1) if has_slot else ''}
+                }
 
         return {
             'success': False,
@@ -324,15 +555,15 @@ class KayaAgent(BaseAgent):
             task_scope=''
         )
 
-        logger.info(f"Routing to {routing_decision.agent} with {routing_decision.model} (complexity: {routing_decision.difficulty})")
+        logger.info("Routing to %s with %s (complexity: %s)", routing_decision.agent, routing_decision.model, routing_decision.difficulty)
 
         # Dispatch to Scribe
         try:
             scribe = self._get_agent('scribe')
 
             # Extract feature name for test file
-            feature_name = feature.split()[:3]  # First 3 words
-            feature_name = '_'.join(feature_name).lower().replace(',', '')
+            # First 3 words; maxsplit leaves the rest of a long description unsplit
+            feature_name = '_'.join(feature.split(None, 3)[:3]).lower().translate(_FEATURE_CLEAN_TABLE)
 
             # Generate output path
             output_path = f"tests/{feature_name}.spec.ts"
@@ -390,18 +621,13 @@ class KayaAgent(BaseAgent):
                 error=scribe_result.error,
                 cost_usd=scribe_result.cost_usd,
                 metadata={
-                    'routing_decision': routing_decision.__dict__,
+                    'routing_decision': routing_decision,
                     'scribe_metadata': scribe_result.metadata
                 }
             )
 
         except Exception as e:
-            logger.exception(f"Failed to dispatch to Scribe: {e}")
-            return AgentResult(
-                success=False,
-                error=f"Failed to create test: {str(e)}",
-                metadata={'routing_decision': routing_decision.__dict__}
-            )
+            return self._dispatch_error('Scribe', 'create test', e, routing_decision)
 
     def _handle_run_test(self, slots: Dict[str, Any], context: Optional[Dict]) -> AgentResult:
         """
@@ -416,13 +642,13 @@ class KayaAgent(BaseAgent):
         """
         test_path = slots.get('raw_value', '')
 
-        # Route to Runner agent
+        # Route to Runner agent (repeat routes are memoized by the router)
         routing_decision = self.router.route(
             task_type='execute_test',
             task_description=test_path
         )
 
-        logger.info(f"Routing to {routing_decision.agent} with {routing_decision.model}")
+        logger.info("Routing to %s with %s", routing_decision.agent, routing_decision.model)
 
         # Dispatch to Runner
         try:
@@ -453,18 +679,13 @@ class KayaAgent(BaseAgent):
                 error=runner_result.error,
                 cost_usd=runner_result.cost_usd,
                 metadata={
-                    'routing_decision': routing_decision.__dict__,
+                    'routing_decision': routing_decision,
                     'runner_metadata': runner_result.metadata
                 }
             )
 
         except Exception as e:
-            logger.exception(f"Failed to dispatch to Runner: {e}")
-            return AgentResult(
-                success=False,
-                error=f"Failed to execute test: {str(e)}",
-                metadata={'routing_decision': routing_decision.__dict__}
-            )
+            return self._dispatch_error('Runner', 'execute test', e, routing_decision)
 
     def _handle_fix_failure(self, slots: Dict[str, Any], context: Optional[Dict]) -> AgentResult:
         """
@@ -489,7 +710,7 @@ class KayaAgent(BaseAgent):
             task_description=f"Fix failed task {task_id}"
         )
 
-        logger.info(f"Routing to {routing_decision.agent} with {routing_decision.model}")
+        logger.info("Routing to %s with %s", routing_decision.agent, routing_decision.model)
 
         # Dispatch to Medic
         try:
@@ -526,18 +747,13 @@ class KayaAgent(BaseAgent):
                 error=medic_result.error,
                 cost_usd=medic_result.cost_usd,
                 metadata={
-                    'routing_decision': routing_decision.__dict__,
+                    'routing_decision': routing_decision,
                     'medic_metadata': medic_result.metadata
                 }
             )
 
         except Exception as e:
-            logger.exception(f"Failed to dispatch to Medic: {e}")
-            return AgentResult(
-                success=False,
-                error=f"Failed to fix bug: {str(e)}",
-                metadata={'routing_decision': routing_decision.__dict__}
-            )
+            return self._dispatch_error('Medic', 'fix bug', e, routing_decision)
 
     def _handle_validate(self, slots: Dict[str, Any], context: Optional[Dict]) -> AgentResult:
         """
@@ -559,7 +775,7 @@ class KayaAgent(BaseAgent):
             test_path=test_path
         )
 
-        logger.info(f"Routing to {routing_decision.agent} with {routing_decision.model}")
+        logger.info("Routing to %s with %s", routing_decision.agent, routing_decision.model)
 
         # Dispatch to Gemini
         try:
@@ -581,18 +797,45 @@ class KayaAgent(BaseAgent):
                 error=gemini_result.error,
                 cost_usd=gemini_result.cost_usd,
                 metadata={
-                    'routing_decision': routing_decision.__dict__,
+                    'routing_decision': routing_decision,
                     'gemini_metadata': gemini_result.metadata
                 }
             )
 
         except Exception as e:
-            logger.exception(f"Failed to dispatch to Gemini: {e}")
-            return AgentResult(
-                success=False,
-                error=f"Failed to validate test: {str(e)}",
-                metadata={'routing_decision': routing_decision.__dict__}
-            )
+            return self._dispatch_error('Gemini', 'validate test', e, routing_decision)
+
+    def _dispatch_error(
+        self,
+        agent_name: str,
+        action: str,
+        exc: Exception,
+        routing_decision: RoutingDecision
+    ) -> AgentResult:
+        """
+        Log a failed agent dispatch and build its error result.
+
+        Retry loops can hit the same failure many times, so the traceback is
+        only formatted when DEBUG logging is enabled.
+
+        Args:
+            agent_name: Agent that failed (for the log message)
+            action: What the handler was doing, e.g. 'create test'
+            exc: Exception raised by the dispatch
+            routing_decision: Routing decision for the failed dispatch
+
+        Returns:
+            Failed AgentResult carrying the routing decision
+        """
+        logger.error(
+            "Failed to dispatch to %s: %s", agent_name, exc,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+        return AgentResult(
+            success=False,
+            error=f"Failed to {action}: {exc}",
+            metadata={'routing_decision': routing_decision}
+        )
 
     def _handle_status(self, slots: Dict[str, Any], context: Optional[Dict]) -> AgentResult:
         """
@@ -611,8 +854,12 @@ class KayaAgent(BaseAgent):
         budget_status = self.check_budget()
 
         # Get session stats
-        total_tasks = len(self.task_history)
-        successful_tasks = sum(1 for t in self.task_history if t['success'])
+        total_tasks = self._total_tasks
+        successful_tasks = self._successful_tasks
+        # Read the last 5 tasks from the right end; islice from an offset
+        # would walk the deque from the left
+        recent_tasks = [task.to_dict() for task in itertools.islice(reversed(self.task_history), 5)]
+        recent_tasks.reverse()
 
         return AgentResult(
             success=True,
@@ -623,7 +870,7 @@ class KayaAgent(BaseAgent):
                 'total_tasks': total_tasks,
                 'successful_tasks': successful_tasks,
                 'budget_status': budget_status,
-                'task_history': self.task_history[-5:],  # Last 5 tasks
+                'task_history': recent_tasks,  # Last 5 tasks
                 'message': f"Session cost: ${self.session_cost:.2f} | Tasks: {successful_tasks}/{total_tasks} successful"
             }
         )
@@ -639,22 +886,20 @@ class KayaAgent(BaseAgent):
         Returns:
             AgentResult with coverage analysis
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         file_path = slots.get('raw_value', '').strip() if slots.get('raw_value') else None
 
-        logger.info(f"Analyzing coverage{f' for {file_path}' if file_path else ''}")
+        logger.info("Analyzing coverage%s", f' for {file_path}' if file_path else '')
 
         try:
             # Initialize coverage analyzer
             # Default to Cloppy_Ai project directory if available
             project_dir = context.get('project_dir') if context else None
             if not project_dir:
-                # Check if Cloppy_Ai project exists
-                cloppy_path = '/Users/rutledge/Documents/DevFolder/Cloppy_Ai'
-                import os
-                if os.path.exists(cloppy_path):
-                    project_dir = cloppy_path
+                project_dir = _default_project_dir()
 
+            # Only the coverage intent needs the analyzer; keep it off the import path
+            from agent_system.coverage_analyzer import CoverageAnalyzer
             analyzer = CoverageAnalyzer(project_dir)
 
             # Analyze specific file or overall project
@@ -697,7 +942,7 @@ class KayaAgent(BaseAgent):
             )
 
         except Exception as e:
-            logger.exception(f"Coverage analysis error: {e}")
+            logger.exception("Coverage analysis error: %s", e)
             return AgentResult(
                 success=False,
                 error=f"Coverage analysis error: {str(e)}",
@@ -727,22 +972,29 @@ class KayaAgent(BaseAgent):
         Returns:
             AgentResult with complete pipeline outcome
         """
+        pipeline_start = time.perf_counter_ns()
         feature = slots.get('raw_value', '')
         pipeline_results = []
+        # Metrics are queued here and recorded in one batch when the pipeline ends
+        pipeline_events = []
         total_cost = 0.0
-        lifecycle = get_lifecycle()
+        lifecycle = self._lifecycle
+        # Re-checked at every step (shutdown can start mid-pipeline), so bind
+        # the method once rather than caching its result
+        is_shutting_down = lifecycle.is_shutting_down
+        # Background steps, cancelled if the pipeline returns before using them
+        background: List[Future] = []
 
         # Generate task ID and track it
         task_id = f"pipeline_{int(time.time())}"
         lifecycle.add_active_task(task_id, agent='kaya', feature=feature)
 
-        logger.info(f"Starting full pipeline for: {feature}")
+        logger.info("Starting full pipeline for: %s", feature)
 
         try:
 
             # Check for shutdown before each step
-            if lifecycle.is_shutting_down():
-                lifecycle.remove_active_task(task_id)
+            if is_shutting_down():
                 return self._aggregate_pipeline_results(
                     'shutdown_interrupted',
                     pipeline_results,
@@ -765,7 +1017,15 @@ class KayaAgent(BaseAgent):
                 )
 
             test_path = scribe_result.data['test_path']
-            logger.info(f"Test written: {test_path}")
+            logger.info("Test written: %s", test_path)
+
+            # Gemini's browser warmup is independent of Critic and Runner,
+            # so start it now and only wait for it before Step 5
+            gemini_warmup = self._pool.submit(self._warmup_gemini)
+            # Runner routing and agent loading only need the test path, so
+            # they overlap with Critic; Step 3 waits for them
+            runner_prep = self._pool.submit(self._prepare_runner, test_path)
+            background += (gemini_warmup, runner_prep)
 
             # Step 2: Critic pre-validates
             logger.info("Step 2: Critic pre-validates")
@@ -778,21 +1038,25 @@ class KayaAgent(BaseAgent):
                 # Record critic decision metrics
                 decision = 'rejected' if not critic_result.success else 'approved'
                 reason = critic_result.error if not critic_result.success else None
-                self.metrics.record_critic_decision(test_path, decision, reason)
+                pipeline_events.append(('critic_decision', {
+                    'test_id': test_path,
+                    'decision': decision,
+                    'reason': reason
+                }))
 
                 # Record critic agent activity
                 if critic_result.execution_time_ms > 0:
-                    self.metrics.record_agent_activity(
-                        agent='critic',
-                        duration_ms=critic_result.execution_time_ms,
-                        cost_usd=critic_result.cost_usd,
-                        model='haiku'  # Critic always uses Haiku
-                    )
+                    pipeline_events.append(('agent_activity', {
+                        'agent': 'critic',
+                        'duration_ms': critic_result.execution_time_ms,
+                        'cost_usd': critic_result.cost_usd,
+                        'model': 'haiku'  # Critic always uses Haiku
+                    }))
 
                 if not critic_result.success:
                     # Get fallback action from router
                     fallback = self.router.get_fallback('critic_fail')
-                    logger.warning(f"Critic rejected test, fallback: {fallback}")
+                    logger.warning("Critic rejected test, fallback: %s", fallback)
 
                     return self._aggregate_pipeline_results(
                         'critic_rejected',
@@ -804,10 +1068,11 @@ class KayaAgent(BaseAgent):
                 logger.info("Critic approved test")
 
             except Exception as e:
-                logger.warning(f"Critic failed: {e}, continuing anyway")
+                logger.warning("Critic failed: %s, continuing anyway", e)
 
             # Step 3: Runner executes test
             logger.info("Step 3: Runner executes test")
+            runner_prep.result()
             runner_slots = {'raw_value': test_path}
             runner_result = self._handle_run_test(runner_slots, context)
             pipeline_results.append(('runner', runner_result))
@@ -817,8 +1082,8 @@ class KayaAgent(BaseAgent):
             max_retries = self.router.get_max_retries()
             retry_count = 0
 
-            while not runner_result.success and retry_count < max_retries and not lifecycle.is_shutting_down():
-                logger.info(f"Step 4: Test failed, dispatching Medic (retry {retry_count + 1}/{max_retries})")
+            while not runner_result.success and retry_count < max_retries and not is_shutting_down():
+                logger.info("Step 4: Test failed, dispatching Medic (retry %s/%s)", retry_count + 1, max_retries)
 
                 medic_context = {
                     'test_path': test_path,
@@ -832,7 +1097,7 @@ class KayaAgent(BaseAgent):
 
                 if not medic_result.success:
                     fallback = self.router.get_fallback('medic_escalation')
-                    logger.error(f"Medic failed, fallback: {fallback}")
+                    logger.error("Medic failed, fallback: %s", fallback)
                     break
 
                 # Retry runner
@@ -856,53 +1121,49 @@ class KayaAgent(BaseAgent):
 
             # Step 5: Gemini validates
             logger.info("Step 5: Gemini validates in real browser")
+            gemini_warmup.result()
             validate_slots = {'raw_value': test_path}
             gemini_result = self._handle_validate(validate_slots, context)
             pipeline_results.append(('gemini', gemini_result))
             total_cost += gemini_result.cost_usd
 
             # Record validation result metrics
-            self.metrics.record_validation_result(
-                test_id=test_path,
-                passed=gemini_result.success,
-                duration_ms=gemini_result.execution_time_ms,
-                cost_usd=gemini_result.cost_usd
-            )
+            pipeline_events.append(('validation_result', {
+                'test_id': test_path,
+                'passed': gemini_result.success,
+                'duration_ms': gemini_result.execution_time_ms,
+                'cost_usd': gemini_result.cost_usd
+            }))
 
             # Record Gemini agent activity
             if gemini_result.execution_time_ms > 0:
-                self.metrics.record_agent_activity(
-                    agent='gemini',
-                    duration_ms=gemini_result.execution_time_ms,
-                    cost_usd=gemini_result.cost_usd,
-                    model='gemini-2.5-pro'
-                )
+                pipeline_events.append(('agent_activity', {
+                    'agent': 'gemini',
+                    'duration_ms': gemini_result.execution_time_ms,
+                    'cost_usd': gemini_result.cost_usd,
+                    'model': 'gemini-2.5-pro'
+                }))
 
             # Record feature completion metrics (end-to-end pipeline)
-            pipeline_duration = int((time.time() - lifecycle.get_task_start_time(task_id)) * 1000) if task_id in lifecycle.active_tasks else 0
-            self.metrics.record_feature_completion(
-                feature=feature,
-                total_cost=total_cost,
-                duration_ms=pipeline_duration,
-                retry_count=retry_count,
-                task_id=task_id
-            )
+            pipeline_duration = (time.perf_counter_ns() - pipeline_start) // 1_000_000
+            pipeline_events.append(('feature_completion', {
+                'feature': feature,
+                'total_cost': total_cost,
+                'duration_ms': pipeline_duration,
+                'retry_count': retry_count,
+                'task_id': task_id
+            }))
 
             # Final result
-            pipeline_result = self._aggregate_pipeline_results(
+            return self._aggregate_pipeline_results(
                 'completed',
                 pipeline_results,
                 total_cost,
                 success=gemini_result.success
             )
 
-            # Remove task from active tracking
-            lifecycle.remove_active_task(task_id)
-            return pipeline_result
-
         except Exception as e:
-            logger.exception(f"Pipeline error: {e}")
-            lifecycle.remove_active_task(task_id)
+            logger.exception("Pipeline error: %s", e)
             return self._aggregate_pipeline_results(
                 'pipeline_error',
                 pipeline_results,
@@ -910,9 +1171,38 @@ class KayaAgent(BaseAgent):
                 error=f"Pipeline error: {str(e)}"
             )
         finally:
-            # Ensure task is removed even if exception occurs
-            if task_id in lifecycle.active_tasks:
-                lifecycle.remove_active_task(task_id)
+            # No-op for steps already finished; queued ones never start
+            for future in background:
+                future.cancel()
+
+            # Single exit point for active task tracking on every path
+            lifecycle.remove_active_task(task_id)
+
+            self.metrics.record_batch(pipeline_events)
+
+    def _prepare_runner(self, test_path: str) -> None:
+        """
+        Route a test path to Runner and load the Runner agent in the background.
+
+        Args:
+            test_path: Test file the pipeline will run next
+        """
+        try:
+            # Warms the router's decision cache for _handle_run_test
+            self.router.route(
+                task_type='execute_test',
+                task_description=test_path
+            )
+            self._get_agent('runner')
+        except Exception as e:
+            logger.warning("Runner preparation failed: %s, Step 3 will prepare inline", e)
+
+    def _warmup_gemini(self) -> None:
+        """Load the Gemini agent and start its browsers in the background."""
+        try:
+            self._get_agent('gemini').warmup()
+        except Exception as e:
+            logger.warning("Gemini warmup failed: %s, validation will start cold", e)
 
     def _aggregate_pipeline_results(
         self,
@@ -935,8 +1225,9 @@ class KayaAgent(BaseAgent):
         Returns:
             Aggregated AgentResult
         """
-        # Build summary
+        # Build summary and per-agent metadata in one pass
         agent_summary = {}
+        pipeline_results = []
         for agent_name, result in results:
             agent_summary[agent_name] = {
                 'success': result.success,
@@ -944,6 +1235,11 @@ class KayaAgent(BaseAgent):
                 'execution_time_ms': result.execution_time_ms,
                 'error': result.error
             }
+            pipeline_results.append({
+                'agent': agent_name,
+                'data': result.data,
+                'metadata': result.metadata
+            })
 
         return AgentResult(
             success=success,
@@ -956,16 +1252,7 @@ class KayaAgent(BaseAgent):
             },
             error=error,
             cost_usd=total_cost,
-            metadata={
-                'pipeline_results': [
-                    {
-                        'agent': agent_name,
-                        'data': result.data,
-                        'metadata': result.metadata
-                    }
-                    for agent_name, result in results
-                ]
-            }
+            metadata={'pipeline_results': pipeline_results}
         )
 
     def _build_pipeline_message(self, stage: str, results: List[Tuple[str, AgentResult]]) -> str:
@@ -979,20 +1266,14 @@ class KayaAgent(BaseAgent):
         Returns:
             Status message string
         """
-        agent_names = [name for name, _ in results]
-
-        if stage == 'completed':
-            return f"Pipeline completed successfully: {' → '.join(agent_names)}"
-        elif stage == 'scribe_failed':
-            return "Pipeline failed at Scribe (test writing)"
-        elif stage == 'critic_rejected':
-            return "Pipeline stopped: Critic rejected test quality"
-        elif stage == 'execution_failed':
-            return f"Pipeline failed: Test execution failed after {len([n for n in agent_names if n == 'medic'])} Medic attempts"
-        elif stage == 'pipeline_error':
-            return "Pipeline encountered unexpected error"
-        else:
-            return f"Pipeline in progress: {' → '.join(agent_names)}"
+        template = self.PIPELINE_MESSAGES.get(stage, "Pipeline in progress: {chain}")
+
+        # Only walk the results for templates that mention them
+        if '{chain}' in template:
+            return template.format(chain=' → '.join(name for name, _ in results))
+        if '{medic_attempts}' in template:
+            return template.format(medic_attempts=sum(1 for name, _ in results if name == 'medic'))
+        return template
 
     def check_budget(self, budget_type: str = 'per_session') -> Dict[str, Any]:
         """
@@ -1017,10 +1298,8 @@ class KayaAgent(BaseAgent):
         Returns:
             AgentResult with execution plan
         """
-        import os
-
         filename = slots.get('raw_value', '')
-        logger.info(f"Reading and planning for: {filename}")
+        logger.info("Reading and planning for: %s", filename)
 
         try:
             # Try to find the file
@@ -1046,7 +1325,7 @@ class KayaAgent(BaseAgent):
                     error=f"Could not find file: {filename}"
                 )
 
-            logger.info(f"Read {len(file_content)} characters from {actual_path}")
+            logger.info("Read %s characters from %s", len(file_content), actual_path)
 
             # Create execution plan based on file content
             plan = {
@@ -1072,7 +1351,7 @@ class KayaAgent(BaseAgent):
             )
 
         except Exception as e:
-            logger.exception(f"Error reading file: {e}")
+            logger.exception("Error reading file: %s", e)
             return AgentResult(
                 success=False,
                 error=f"Failed to read file: {str(e)}"
@@ -1105,14 +1384,14 @@ class KayaAgent(BaseAgent):
             # Use the Cloppy_Ai root directory so Playwright can find all tests
             test_dir = context.get('test_dir', '/Users/rutledge/Documents/DevFolder/Cloppy_Ai') if context else '/Users/rutledge/Documents/DevFolder/Cloppy_Ai'
 
-        logger.info(f"Testing directory: {test_dir}")
+        logger.info("Testing directory: %s", test_dir)
 
         max_iterations = 5
         iteration_results = []
         total_cost = 0.0
 
         for iteration in range(max_iterations):
-            logger.info(f"Iteration {iteration + 1}/{max_iterations}")
+            logger.info("Iteration %s/%s", iteration + 1, max_iterations)
 
             # Check budget
             budget_status = self.check_budget()
@@ -1211,8 +1490,6 @@ class KayaAgent(BaseAgent):
         Returns:
             AgentResult with mission execution status
         """
-        import os
-
         logger.info("Orchestrating mission from KAYA_MISSION_BRIEF.md")
 
         try:
@@ -1234,8 +1511,8 @@ class KayaAgent(BaseAgent):
                 with open(results_path, 'r') as f:
                     current_status = f.read()
 
-            logger.info(f"Mission brief: {len(mission_brief)} chars")
-            logger.info(f"Current status: {len(current_status)} chars")
+            logger.info("Mission brief: %s chars", len(mission_brief))
+            logger.info("Current status: %s chars", len(current_status))
 
             # Extract phase from slots or default to Phase 1
             phase_match = slots.get('raw_value', '')
@@ -1269,11 +1546,11 @@ class KayaAgent(BaseAgent):
                     description=f"Mission to achieve 100% P0 test pass rate - Phase {phase}"
                 )
 
-                logger.info(f"Created MCP project: {project.get('id')}")
+                logger.info("Created MCP project: %s", project.get('id'))
                 plan['mcp_project_id'] = project.get('id')
 
             except Exception as e:
-                logger.warning(f"MCP integration failed: {e}")
+                logger.warning("MCP integration failed: %s", e)
 
             return AgentResult(
                 success=True,
@@ -1288,7 +1565,7 @@ class KayaAgent(BaseAgent):
             )
 
         except Exception as e:
-            logger.exception(f"Mission orchestration error: {e}")
+            logger.exception("Mission orchestration error: %s", e)
             return AgentResult(
                 success=False,
                 error=f"Failed to orchestrate mission: {str(e)}"
@@ -1354,7 +1631,7 @@ class KayaAgent(BaseAgent):
         self.model_override = model_name
         self.model_override_scope = scope
 
-        logger.info(f"Model override set: {model_name} for {scope}")
+        logger.info("Model override set: %s for %s", model_name, scope)
 
         return AgentResult(
             success=True,
@@ -1366,38 +1643,57 @@ class KayaAgent(BaseAgent):
             }
         )
 
-    def get_session_stats(self) -> Dict[str, Any]:
+    def get_session_stats(self, include_history: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive session statistics.
 
+        Args:
+            include_history: Also return a copy of the retained task history
+
         Returns:
-            Dict with session stats including costs, success rates, and agent usage
+            Dict with session stats including costs, success rates, and agent usage.
+            Nested values are shared between calls until the next task is
+            recorded, so treat them as read-only.
         """
-        total_tasks = len(self.task_history)
-        successful_tasks = sum(1 for t in self.task_history if t['success'])
-
-        # Calculate per-intent stats
-        intent_stats = {}
-        for task in self.task_history:
-            intent = task['intent']
-            if intent not in intent_stats:
-                intent_stats[intent] = {'total': 0, 'success': 0, 'cost': 0.0}
+        cache_key = (self._stats_version, self.session_cost)
+        if self._stats_cache_key != cache_key:
+            self._stats_cache = {
+                'session_cost': self.session_cost,
+                'total_tasks': self._total_tasks,
+                'successful_tasks': self._successful_tasks,
+                'success_rate': self._success_rate,
+                'intent_stats': {
+                    intent: {'total': row[0], 'success': row[1], 'cost': row[2]}
+                    for intent, row in self._intent_stats.items()
+                },
+                'budget_status': self.check_budget(),
+                'task_count': len(self.task_history)
+            }
+            self._stats_cache_key = cache_key
 
-            intent_stats[intent]['total'] += 1
-            if task['success']:
-                intent_stats[intent]['success'] += 1
-            intent_stats[intent]['cost'] += task['cost']
+        stats = dict(self._stats_cache)
+        if include_history:
+            stats['task_history'] = [task.to_dict() for task in self.task_history]
+        return stats
 
-        return {
-            'session_cost': self.session_cost,
-            'total_tasks': total_tasks,
-            'successful_tasks': successful_tasks,
-            'success_rate': successful_tasks / total_tasks if total_tasks > 0 else 0.0,
-            'intent_stats': intent_stats,
-            'budget_status': self.check_budget(),
-            'task_history': self.task_history
-        }
+    def _record_task(self, task: TaskRecord) -> None:
+        """
+        Append a finished task to task_history and update session totals.
 
+        Args:
+            task: Record of the executed command
+        """
+        self.task_history.append(task)
+        self._stats_version += 1
+
+        row = self._intent_stats[task.intent]
+        row[0] += 1
+        row[2] += task.cost
+        self._total_tasks += 1
+        if task.success:
+            row[1] += 1
+            self._successful_tasks += 1
+        self._success_rate = self._successful_tasks / self._total_tasks
 
     def _execute_test_task_with_validation(
         self,
@@ -1429,7 +1725,7 @@ class KayaAgent(BaseAgent):
         task_title = task['title']
         task_description = task['description']
 
-        logger.info(f"🎯 Executing test task: {task_title}")
+        logger.info("🎯 Executing test task: %s", task_title)
 
         try:
             # Step 1: Scribe generates test
@@ -1446,7 +1742,7 @@ class KayaAgent(BaseAgent):
                 }
 
             test_path = scribe_result.data.get('test_path')
-            logger.info(f"✅ Scribe: Test generated at {test_path}")
+            logger.info("✅ Scribe: Test generated at %s", test_path)
 
             # Step 1.5: Critic pre-validates (LOG AND CONTINUE - don't block)
             logger.info("🔍 Critic: Pre-validating test quality...")
@@ -1455,12 +1751,12 @@ class KayaAgent(BaseAgent):
                 critic_result = critic.execute(test_path=test_path)
 
                 if not critic_result.success:
-                    logger.warning(f"⚠️  Critic found issues: {critic_result.error}")
+                    logger.warning("⚠️  Critic found issues: %s", critic_result.error)
                     logger.warning("Continuing anyway - Medic will fix if needed")
                 else:
                     logger.info("✅ Critic: Test quality approved")
             except Exception as e:
-                logger.warning(f"Critic failed: {e}, continuing anyway")
+                logger.warning("Critic failed: %s, continuing anyway", e)
 
             # Step 2: Runner validates test
             logger.info("🏃 Runner: Validating test...")
@@ -1473,7 +1769,7 @@ class KayaAgent(BaseAgent):
             fix_attempts = 0
             while not runner_result.success and fix_attempts < max_fix_attempts:
                 fix_attempts += 1
-                logger.warning(f"❌ Test failed, attempt {fix_attempts}/{max_fix_attempts}")
+                logger.warning("❌ Test failed, attempt %s/%s", fix_attempts, max_fix_attempts)
 
                 # Lazy load Medic (with HITL escalation disabled for autonomous builds)
                 if not hasattr(self, '_medic_agent'):
@@ -1483,7 +1779,7 @@ class KayaAgent(BaseAgent):
                 # After 2 failed attempts, search Archon RAG for similar patterns
                 rag_context = None
                 if fix_attempts >= 2:
-                    logger.info(f"🔍 Searching Archon knowledge base for similar test patterns...")
+                    logger.info("🔍 Searching Archon knowledge base for similar test patterns...")
                     try:
                         # Extract keywords from both feature description AND error message
                         feature_desc = task.get('feature', task.get('description', ''))
@@ -1512,7 +1808,7 @@ class KayaAgent(BaseAgent):
                         # Use 2-3 most relevant keywords (simplified for better matches!)
                         rag_query = ' '.join(keywords[:3]) if keywords else 'playwright test'
 
-                        logger.info(f"📝 RAG query: '{rag_query}' (from feature + error)")
+                        logger.info("📝 RAG query: '%s' (from feature + error)", rag_query)
 
                         rag_results = self.archon.search_knowledge_base(
                             query=rag_query,
@@ -1520,11 +1816,11 @@ class KayaAgent(BaseAgent):
                         )
                         if rag_results.get('success'):
                             rag_context = rag_results.get('results', [])
-                            logger.info(f"✅ Found {len(rag_context)} relevant patterns from Cloppy docs")
+                            logger.info("✅ Found %s relevant patterns from Cloppy docs", len(rag_context))
                     except Exception as e:
-                        logger.warning(f"RAG search failed: {e}")
+                        logger.warning("RAG search failed: %s", e)
 
-                logger.info(f"🏥 Medic: Fixing test (attempt {fix_attempts})...")
+                logger.info("🏥 Medic: Fixing test (attempt %s)...", fix_attempts)
 
                 # Extract error message from runner result
                 error_message = runner_result.error or "Test execution failed"
@@ -1546,7 +1842,7 @@ class KayaAgent(BaseAgent):
                 )
 
                 if not medic_result.success:
-                    logger.error(f"Medic fix failed: {medic_result.error}")
+                    logger.error("Medic fix failed: %s", medic_result.error)
                     break
 
                 logger.info("✅ Medic: Fix applied, re-validating...")
@@ -1568,7 +1864,7 @@ class KayaAgent(BaseAgent):
                         'fix_attempts': fix_attempts
                     }
                 )
-                logger.info(f"✅ Task completed: {task_title} (fixes: {fix_attempts})")
+                logger.info("✅ Task completed: %s (fixes: %s)", task_title, fix_attempts)
                 return {
                     'success': True,
                     'test_path': test_path,
@@ -1587,7 +1883,7 @@ class KayaAgent(BaseAgent):
                         'error': runner_result.error
                     }
                 )
-                logger.error(f"❌ Task failed after {fix_attempts} fix attempts: {task_title}")
+                logger.error("❌ Task failed after %s fix attempts: %s", fix_attempts, task_title)
                 return {
                     'success': False,
                     'error': f"Test failed after {fix_attempts} fix attempts: {runner_result.error}",
@@ -1596,7 +1892,7 @@ class KayaAgent(BaseAgent):
                 }
 
         except Exception as e:
-            logger.exception(f"Error executing test task: {e}")
+            logger.exception("Error executing test task: %s", e)
             self.archon.update_task_status(task_id, 'todo')
             return {
                 'success': False,
@@ -1630,13 +1926,13 @@ class KayaAgent(BaseAgent):
             )
 
         try:
-            logger.info(f"🏗️  Building feature: {feature}")
+            logger.info("🏗️  Building feature: %s", feature)
 
             # Initialize cost tracking with $2 budget
             total_cost = 0.0
             budget_cap = 2.00  # User's max budget for tonight
 
-            logger.info(f"💰 Budget cap: ${budget_cap:.2f}")
+            logger.info("💰 Budget cap: $%.2f", budget_cap)
 
             # Step 1: Create project in Archon
             project_result = self.archon.create_project(
@@ -1652,11 +1948,11 @@ class KayaAgent(BaseAgent):
 
             project_id = project_result['project_id']
             self.current_project_id = project_id
-            logger.info(f"✅ Created project: {project_id}")
+            logger.info("✅ Created project: %s", project_id)
 
             # Step 2: Break feature into tasks
             tasks = self.archon.breakdown_feature_to_tasks(feature, project_id)
-            logger.info(f"📋 Created {len(tasks)} tasks")
+            logger.info("📋 Created %s tasks", len(tasks))
 
             # Step 3: Create tasks in Archon
             created_tasks = []
@@ -1670,11 +1966,11 @@ class KayaAgent(BaseAgent):
                 )
                 if task_result['success']:
                     created_tasks.append(task_result)
-                    logger.info(f"  ✓ Task: {task_def['title']}")
+                    logger.info("  ✓ Task: %s", task_def['title'])
 
             # Step 4: Execute ALL tasks with validation and fixing loop
             if created_tasks:
-                logger.info(f"🚀 Starting autonomous execution of {len(created_tasks)} tasks")
+                logger.info("🚀 Starting autonomous execution of %s tasks", len(created_tasks))
 
                 completed_tasks = []
                 failed_tasks = []
@@ -1682,13 +1978,13 @@ class KayaAgent(BaseAgent):
                 for idx, task in enumerate(created_tasks, 1):
                     # Check budget before executing
                     if total_cost >= budget_cap:
-                        logger.warning(f"💰 Budget cap reached (${total_cost:.2f}), stopping execution")
+                        logger.warning("💰 Budget cap reached ($%.2f), stopping execution", total_cost)
                         # Mark remaining tasks as 'todo'
                         for remaining_task in created_tasks[idx-1:]:
                             self.archon.update_task_status(remaining_task['task_id'], 'todo')
                         break
 
-                    logger.info(f"📝 Task {idx}/{len(created_tasks)}: {task['title']} (budget: ${total_cost:.2f}/${budget_cap:.2f})")
+                    logger.info("📝 Task %s/%s: %s (budget: $%.2f/$%.2f)", idx, len(created_tasks), task['title'], total_cost, budget_cap)
 
                     # Mark task as doing
                     self.archon.update_task_status(task['task_id'], 'doing')
@@ -1703,7 +1999,7 @@ class KayaAgent(BaseAgent):
                         if isinstance(task_result, dict) and 'cost_usd' in task_result:
                             task_cost = task_result.get('cost_usd', 0)
                             total_cost += task_cost
-                            logger.info(f"💰 Task cost: ${task_cost:.3f}, Total: ${total_cost:.2f}/${budget_cap:.2f}")
+                            logger.info("💰 Task cost: $%.3f, Total: $%.2f/$%.2f", task_cost, total_cost, budget_cap)
 
                         if task_result['success']:
                             completed_tasks.append({
@@ -1711,26 +2007,26 @@ class KayaAgent(BaseAgent):
                                 'title': task['title'],
                                 'result': task_result
                             })
-                            logger.info(f"✅ Task {idx} completed successfully")
+                            logger.info("✅ Task %s completed successfully", idx)
                         else:
                             failed_tasks.append({
                                 'task_id': task['task_id'],
                                 'title': task['title'],
                                 'error': task_result.get('error', 'Unknown error')
                             })
-                            logger.warning(f"❌ Task {idx} failed after retries")
+                            logger.warning("❌ Task %s failed after retries", idx)
                     else:
                         # Non-test tasks - mark as todo for manual handling
                         self.archon.update_task_status(task['task_id'], 'todo')
-                        logger.info(f"⏭️  Task {idx} requires manual implementation (non-test)")
+                        logger.info("⏭️  Task %s requires manual implementation (non-test)", idx)
 
                 # SECOND PASS: Retry failed tasks with enhanced context
                 second_pass_completed = []
                 if failed_tasks and len(failed_tasks) <= 10:  # Don't retry if too many failures
-                    logger.info(f"🔄 SECOND PASS: Retrying {len(failed_tasks)} failed tasks with enhanced context")
+                    logger.info("🔄 SECOND PASS: Retrying %s failed tasks with enhanced context", len(failed_tasks))
 
                     for idx, failed_task_info in enumerate(failed_tasks, 1):
-                        logger.info(f"🔄 Retry {idx}/{len(failed_tasks)}: {failed_task_info['title']}")
+                        logger.info("🔄 Retry %s/%s: %s", idx, len(failed_tasks), failed_task_info['title'])
 
                         # Fetch the full task details
                         task_to_retry = None
@@ -1751,7 +2047,7 @@ class KayaAgent(BaseAgent):
                         }
 
                         # Retry with MORE attempts (5 → 7)
-                        logger.info(f"🔄 Retrying with 7 attempts and enhanced RAG context...")
+                        logger.info("🔄 Retrying with 7 attempts and enhanced RAG context...")
                         retry_result = self._execute_test_task_with_validation(
                             task_to_retry,
                             project_id,
@@ -1765,12 +2061,12 @@ class KayaAgent(BaseAgent):
                                 'title': task_to_retry['title'],
                                 'result': retry_result
                             })
-                            logger.info(f"✅ Second pass SUCCESS: {task_to_retry['title']}")
+                            logger.info("✅ Second pass SUCCESS: %s", task_to_retry['title'])
 
                             # Remove from failed_tasks
                             failed_tasks = [t for t in failed_tasks if t['task_id'] != task_to_retry['task_id']]
                         else:
-                            logger.error(f"❌ Second pass FAILED: {task_to_retry['title']}")
+                            logger.error("❌ Second pass FAILED: %s", task_to_retry['title'])
 
                     # Update totals
                     completed_tasks.extend(second_pass_completed)
@@ -1783,12 +2079,12 @@ class KayaAgent(BaseAgent):
                 failed_count = len(failed_tasks)
 
                 # Build completed tasks list
-                completed_list = "\n".join([f"  • {t['title']}" for t in completed_tasks])
+                completed_list = "\n".join(f"  • {t['title']}" for t in completed_tasks)
 
                 # Build failed tasks list
                 failed_list = ""
                 if failed_tasks:
-                    failed_items = "\n".join([f"  • {t['title']}: {t['error']}" for t in failed_tasks])
+                    failed_items = "\n".join(f"  • {t['title']}: {t['error']}" for t in failed_tasks)
                     failed_list = f"\nFailed Tasks:\n{failed_items}"
 
                 summary_message = f"""
@@ -1833,24 +2129,64 @@ Completed Tasks:
             )
 
         except Exception as e:
-            logger.exception(f"Error building feature: {e}")
+            logger.exception("Error building feature: %s", e)
             return AgentResult(
                 success=False,
                 error=f"Feature build error: {str(e)}"
             )
 
 
+def _format_cli_result(result: AgentResult) -> str:
+    """Render an AgentResult for the interactive CLI as one string."""
+    parts = [f"\nSuccess: {result.success}"]
+    if result.data:
+        parts.append(f"Data: {result.data}")
+    if result.error:
+        parts.append(f"Error: {result.error}")
+    return '\n'.join(parts) + '\n'
+
+
+def _format_cli_json(result: AgentResult) -> str:
+    """Render an AgentResult as one JSON line for --json output."""
+    return _dumps_cli_json({
+        'success': result.success,
+        'data': result.data,
+        'error': result.error,
+        'cost_usd': result.cost_usd,
+        'execution_time_ms': result.execution_time_ms
+    }) + '\n'
+
+
 def main():
     """CLI entry point for Kaya."""
-    import sys
-
+    logging.basicConfig(level=logging.INFO)
     kaya = KayaAgent()
 
-    if len(sys.argv) > 1:
-        command = ' '.join(sys.argv[1:])
+    args = sys.argv[1:]
+    json_output = '--json' in args
+    if json_output:
+        args = [arg for arg in args if arg != '--json']
+    format_result = _format_cli_json if json_output else _format_cli_result
+
+    if args:
+        command = ' '.join(args)
         result = kaya.execute(command)
-        print(f"Result: {result}")
+        if json_output:
+            sys.stdout.write(format_result(result))
+        else:
+            print(f"Result: {result}")
+    elif not sys.stdin.isatty():
+        # Batch mode: commands piped on stdin, one per line
+        for line in sys.stdin:
+            command = line.strip()
+            if not command:
+                continue
+            if command.lower() in ['quit', 'exit']:
+                break
+            sys.stdout.write(format_result(kaya.execute(command)))
+        sys.stdout.flush()
     else:
+        kaya.preload_agents()
         print("Kaya Agent - Interactive Mode")
         print("Enter commands or 'quit' to exit")
 
@@ -1861,16 +2197,14 @@ def main():
                     break
 
                 result = kaya.execute(command)
-                print(f"\nSuccess: {result.success}")
-                if result.data:
-                    print(f"Data: {result.data}")
-                if result.error:
-                    print(f"Error: {result.error}")
+                sys.stdout.write(format_result(result))
 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\nExiting...")
                 break
 
+    kaya.close()
+
 
 if __name__ == '__main__':
     main()
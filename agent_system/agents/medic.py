@@ -104,7 +104,7 @@ class MedicAgent(BaseAgent):
         Returns:
             AgentResult with fix status and artifacts
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         api_cost = 0.0
 
         # Generate task_id if not provided
@@ -70,7 +70,7 @@ class RunnerAgent(BaseAgent):
         Returns:
             AgentResult with test execution outcome
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         timeout = timeout or self.default_timeout
         reporter = reporter or self.reporter_format
 
@@ -11,9 +11,9 @@ import logging
 from agent_system.agents.base_agent import BaseAgent, AgentResult
 from agent_system.state.vector_client import VectorClient
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint, not on import
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class ScribeAgent(BaseAgent):
@@ -46,9 +46,8 @@ class ScribeAgent(BaseAgent):
             'reason': 'Use waitForSelector instead'
         },
         {
-            'pattern': r'hard[_-]?coded.*credential',
-            'reason': 'Use environment variables',
-            'flags': re.IGNORECASE
+            'pattern': r'[Hh][Aa][Rr][Dd][_-]?[Cc][Oo][Dd][Ee][Dd][^\n]{0,60}?[Cc][Rr][Ee][Dd][Ee][Nn][Tt][Ii][Aa][Ll]',
+            'reason': 'Use environment variables'
         },
         {
             'pattern': r'localhost|127\.0\.0\.1',
@@ -145,7 +144,7 @@ test.describe('{feature_name}', () => {{
         Returns:
             AgentResult with generated test or validation errors
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             # Generate with validation and retry
@@ -62,7 +62,7 @@ class ScribeAgent(BaseAgent):
         {'pattern': r'\.nth\(\d+\)', 'reason': 'Index-based selectors are flaky'},
         {'pattern': r'\.css-[a-z0-9]+', 'reason': 'Generated CSS classes change frequently'},
         {'pattern': r'waitForTimeout', 'reason': 'Use waitForSelector instead'},
-        {'pattern': r'hard[_-]?coded.*credential', 'reason': 'Use environment variables', 'flags': re.IGNORECASE}
+        {'pattern': r'[Hh][Aa][Rr][Dd][_-]?[Cc][Oo][Dd][Ee][Dd][^\n]{0,60}?[Cc][Rr][Ee][Dd][Ee][Nn][Tt][Ii][Aa][Ll]', 'reason': 'Use environment variables'}
         # Removed localhost check - fallback URLs are okay (e.g., process.env.BASE_URL || 'http://localhost:3000')
     ]
 
@@ -102,7 +102,7 @@ class ScribeAgent(BaseAgent):
         Returns:
             AgentResult with generated test and validation results
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         api_cost = 0.0
 
         try:
@@ -5,6 +5,7 @@ Command-line interface for the SuperAgent system.
 """
 import sys
 import argparse
+import logging
 from pathlib import Path
 import re
 from dotenv import load_dotenv
@@ -99,6 +100,8 @@ def sanitize_command_text(text: str) -> str:
 
 def main():
     """Main CLI entry point."""
+    logging.basicConfig(level=logging.INFO)
+
     # Set up lifecycle management with signal handlers
     lifecycle = setup_lifecycle()
     lifecycle.mark_started()
@@ -163,6 +166,7 @@ def main():
         print(f"\n✗ Service is shutting down - cannot accept new tasks")
         sys.exit(1)
 
+    kaya = None
     try:
         # Register connections for cleanup
         redis_client = None
@@ -651,6 +655,9 @@ def main():
         traceback.print_exc()
         sys.exit(1)
     finally:
+        if kaya is not None:
+            kaya.close()
+
         # Clean shutdown on exit (if not already shutting down)
         if not lifecycle.is_shutting_down():
             lifecycle.shutdown(timeout=5)
@@ -22,9 +22,9 @@ from enum import Enum
 from datetime import datetime, timedelta
 import threading
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint, not on import
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class ErrorCategory(Enum):
@@ -884,6 +884,8 @@ class GracefulDegradation:
 
 # Example usage and testing
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
     # Example 1: Retry with exponential backoff
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def flaky_api_call():
@@ -223,14 +223,14 @@ class ServiceLifecycle:
             True if task was found and removed
         """
         with self._lock:
-            if task_id in self.active_tasks:
-                task = self.active_tasks[task_id]
-                duration = time.time() - task.started_at
-                del self.active_tasks[task_id]
-                logger.debug(f"Removed active task: {task_id} (duration={duration:.2f}s)")
-                return True
+            task = self.active_tasks.pop(task_id, None)
+        if task is None:
             return False
 
+        duration = time.time() - task.started_at
+        logger.debug(f"Removed active task: {task_id} (duration={duration:.2f}s)")
+        return True
+
     def is_shutting_down(self) -> bool:
         """
         Check if shutdown is in progress.
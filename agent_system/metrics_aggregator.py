@@ -45,9 +45,9 @@ from dataclasses import dataclass, field
 
 from agent_system.state.redis_client import RedisClient
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint, not on import
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 @dataclass
@@ -185,22 +185,9 @@ class MetricsAggregator:
             True if recorded successfully
         """
         try:
-            timestamp = time.time()
-            hour_key = self._get_hour_key(timestamp)
-
-            # Store in sorted set: score=timestamp, value=serialized record
-            activity_key = f"metrics:agent_activity:{agent}:{hour_key}"
-            record_value = f"{duration_ms}|{cost_usd}|{task_id or 'none'}"
-
-            self.redis_client.client.zadd(activity_key, {record_value: timestamp})
-            self.redis_client.client.expire(activity_key, self.METRICS_TTL)
-
-            # Also track model usage if provided
-            if model:
-                model_key = f"metrics:model_usage:{model}:{hour_key}"
-                model_value = f"{duration_ms}|{cost_usd}|{agent}"
-                self.redis_client.client.zadd(model_key, {model_value: timestamp})
-                self.redis_client.client.expire(model_key, self.METRICS_TTL)
+            self._write_agent_activity(
+                self.redis_client.client, time.time(), agent, duration_ms, cost_usd, task_id, model
+            )
 
             logger.debug(f"Recorded activity: agent={agent}, duration={duration_ms}ms, cost=${cost_usd:.4f}")
             return True
@@ -233,15 +220,9 @@ class MetricsAggregator:
             True if recorded successfully
         """
         try:
-            timestamp = time.time()
-            hour_key = self._get_hour_key(timestamp)
-
-            # Store in sorted set
-            completion_key = f"metrics:feature_completion:{hour_key}"
-            record_value = f"{feature}|{total_cost}|{duration_ms}|{retry_count}|{task_id or 'none'}"
-
-            self.redis_client.client.zadd(completion_key, {record_value: timestamp})
-            self.redis_client.client.expire(completion_key, self.METRICS_TTL)
+            self._write_feature_completion(
+                self.redis_client.client, time.time(), feature, total_cost, duration_ms, retry_count, task_id
+            )
 
             logger.debug(f"Recorded completion: feature={feature}, cost=${total_cost:.4f}, retries={retry_count}")
             return True
@@ -268,15 +249,7 @@ class MetricsAggregator:
             True if recorded successfully
         """
         try:
-            timestamp = time.time()
-            hour_key = self._get_hour_key(timestamp)
-
-            # Store in sorted set
-            critic_key = f"metrics:critic_decisions:{hour_key}"
-            record_value = f"{test_id}|{decision}|{reason or 'none'}"
-
-            self.redis_client.client.zadd(critic_key, {record_value: timestamp})
-            self.redis_client.client.expire(critic_key, self.METRICS_TTL)
+            self._write_critic_decision(self.redis_client.client, time.time(), test_id, decision, reason)
 
             logger.debug(f"Recorded critic decision: test={test_id}, decision={decision}")
             return True
@@ -305,15 +278,9 @@ class MetricsAggregator:
             True if recorded successfully
         """
         try:
-            timestamp = time.time()
-            hour_key = self._get_hour_key(timestamp)
-
-            # Store in sorted set
-            validation_key = f"metrics:validation_results:{hour_key}"
-            record_value = f"{test_id}|{1 if passed else 0}|{duration_ms}|{cost_usd}"
-
-            self.redis_client.client.zadd(validation_key, {record_value: timestamp})
-            self.redis_client.client.expire(validation_key, self.METRICS_TTL)
+            self._write_validation_result(
+                self.redis_client.client, time.time(), test_id, passed, duration_ms, cost_usd
+            )
 
             logger.debug(f"Recorded validation: test={test_id}, passed={passed}")
             return True
@@ -322,6 +289,121 @@ class MetricsAggregator:
             logger.error(f"Failed to record validation result: {e}")
             return False
 
+    def record_batch(self, events: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Record several metrics in one Redis round trip.
+
+        Each event is a (kind, fields) pair, where kind is one of
+        'agent_activity', 'feature_completion', 'critic_decision' or
+        'validation_result' and fields are the keyword arguments of the
+        matching record_* method. All events share one timestamp.
+
+        Args:
+            events: List of (kind, fields) tuples
+
+        Returns:
+            True if recorded successfully
+        """
+        if not events:
+            return True
+
+        try:
+            timestamp = time.time()
+            pipe = self.redis_client.client.pipeline(transaction=False)
+            for kind, fields in events:
+                self._BATCH_WRITERS[kind](self, pipe, timestamp, **fields)
+            pipe.execute()
+
+            logger.debug(f"Recorded batch of {len(events)} metrics")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to record metrics batch: {e}")
+            return False
+
+    def _write_agent_activity(
+        self,
+        client: Any,
+        timestamp: float,
+        agent: str,
+        duration_ms: int,
+        cost_usd: float,
+        task_id: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> None:
+        """Queue agent activity (and model usage) writes on a Redis client or pipeline."""
+        hour_key = self._get_hour_key(timestamp)
+
+        # Store in sorted set: score=timestamp, value=serialized record
+        activity_key = f"metrics:agent_activity:{agent}:{hour_key}"
+        record_value = f"{duration_ms}|{cost_usd}|{task_id or 'none'}"
+
+        client.zadd(activity_key, {record_value: timestamp})
+        client.expire(activity_key, self.METRICS_TTL)
+
+        # Also track model usage if provided
+        if model:
+            model_key = f"metrics:model_usage:{model}:{hour_key}"
+            model_value = f"{duration_ms}|{cost_usd}|{agent}"
+            client.zadd(model_key, {model_value: timestamp})
+            client.expire(model_key, self.METRICS_TTL)
+
+    def _write_feature_completion(
+        self,
+        client: Any,
+        timestamp: float,
+        feature: str,
+        total_cost: float,
+        duration_ms: int,
+        retry_count: int,
+        task_id: Optional[str] = None
+    ) -> None:
+        """Queue a feature completion write on a Redis client or pipeline."""
+        completion_key = f"metrics:feature_completion:{self._get_hour_key(timestamp)}"
+        record_value = f"{feature}|{total_cost}|{duration_ms}|{retry_count}|{task_id or 'none'}"
+
+        client.zadd(completion_key, {record_value: timestamp})
+        client.expire(completion_key, self.METRICS_TTL)
+
+    def _write_critic_decision(
+        self,
+        client: Any,
+        timestamp: float,
+        test_id: str,
+        decision: str,
+        reason: Optional[str] = None
+    ) -> None:
+        """Queue a critic decision write on a Redis client or pipeline."""
+        critic_key = f"metrics:critic_decisions:{self._get_hour_key(timestamp)}"
+        record_value = f"{test_id}|{decision}|{reason or 'none'}"
+
+        client.zadd(critic_key, {record_value: timestamp})
+        client.expire(critic_key, self.METRICS_TTL)
+
+    def _write_validation_result(
+        self,
+        client: Any,
+        timestamp: float,
+        test_id: str,
+        passed: bool,
+        duration_ms: int = 0,
+        cost_usd: float = 0.0
+    ) -> None:
+        """Queue a validation result write on a Redis client or pipeline."""
+        validation_key = f"metrics:validation_results:{self._get_hour_key(timestamp)}"
+        record_value = f"{test_id}|{1 if passed else 0}|{duration_ms}|{cost_usd}"
+
+        client.zadd(validation_key, {record_value: timestamp})
+        client.expire(validation_key, self.METRICS_TTL)
+
+    # record_batch event kind -> writer
+    _BATCH_WRITERS = {
+        'agent_activity': _write_agent_activity,
+        'feature_completion': _write_feature_completion,
+        'critic_decision': _write_critic_decision,
+        'validation_result': _write_validation_result,
+    }
+
     def get_metrics_summary(self, window_hours: int = 1) -> Dict[str, Any]:
         """
         Get aggregated metrics for time window.
@@ -755,6 +837,8 @@ def get_metrics_aggregator(redis_client: Optional[RedisClient] = None) -> Metric
 if __name__ == '__main__':
     import json
 
+    logging.basicConfig(level=logging.INFO)
+
     print("Metrics Aggregation System Demo\n")
 
     # Create aggregator
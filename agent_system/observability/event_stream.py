@@ -30,13 +30,15 @@ Usage:
     })
 """
 import asyncio
+import atexit
 import json
 import os
+import queue
 import time
 import threading
 import gzip
 import glob
-from typing import Dict, List, Optional, Any, Set
+from typing import Callable, Dict, List, Optional, Any, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
@@ -872,10 +874,113 @@ class EventEmitter:
         self.metrics.record_critic_decision(rejected)
 
 
+class RedisEventPublisher:
+    """
+    Publishes events to the Redis 'agent-events' channel in batches.
+
+    emit_event() only enqueues; a daemon thread collects up to BATCH_SIZE
+    events (waiting at most FLUSH_INTERVAL for more) and publishes them in a
+    single Redis pipeline round trip. Events that cannot be published are
+    handed to the fallback (console/file emission).
+    """
+
+    CHANNEL = 'agent-events'
+    BATCH_SIZE = 64
+    FLUSH_INTERVAL = 0.005  # seconds
+
+    # Queued after the last event by close(); the drain thread exits on it
+    _STOP = object()
+
+    def __init__(self, redis_client: RedisClient, fallback: Callable[[str, Dict[str, Any]], None]):
+        """
+        Initialize publisher and start its drain thread.
+
+        Args:
+            redis_client: Redis client used for every batch
+            fallback: Called with (event_type, payload) for undeliverable events
+        """
+        self.redis_client = redis_client
+        self._fallback = fallback
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name='event-publisher', daemon=True)
+        self._thread.start()
+
+    def publish(self, event: Event):
+        """
+        Queue an event for publishing.
+
+        Args:
+            event: Event to publish
+        """
+        self._queue.put(event)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """
+        Publish everything still queued or batched, then stop the drain thread.
+
+        Registered with atexit, so events emitted just before exit - including
+        a batch the drain thread is holding - still reach Redis.
+
+        Args:
+            timeout: Max seconds to wait for the drain thread
+        """
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _drain(self):
+        """Collect queued events into batches and publish them until closed."""
+        while True:
+            event = self._queue.get()
+            if event is self._STOP:
+                return
+            batch = [event]
+            stopping = False
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is self._STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+            self._publish_batch(batch)
+            if stopping:
+                return
+
+    def _publish_batch(self, batch: List[Event]):
+        """
+        Publish a batch of events in one pipeline round trip.
+
+        Args:
+            batch: Events to publish
+        """
+        try:
+            pipe = self.redis_client.client.pipeline(transaction=False)
+            for event in batch:
+                pipe.publish(self.CHANNEL, event.to_json())
+            pipe.execute()
+        except Exception as e:
+            print(f"{Colors.WARNING}Warning: Could not publish to Redis: {e}{Colors.RESET}")
+            for event in batch:
+                self._fallback(event.event_type, event.payload)
+
+
 # Global emitter instance
 _global_emitter: Optional[EventEmitter] = None
 _emitter_lock = threading.Lock()
 
+# Global Redis publisher, built on first use once Redis answers a ping.
+# After a failed ping, emit_event emits locally until the retry interval passes.
+_PUBLISHER_RETRY_SECONDS = 30.0
+_global_publisher: Optional[RedisEventPublisher] = None
+_publisher_retry_at = 0.0
+_publisher_lock = threading.Lock()
+
 
 def get_emitter() -> EventEmitter:
     """
@@ -894,13 +999,44 @@ def get_emitter() -> EventEmitter:
     return _global_emitter
 
 
+def get_event_publisher() -> Optional[RedisEventPublisher]:
+    """
+    Get or create the global Redis event publisher.
+
+    Returns:
+        Global RedisEventPublisher, or None if Redis is unavailable
+    """
+    global _global_publisher, _publisher_retry_at
+
+    if _global_publisher is not None or not REDIS_AVAILABLE:
+        return _global_publisher
+
+    with _publisher_lock:
+        if _global_publisher is None and time.monotonic() >= _publisher_retry_at:
+            try:
+                redis_client = RedisClient()
+                healthy = redis_client.health_check()
+            except Exception:
+                healthy = False
+
+            if healthy:
+                _global_publisher = RedisEventPublisher(redis_client, get_emitter().emit)
+                atexit.register(_global_publisher.close)
+            else:
+                print(f"{Colors.WARNING}Warning: Could not publish to Redis: not reachable{Colors.RESET}")
+                _publisher_retry_at = time.monotonic() + _PUBLISHER_RETRY_SECONDS
+
+    return _global_publisher
+
+
 def emit_event(event_type: str, payload: Dict[str, Any]):
     """
     Convenience function to emit event using global emitter OR Redis pub/sub.
 
     This function tries TWO approaches:
     1. If global emitter exists and has event loop -> emit directly
-    2. Otherwise -> publish to Redis for event stream server to pick up
+    2. Otherwise -> queue for batched publishing to Redis, for the event
+       stream server to pick up (emitted locally if Redis is unreachable)
 
     Args:
         event_type: Type of event
@@ -922,25 +1058,15 @@ def emit_event(event_type: str, payload: Dict[str, Any]):
         emitter.emit(event_type, payload)
     else:
         # Emitter not started - use Redis pub/sub as bridge
-        try:
-            if REDIS_AVAILABLE:
-                from agent_system.state.redis_client import RedisClient
-                redis_client = RedisClient()
-
-                event = Event(
-                    event_type=event_type,
-                    timestamp=time.time(),
-                    payload=payload
-                )
-
-                # Publish to Redis channel
-                redis_client.client.publish('agent-events', event.to_json())
-            else:
-                # No Redis, just log to console
-                emitter.emit(event_type, payload)
-        except Exception as e:
-            # Fallback to console-only emission
-            print(f"{Colors.WARNING}Warning: Could not publish to Redis: {e}{Colors.RESET}")
+        publisher = get_event_publisher()
+        if publisher is not None:
+            publisher.publish(Event(
+                event_type=event_type,
+                timestamp=time.time(),
+                payload=payload
+            ))
+        else:
+            # No Redis, just log to console
             emitter.emit(event_type, payload)
 
 
@@ -25,9 +25,9 @@ from enum import Enum
 
 from agent_system.state.redis_client import RedisClient
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint, not on import
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class RateLimitService(Enum):
@@ -723,6 +723,8 @@ def limit_gemini(model: Optional[str] = None, cost: int = 1):
 if __name__ == '__main__':
     import sys
 
+    logging.basicConfig(level=logging.INFO)
+
     # Test rate limiter
     limiter = RateLimiter()
 
@@ -4,15 +4,20 @@ Makes intelligent agent/model selection decisions based on task complexity and c
 """
 import yaml
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 import fnmatch
 
 from agent_system.complexity_estimator import ComplexityEstimator
 
+# slots=True (Python 3.10+) drops the per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class RoutingDecision:
     """Result of routing decision."""
     agent: str
@@ -35,6 +40,10 @@ class Router:
     - Return agent/model/max_cost decision
     """
 
+    # Routing is deterministic in its inputs, so decisions are memoized per
+    # router; the oldest entry is evicted once this many are cached
+    ROUTE_CACHE_SIZE = 512
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize router with policy configuration.
@@ -50,6 +59,10 @@ class Router:
         self.policy = self._load_policy()
         self.estimator = ComplexityEstimator()
 
+        # (task_type, task_description, task_scope, test_path) -> decision
+        self._route_cache: Dict[Tuple[str, str, str, Optional[str]], RoutingDecision] = {}
+        self._route_cache_lock = threading.Lock()
+
     def _load_policy(self) -> Dict[str, Any]:
         """
         Load routing policy from YAML file.
@@ -81,6 +94,42 @@ class Router:
             task_scope: Task scope/context
             test_path: Optional path to test file (for cost override matching)
 
+        Returns:
+            RoutingDecision with agent, model, max_cost, and reasoning
+        """
+        cache_key = (task_type, task_description, task_scope, test_path)
+        decision = self._route_cache.get(cache_key)
+        if decision is None:
+            decision = self._route_uncached(task_type, task_description, task_scope, test_path)
+            # Routers are shared across pipeline threads; evict and insert as one step
+            with self._route_cache_lock:
+                if (cache_key not in self._route_cache
+                        and len(self._route_cache) >= self.ROUTE_CACHE_SIZE):
+                    del self._route_cache[next(iter(self._route_cache))]
+                self._route_cache[cache_key] = decision
+        return decision
+
+    def clear_route_cache(self):
+        """Forget memoized routing decisions (e.g. after changing policy or estimator)."""
+        with self._route_cache_lock:
+            self._route_cache.clear()
+
+    def _route_uncached(
+        self,
+        task_type: str,
+        task_description: str,
+        task_scope: str,
+        test_path: Optional[str]
+    ) -> RoutingDecision:
+        """
+        Compute a routing decision (see route()).
+
+        Args:
+            task_type: Type of task
+            task_description: Task description for complexity estimation
+            task_scope: Task scope/context
+            test_path: Optional path to test file
+
         Returns:
             RoutingDecision with agent, model, max_cost, and reasoning
         """
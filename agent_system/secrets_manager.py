@@ -45,9 +45,9 @@ import threading
 from agent_system.state.redis_client import RedisClient
 from agent_system.observability.event_stream import emit_event
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entrypoint, not on import
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 @dataclass
@@ -685,6 +685,8 @@ def get_secrets_manager(
 if __name__ == '__main__':
     import sys
 
+    logging.basicConfig(level=logging.INFO)
+
     # Create secrets manager
     secrets = SecretsManager()
 
@@ -109,9 +109,9 @@ class TestCompletePipeline:
         routing = kaya_result.metadata.get('routing_decision')
         if routing:
             print(f"✓ Voice command parsed: {voice_command}")
-            print(f"  Routed to: {routing.get('agent', 'scribe')}")
-            print(f"  Model: {routing.get('model', 'haiku')}")
-            print(f"  Complexity: {routing.get('difficulty', 'easy')}")
+            print(f"  Routed to: {routing.agent}")
+            print(f"  Model: {routing.model}")
+            print(f"  Complexity: {routing.difficulty}")
 
         # ===== STEP 2: Test Generation =====
         print("\n=== STEP 2: Test generation ===")
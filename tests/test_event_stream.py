@@ -6,11 +6,13 @@ import asyncio
 import time
 import json
 from pathlib import Path
+from unittest.mock import Mock
 from agent_system.observability.event_stream import (
     EventEmitter,
     Event,
     EventType,
     MetricsAggregator,
+    RedisEventPublisher,
     emit_event,
     get_emitter
 )
@@ -263,6 +265,58 @@ class TestGlobalEmitter:
         assert 't_999' in captured.out
 
 
+def _wait_for(condition, timeout=2.0):
+    """Poll until condition() is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+class TestRedisEventPublisher:
+    """Test batched Redis event publishing."""
+
+    def test_events_published_in_one_pipeline(self):
+        """Test queued events are published through a single pipeline."""
+        redis_client = Mock()
+        pipe = redis_client.client.pipeline.return_value
+        publisher = RedisEventPublisher(redis_client, fallback=Mock())
+
+        for i in range(3):
+            publisher.publish(Event(event_type='task_queued', timestamp=time.time(), payload={'n': i}))
+
+        assert _wait_for(lambda: pipe.publish.call_count == 3)
+        redis_client.client.publish.assert_not_called()
+        channels = {c.args[0] for c in pipe.publish.call_args_list}
+        assert channels == {'agent-events'}
+        assert [json.loads(c.args[1])['payload']['n'] for c in pipe.publish.call_args_list] == [0, 1, 2]
+
+    def test_failed_batch_goes_to_fallback(self):
+        """Test events are emitted through the fallback when Redis fails."""
+        redis_client = Mock()
+        redis_client.client.pipeline.return_value.execute.side_effect = ConnectionError('down')
+        fallback = Mock()
+        publisher = RedisEventPublisher(redis_client, fallback=fallback)
+
+        publisher.publish(Event(event_type='task_queued', timestamp=time.time(), payload={'task_id': 't_1'}))
+
+        assert _wait_for(lambda: fallback.call_count == 1)
+        fallback.assert_called_once_with('task_queued', {'task_id': 't_1'})
+
+    def test_close_publishes_pending_events_and_stops(self):
+        """Test close() delivers queued events and joins the drain thread."""
+        redis_client = Mock()
+        pipe = redis_client.client.pipeline.return_value
+        publisher = RedisEventPublisher(redis_client, fallback=Mock())
+
+        for i in range(200):
+            publisher.publish(Event(event_type='task_queued', timestamp=time.time(), payload={'n': i}))
+        publisher.close()
+
+        assert not publisher._thread.is_alive()
+        assert [json.loads(c.args[1])['payload']['n'] for c in pipe.publish.call_args_list] == list(range(200))
+
+
 @pytest.mark.asyncio
 async def test_websocket_server():
     """Test WebSocket server (integration test)."""
@@ -6,8 +6,10 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
 import json
+import threading
+import time
 
-from agent_system.agents.gemini import GeminiAgent
+from agent_system.agents.gemini import GeminiAgent, BrowserPool
 from agent_system.agents.base_agent import AgentResult
 
 
@@ -61,6 +63,22 @@ class TestGeminiAgentInitialization:
         # Config should be loaded from .claude/agents/gemini.yaml
         assert gemini_agent.config is not None
 
+    def test_api_key_fetched_once(self):
+        """Test the Gemini API key is read from the secrets manager only once."""
+        secrets = Mock()
+        secrets.get_secret.return_value = None
+
+        with patch('agent_system.agents.base_agent.BaseAgent._secrets_manager', secrets), \
+             patch.object(GeminiAgent, '_load_config', return_value={
+                 'contracts': {'gemini_api': {'enabled': True}, 'browser': {'headless': False}}
+             }):
+            agent = GeminiAgent()
+            agent._check_gemini_api_available()
+
+        assert agent.gemini_enabled is False
+        assert agent._headless is False
+        secrets.get_secret.assert_called_once_with('GEMINI_API_KEY')
+
 
 class TestGeminiAgentValidation:
     """Test Gemini agent validation logic."""
@@ -227,6 +245,50 @@ class TestGeminiAgentScreenshots:
             mtime2 = Path(screenshots[i + 1]).stat().st_mtime
             assert mtime1 <= mtime2
 
+    def test_collect_screenshots_from_test_results(self, gemini_agent, tmp_path, monkeypatch):
+        """Test per-test Playwright output folders are scanned, others ignored."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'test-results' / 'checkout.spec-login-chromium').mkdir(parents=True)
+        (tmp_path / 'test-results' / 'other-chromium').mkdir()
+        (tmp_path / 'test-results' / 'checkout.spec-login-chromium' / 'shot.png').write_bytes(b'data')
+        (tmp_path / 'test-results' / 'other-chromium' / 'shot.png').write_bytes(b'data')
+        (tmp_path / 'artifacts' / 'nested').mkdir(parents=True)
+        (tmp_path / 'artifacts' / 'nested' / 'step.png').write_bytes(b'data')
+        (tmp_path / 'artifacts' / 'notes.txt').write_text('x')
+
+        screenshots = gemini_agent._collect_screenshots(tmp_path / 'artifacts', 'tests/checkout.spec.ts')
+
+        assert sorted(Path(s).name for s in screenshots) == ['shot.png', 'step.png']
+        assert all('other-chromium' not in s for s in screenshots)
+        assert all(Path(s).is_absolute() for s in screenshots)
+
+    @patch('agent_system.agents.gemini.emit_event')
+    @patch('subprocess.run')
+    def test_screenshots_broadcast_as_single_event(self, mock_run, mock_emit, gemini_agent, mock_test_file, tmp_path):
+        """Test all screenshots of a run are broadcast in one batched event."""
+        mock_run.return_value = Mock(returncode=0, stdout='{}', stderr='')
+        shots = ['/tmp/a.png', '/tmp/b.png', '/tmp/c.png']
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=shots):
+            gemini_agent._execute_test_in_browser(str(mock_test_file), 60000, tmp_path)
+
+        mock_emit.assert_called_once()
+        event_type, payload = mock_emit.call_args[0]
+        assert event_type == 'screenshots_captured_batch'
+        assert payload['screenshots'] == shots
+        assert payload['total_screenshots'] == 3
+
+    @patch('agent_system.agents.gemini.emit_event')
+    @patch('subprocess.run')
+    def test_no_screenshot_event_without_screenshots(self, mock_run, mock_emit, gemini_agent, mock_test_file, tmp_path):
+        """Test no event is broadcast when a run produced no screenshots."""
+        mock_run.return_value = Mock(returncode=0, stdout='{}', stderr='')
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=[]):
+            gemini_agent._execute_test_in_browser(str(mock_test_file), 60000, tmp_path)
+
+        mock_emit.assert_not_called()
+
 
 class TestGeminiAgentReportParsing:
     """Test Playwright report parsing."""
@@ -295,6 +357,62 @@ class TestGeminiAgentReportParsing:
         assert len(failures) == 1
         assert 'ERR_CONNECTION_REFUSED' in failures[0]
 
+    def test_parse_report_single_pass(self, gemini_agent):
+        """Test fused report parsing matches the individual extractors."""
+        suites = [{
+            'specs': [{
+                'tests': [{
+                    'results': [
+                        {'status': 'passed', 'stderr': ['TypeError: x is undefined']},
+                        {'status': 'failed', 'error': {'message': 'Timeout 30000ms exceeded'}},
+                        {'status': 'passed', 'error': {'message': 'net::ERR_ABORTED'}}
+                    ]
+                }]
+            }]
+        }]
+
+        passed, errors, failures = gemini_agent._parse_report(suites)
+
+        assert passed is False
+        assert errors == ['TypeError: x is undefined']
+        assert failures == ['Timeout 30000ms exceeded', 'net::ERR_ABORTED']
+        assert passed == gemini_agent._check_tests_passed(suites)
+
+    def test_network_failure_marker_case_rules(self, gemini_agent):
+        """Test 'timeout' matches in any case while net::/ERR_ stay case-sensitive."""
+        messages = ['TimeoutError: 30000ms', 'net::ERR_FAILED', 'err_nothing', 'NET:: nope', 'assert failed']
+        suites = [{'specs': [{'tests': [{'results': [
+            {'status': 'failed', 'error': {'message': message}} for message in messages
+        ]}]}]}]
+
+        assert gemini_agent._extract_network_failures(suites) == ['TimeoutError: 30000ms', 'net::ERR_FAILED']
+
+    def test_extract_json_object_from_response(self, gemini_agent):
+        """Test JSON extraction from fenced model output with nesting and braces in strings."""
+        text = (
+            'Here is my analysis:\n```json\n'
+            '{"ui_correctness": "pass", "findings": "uses {braces}", '
+            '"details": {"layout": {"ok": true}}, "visual_regressions": []}\n```'
+        )
+
+        result = gemini_agent._extract_json_object(text)
+
+        assert result['findings'] == 'uses {braces}'
+        assert result['details'] == {'layout': {'ok': True}}
+
+    def test_extract_json_object_skips_invalid_candidates(self, gemini_agent):
+        """Test stray braces before the object are skipped, and plain text yields None."""
+        assert gemini_agent._extract_json_object('see {note} then {"confidence_score": 80}') == {
+            'confidence_score': 80
+        }
+        assert gemini_agent._extract_json_object('no json here') is None
+
+    def test_extract_json_object_pathological_input(self, gemini_agent):
+        """Test unbalanced brace-heavy output is handled quickly."""
+        start = time.perf_counter()
+        assert gemini_agent._extract_json_object('{' * 5000 + 'x' * 5000) is None
+        assert time.perf_counter() - start < 1.0
+
 
 class TestGeminiAgentRubricIntegration:
     """Test integration with ValidationRubric."""
@@ -531,3 +649,541 @@ class TestGeminiAgentEdgeCases:
 
         # Run the async test
         asyncio.run(run_test())
+
+
+class TestBrowserPool:
+    """Test pre-warmed browser pool."""
+
+    @patch('subprocess.Popen')
+    def test_acquire_and_release(self, mock_popen):
+        """Test endpoints are handed out and returned to the pool."""
+        process = Mock()
+        process.stdout.readline.return_value = 'ws://127.0.0.1:9000/abc\n'
+        process.poll.return_value = None
+        mock_popen.return_value = process
+
+        pool = BrowserPool(size=1)
+        pool.start()
+
+        with pool.acquire(timeout=1) as endpoint:
+            assert endpoint == 'ws://127.0.0.1:9000/abc'
+            assert pool._available.empty()
+
+        assert not pool._available.empty()
+        pool.close()
+        process.terminate.assert_called_once()
+
+    @patch('subprocess.Popen')
+    def test_start_fails_without_endpoint(self, mock_popen):
+        """Test a sidecar that exits early raises RuntimeError."""
+        process = Mock()
+        process.stdout.readline.return_value = ''
+        process.poll.return_value = 1
+        mock_popen.return_value = process
+
+        with pytest.raises(RuntimeError):
+            BrowserPool(size=1).start()
+
+    @patch('subprocess.Popen')
+    def test_start_times_out_without_endpoint(self, mock_popen):
+        """Test a sidecar that never reports an endpoint is killed."""
+        released = threading.Event()
+        process = Mock()
+        process.stdout.readline.side_effect = lambda: released.wait(5) and ''
+        process.poll.return_value = None
+        mock_popen.return_value = process
+
+        pool = BrowserPool(size=1)
+        pool.START_TIMEOUT_SECONDS = 0.05
+        try:
+            with pytest.raises(RuntimeError, match='did not report'):
+                pool.start()
+        finally:
+            released.set()
+
+        process.kill.assert_called_once()
+        assert pool._processes == []
+
+    def test_pool_start_timeout_falls_back(self, gemini_agent):
+        """Test a pool that fails to start disables pooling."""
+        gemini_agent.browser_pool_size = 1
+
+        with patch('agent_system.agents.gemini.get_browser_pool', side_effect=RuntimeError('timed out')):
+            assert gemini_agent._get_browser_pool(headless=True) is None
+
+        assert gemini_agent.browser_pool_size == 0
+
+    @patch('subprocess.run')
+    def test_pooled_run_connects_to_endpoint(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test pooled validation passes the browser endpoint to Playwright."""
+        mock_run.return_value = Mock(returncode=0, stdout='{}', stderr='')
+        pool = BrowserPool(size=1)
+        pool._available.put('ws://127.0.0.1:9000/abc')
+
+        with patch.object(gemini_agent, '_get_browser_pool', return_value=pool):
+            result = gemini_agent._execute_test_in_browser(str(mock_test_file), 60, tmp_path)
+
+        assert result['test_executed'] is True
+        env = mock_run.call_args.kwargs['env']
+        assert env['PW_TEST_CONNECT_WS_ENDPOINT'] == 'ws://127.0.0.1:9000/abc'
+
+    def test_pool_disabled_by_default(self, gemini_agent):
+        """Test pooling is opt-in via config."""
+        assert gemini_agent._get_browser_pool(headless=True) is None
+
+    @patch('subprocess.run')
+    def test_playwright_env_built_once(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test unpooled runs reuse one prebuilt child environment."""
+        mock_run.return_value = Mock(returncode=0, stdout='{}', stderr='')
+
+        gemini_agent._execute_test_in_browser(str(mock_test_file), 60, tmp_path)
+        gemini_agent._execute_test_in_browser(str(mock_test_file), 60, tmp_path)
+
+        first_env, second_env = (call.kwargs['env'] for call in mock_run.call_args_list)
+        assert first_env.maps[-1] is second_env.maps[-1] is gemini_agent._playwright_env
+        assert first_env['PWTEST_SKIP_TEST_OUTPUT'] == '1'
+
+    @patch('subprocess.run')
+    def test_report_file_preferred_over_stdout(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test the JSON report is read from PLAYWRIGHT_JSON_OUTPUT_NAME, not stdout."""
+        failing_report = json.dumps({
+            'suites': [{'specs': [{'tests': [{'results': [{'status': 'failed'}]}]}]}]
+        })
+
+        def write_report(args, **kwargs):
+            Path(kwargs['env']['PLAYWRIGHT_JSON_OUTPUT_NAME']).write_text(failing_report)
+            return Mock(returncode=1, stdout='Running 1 test using 1 worker', stderr='')
+
+        mock_run.side_effect = write_report
+
+        result = gemini_agent._execute_test_in_browser(str(mock_test_file), 60, tmp_path)
+
+        assert result['test_executed'] is True
+        assert result['test_passed'] is False
+
+    @patch('subprocess.run')
+    def test_stdout_captured_as_bytes(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test Playwright output is kept as undecoded bytes and stderr is discarded."""
+        mock_run.return_value = Mock(returncode=1, stdout=json.dumps({
+            'suites': [{'specs': [{'tests': [{'results': [{'status': 'failed'}]}]}]}]
+        }).encode())
+
+        result = gemini_agent._execute_test_in_browser(str(mock_test_file), 60, tmp_path)
+
+        kwargs = mock_run.call_args.kwargs
+        assert 'text' not in kwargs and 'capture_output' not in kwargs
+        assert kwargs['stderr'] is subprocess.DEVNULL
+        assert result['test_passed'] is False
+
+    def test_stale_report_not_reused(self, gemini_agent, mock_test_file, tmp_path):
+        """Test a previous run's report is removed before Playwright starts."""
+        (tmp_path / 'report.json').write_text('{"suites": []}')
+
+        with patch('subprocess.run', return_value=Mock(returncode=1, stdout='', stderr='')):
+            result = gemini_agent._execute_test_in_browser(str(mock_test_file), 60, tmp_path)
+
+        assert not (tmp_path / 'report.json').exists()
+        assert result['test_executed'] is True
+
+
+class TestGeminiResultCache:
+    """Test content-addressed validation result cache."""
+
+    @pytest.fixture
+    def gemini_agent(self, gemini_agent):
+        """Gemini agent with the opt-in result cache enabled."""
+        gemini_agent.result_cache_enabled = True
+        return gemini_agent
+
+    @patch('subprocess.run')
+    def test_cache_disabled_by_default(self, mock_run, mock_test_file, tmp_path):
+        """Test a default agent re-runs the browser for every validation."""
+        agent = GeminiAgent()
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        mock_run.return_value, screenshots = self._passing_run(screenshot)
+
+        with patch.object(agent, '_collect_screenshots', return_value=screenshots):
+            agent.execute(str(mock_test_file))
+            agent.execute(str(mock_test_file))
+
+        assert agent.result_cache_enabled is False
+        assert mock_run.call_count == 2
+        assert agent._result_cache == {}
+
+    def _passing_run(self, screenshot):
+        """Build mocks for a passing validation with one screenshot."""
+        mock_result = Mock(returncode=0, stderr='')
+        mock_result.stdout = json.dumps({
+            'suites': [{'specs': [{'tests': [{'results': [{'status': 'passed'}]}]}]}]
+        })
+        return mock_result, [str(screenshot)]
+
+    @patch('subprocess.run')
+    def test_unchanged_test_skips_browser(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test a repeated validation of an unchanged file is served from cache."""
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        mock_run.return_value, screenshots = self._passing_run(screenshot)
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=screenshots):
+            first = gemini_agent.execute(str(mock_test_file))
+            second = gemini_agent.execute(str(mock_test_file))
+
+        assert first.success is True
+        assert second.success is True
+        assert second.cost_usd == 0.0
+        assert second.metadata == {'cache_hit': True}
+        assert second.data['validation_result'] == first.data['validation_result']
+        assert mock_run.call_count == 1
+
+    @patch('subprocess.run')
+    def test_modified_test_reruns(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test editing the test file invalidates the cached result."""
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        mock_run.return_value, screenshots = self._passing_run(screenshot)
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=screenshots):
+            gemini_agent.execute(str(mock_test_file))
+            mock_test_file.write_text(mock_test_file.read_text() + '\n// changed\n')
+            gemini_agent.execute(str(mock_test_file))
+
+        assert mock_run.call_count == 2
+
+    @patch('subprocess.run')
+    def test_missing_screenshots_bypass_cache(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test cached results are not reused once their screenshots are gone."""
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        mock_run.return_value, screenshots = self._passing_run(screenshot)
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=screenshots):
+            gemini_agent.execute(str(mock_test_file))
+            screenshot.unlink()
+            gemini_agent.execute(str(mock_test_file))
+
+        assert mock_run.call_count == 2
+
+    @patch('subprocess.run')
+    def test_failures_not_cached(self, mock_run, gemini_agent, mock_test_file):
+        """Test failed validations always re-run."""
+        mock_run.return_value = Mock(returncode=1, stdout='', stderr='')
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=[]):
+            gemini_agent.execute(str(mock_test_file))
+            gemini_agent.execute(str(mock_test_file))
+
+        assert mock_run.call_count == 2
+        assert gemini_agent._result_cache == {}
+
+    @patch('subprocess.run')
+    def test_use_cache_false_reruns(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test use_cache=False always runs the browser and stores nothing."""
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        mock_run.return_value, screenshots = self._passing_run(screenshot)
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=screenshots):
+            gemini_agent.execute(str(mock_test_file), use_cache=False)
+            gemini_agent.execute(str(mock_test_file), use_cache=False)
+
+        assert mock_run.call_count == 2
+        assert gemini_agent._result_cache == {}
+
+    @patch('subprocess.run')
+    def test_expired_entry_reruns(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test a cached pass older than the TTL is not reused."""
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        mock_run.return_value, screenshots = self._passing_run(screenshot)
+        gemini_agent.result_cache_ttl = 0
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=screenshots):
+            gemini_agent.execute(str(mock_test_file))
+            gemini_agent.execute(str(mock_test_file))
+
+        assert mock_run.call_count == 2
+
+    def test_concurrent_stores_stay_bounded(self, gemini_agent):
+        """Test stores from many threads never grow the cache past its size."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        gemini_agent.RESULT_CACHE_SIZE = 8
+        data = {'screenshots': []}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda i: gemini_agent._store_cached_validation(str(i).encode(), data), range(400)
+            ))
+
+        assert len(gemini_agent._result_cache) == 8
+
+    def test_cache_key_covers_base_url(self, gemini_agent, mock_test_file):
+        """Test pointing the tests at another app changes the cache key."""
+        gemini_agent._playwright_env['BASE_URL'] = 'http://localhost:3000'
+        first = gemini_agent._validation_cache_key(str(mock_test_file), False)
+        gemini_agent._playwright_env['BASE_URL'] = 'http://staging.example.com'
+        second = gemini_agent._validation_cache_key(str(mock_test_file), False)
+
+        assert first != second
+
+    def test_cache_dependencies_ignore_cwd(self, gemini_agent, mock_test_file, tmp_path, monkeypatch):
+        """Test Playwright config is read from the project root, not the CWD."""
+        first = gemini_agent._validation_cache_key(str(mock_test_file), False)
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'playwright.config.ts').write_text('export default {};')
+        second = gemini_agent._validation_cache_key(str(mock_test_file), False)
+
+        assert first == second
+
+
+class TestGeminiClose:
+    """Test releasing the agent's validation thread pool."""
+
+    def test_close_shuts_down_executor(self, gemini_agent):
+        """Test close() stops the executor so no new validations are accepted."""
+        gemini_agent.close()
+
+        with pytest.raises(RuntimeError):
+            gemini_agent._executor.submit(lambda: None)
+
+
+class TestGeminiRejudge:
+    """Test re-judging persisted screenshots without re-running the browser."""
+
+    @pytest.fixture
+    def judged_dir(self, tmp_path, mock_test_file):
+        """Artifacts directory with persisted judge inputs."""
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        (tmp_path / 'judge_input.json').write_text(json.dumps({
+            'test_path': str(mock_test_file),
+            'screenshots': [str(screenshot)]
+        }))
+        return tmp_path
+
+    @patch('subprocess.run')
+    def test_validate_only_persists_judge_input(self, mock_run, gemini_agent, mock_test_file, tmp_path):
+        """Test Phase 1 writes the screenshot list for later analysis."""
+        mock_run.return_value = Mock(returncode=0, stdout='{}', stderr='')
+
+        with patch.object(gemini_agent, '_collect_screenshots', return_value=['/tmp/a.png']):
+            gemini_agent.validate_only(str(mock_test_file), artifacts_dir=tmp_path)
+
+        judge_input = json.loads((tmp_path / 'judge_input.json').read_text())
+        assert judge_input == {'test_path': str(mock_test_file), 'screenshots': ['/tmp/a.png']}
+
+    def test_rejudge_reuses_analysis(self, gemini_agent, judged_dir):
+        """Test identical screenshots and model are analyzed only once."""
+        analysis = {'confidence_score': 90, 'cost_usd': 0.01}
+        with patch.object(gemini_agent, '_analyze_screenshots_with_gemini', return_value=analysis) as mock_analyze:
+            first = gemini_agent.rejudge(judged_dir)
+            second = gemini_agent.rejudge(judged_dir)
+
+        assert first['cost_usd'] == 0.01
+        assert second['confidence_score'] == 90
+        assert second['cost_usd'] == 0.0
+        assert second['cached'] is True
+        mock_analyze.assert_called_once()
+
+    def test_rejudge_with_new_model(self, gemini_agent, judged_dir):
+        """Test switching model re-runs analysis without a browser."""
+        with patch.object(gemini_agent, '_analyze_screenshots_with_gemini', return_value={'cost_usd': 0.01}) as mock_analyze, \
+             patch('subprocess.run') as mock_run:
+            gemini_agent.rejudge(judged_dir, model='gemini-2.5-pro')
+            gemini_agent.rejudge(judged_dir, model='gemini-2.5-flash')
+
+        assert mock_analyze.call_count == 2
+        assert mock_analyze.call_args.kwargs['model'] == 'gemini-2.5-flash'
+        mock_run.assert_not_called()
+
+    def test_rejudge_errors_not_cached(self, gemini_agent, judged_dir):
+        """Test failed analyses are retried."""
+        with patch.object(gemini_agent, '_analyze_screenshots_with_gemini', return_value={'error': 'quota'}) as mock_analyze:
+            gemini_agent.rejudge(judged_dir)
+            gemini_agent.rejudge(judged_dir)
+
+        assert mock_analyze.call_count == 2
+
+    def test_file_digest_matches_content_hash(self, gemini_agent, tmp_path, monkeypatch):
+        """Test streamed screenshot hashing, with and without hashlib.file_digest."""
+        import hashlib
+
+        screenshot = tmp_path / 'big.png'
+        screenshot.write_bytes(b'x' * (3 << 20))
+        expected = hashlib.blake2b(screenshot.read_bytes()).digest()
+
+        assert gemini_agent._file_digest(str(screenshot)) == expected
+
+        monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+        assert gemini_agent._file_digest(str(screenshot)) == expected
+
+    def test_changed_screenshot_changes_judge_key(self, gemini_agent, judged_dir):
+        """Test the judge key tracks screenshot contents."""
+        screenshot = judged_dir / 'step.png'
+        before = gemini_agent._judge_cache_key([str(screenshot)], 'gemini-2.5-pro')
+        screenshot.write_bytes(b'other')
+
+        assert gemini_agent._judge_cache_key([str(screenshot)], 'gemini-2.5-pro') != before
+
+
+class TestGeminiConcurrentValidation:
+    """Test concurrent multi-test validation."""
+
+    def test_execute_many_async_bounds_concurrency(self, gemini_agent):
+        """Test results keep input order and in-flight validations stay bounded."""
+        import asyncio
+        import threading
+
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_execute(test_path, timeout, enable_ai_analysis):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return AgentResult(success=True, data={'test_path': test_path})
+
+        paths = [f'tests/t{i}.spec.ts' for i in range(8)]
+        with patch.object(gemini_agent, 'execute', side_effect=fake_execute):
+            results = asyncio.run(gemini_agent.execute_many_async(paths, concurrency=2))
+
+        assert [r.data['test_path'] for r in results] == paths
+        assert 1 < peak <= 2
+
+    def test_concurrency_defaults_to_pool_size(self):
+        """Test validation concurrency follows the configured browser pool size."""
+        with patch.object(GeminiAgent, '_load_config', return_value={
+            'contracts': {'browser': {'pool_size': 3}}
+        }):
+            agent = GeminiAgent()
+
+        assert agent.validation_concurrency == 3
+        assert agent._executor._max_workers == 3
+
+
+class TestGeminiAnalysisUpload:
+    """Test screenshot upload preparation and API cost accounting."""
+
+    def test_large_screenshot_downscaled(self, gemini_agent, tmp_path):
+        """Test screenshots are shrunk to fit the max upload dimension."""
+        Image = pytest.importorskip('PIL.Image')
+        import io
+
+        screenshot = tmp_path / 'big.png'
+        Image.new('RGB', (2560, 1440), 'white').save(screenshot)
+
+        data = gemini_agent._load_screenshot(str(screenshot))
+
+        assert max(Image.open(io.BytesIO(data)).size) == 1024
+
+    def test_small_screenshot_uploaded_as_is(self, gemini_agent, tmp_path):
+        """Test screenshots within the limit keep their original bytes."""
+        Image = pytest.importorskip('PIL.Image')
+
+        screenshot = tmp_path / 'small.png'
+        Image.new('RGB', (800, 600), 'white').save(screenshot)
+
+        assert gemini_agent._load_screenshot(str(screenshot)) == screenshot.read_bytes()
+
+    def test_analysis_request_skips_unreadable_screenshots(self, gemini_agent, mock_test_file, tmp_path):
+        """Test screenshots are loaded in order, capped, and unreadable ones dropped."""
+        gemini_agent.genai_types = Mock()
+        gemini_agent.genai_types.Part.from_bytes.side_effect = lambda data, mime_type: data
+        paths = []
+        for i in range(5):
+            path = tmp_path / f'step_{i}.png'
+            path.write_bytes(f'png{i}'.encode())
+            paths.append(str(path))
+        paths[1] = str(tmp_path / 'missing.png')
+
+        with patch('agent_system.agents.gemini.PIL_AVAILABLE', False):
+            _, _, attached = gemini_agent._build_analysis_request(paths, str(mock_test_file))
+
+        parts = gemini_agent.genai_types.Content.call_args.kwargs['parts']
+        assert attached == 2
+        assert parts[1:] == [b'png0', b'png2']
+
+    def test_analysis_prompt_uses_test_file_prefix(self, gemini_agent, tmp_path):
+        """Test only the first 2000 characters of the test file reach the prompt."""
+        gemini_agent.genai_types = Mock()
+        test_file = tmp_path / 'big.spec.ts'
+        test_file.write_text('a' * 2000 + 'b' * 100_000)
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+
+        with patch('agent_system.agents.gemini.PIL_AVAILABLE', False):
+            gemini_agent._build_analysis_request([str(screenshot)], str(test_file))
+
+        prompt = gemini_agent.genai_types.Part.call_args.kwargs['text']
+        assert 'a' * 2000 in prompt
+        assert 'b' not in prompt.split('```typescript')[1].split('```')[0]
+
+    def test_cost_from_reported_usage(self, gemini_agent):
+        """Test cost uses Gemini's token counts and per-model pricing."""
+        response = Mock()
+        response.usage_metadata.prompt_token_count = 1_000_000
+        response.usage_metadata.candidates_token_count = 100_000
+
+        assert gemini_agent._estimate_api_cost(response, 'gemini-2.5-flash') == pytest.approx(0.55)
+        assert gemini_agent._estimate_api_cost(response, 'gemini-2.5-pro') == pytest.approx(2.25)
+
+    def test_default_analysis_model_is_flash(self, gemini_agent):
+        """Test screenshot analysis defaults to the cheaper flash model."""
+        assert gemini_agent.analysis_model == 'gemini-2.5-flash'
+
+
+class TestGeminiAsyncAnalysis:
+    """Test natively async Gemini screenshot analysis."""
+
+    def test_execute_async_awaits_analysis(self, gemini_agent):
+        """Test the browser phase runs without AI and analysis is awaited afterwards."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        gemini_agent.gemini_enabled = True
+        browser_result = AgentResult(
+            success=True,
+            data={'screenshots': ['/tmp/a.png'], 'artifacts_dir': 'artifacts/x', 'ai_analysis': None},
+            cost_usd=0.0
+        )
+
+        with patch.object(gemini_agent, 'execute', return_value=browser_result) as mock_execute, \
+             patch.object(gemini_agent, 'rejudge_async', new=AsyncMock(return_value={'cost_usd': 0.01})):
+            result = asyncio.run(gemini_agent.execute_async('tests/x.spec.ts', enable_ai_analysis=True))
+
+        assert mock_execute.call_args.args[2] is False
+        assert result.data['ai_analysis'] == {'cost_usd': 0.01}
+        assert result.cost_usd == pytest.approx(0.01)
+        assert gemini_agent.total_cost == pytest.approx(0.01)
+
+    def test_async_analysis_uses_aio_client(self, gemini_agent, mock_test_file, tmp_path):
+        """Test the async path calls the SDK's async client, not the sync one."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        screenshot = tmp_path / 'step.png'
+        screenshot.write_bytes(b'png')
+        response = Mock(text='{"confidence_score": 90}')
+        response.usage_metadata.prompt_token_count = 1000
+        response.usage_metadata.candidates_token_count = 100
+
+        gemini_agent.gemini_client = Mock()
+        gemini_agent.gemini_client.aio.models.generate_content = AsyncMock(return_value=response)
+        gemini_agent.genai_types = Mock()
+
+        with patch.object(gemini_agent, '_load_screenshot', return_value=b'png'):
+            analysis = asyncio.run(gemini_agent._analyze_screenshots_with_gemini_async(
+                [str(screenshot)], str(mock_test_file), model='gemini-2.5-flash'
+            ))
+
+        assert analysis['confidence_score'] == 90
+        assert analysis['screenshots_analyzed'] == 1
+        gemini_agent.gemini_client.aio.models.generate_content.assert_awaited_once()
+        gemini_agent.gemini_client.models.generate_content.assert_not_called()
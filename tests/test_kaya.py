@@ -9,11 +9,13 @@ Tests cover:
 - Cost tracking across session
 - Budget enforcement (soft warning at 80%, hard stop at 100%)
 """
+import collections
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import time
+from pathlib import Path
 
-from agent_system.agents.kaya import KayaAgent
+from agent_system.agents.kaya import KayaAgent, TaskRecord
 from agent_system.agents.base_agent import AgentResult
 from agent_system.router import RoutingDecision
 
@@ -292,6 +294,147 @@ class TestIntentParsingUnknown:
         assert result['success'] is False
 
 
+class TestIntentParsingPrecedence:
+    """Test compiled intent patterns keep declaration order."""
+
+    def test_earlier_intent_wins_over_earlier_position(self, kaya):
+        """Test an earlier-declared pattern wins even if a later one matches sooner."""
+        # 'run ... tests in' matches at position 0, but create_test is declared first
+        result = kaya.parse_intent("run tests in create test for checkout")
+
+        assert result['intent'] == 'create_test'
+        assert result['slots']['raw_value'] == 'checkout'
+
+    def test_slot_from_later_pattern_group(self, kaya):
+        """Test slot is taken from the matched pattern's own capture group."""
+        result = kaya.parse_intent("use Opus for scribe")
+
+        assert result['intent'] == 'set_model'
+        assert result['slots']['raw_value'] == 'Opus'
+
+    def test_pattern_without_groups_has_empty_slot(self, kaya):
+        """Test patterns with no capture groups yield an empty raw_value."""
+        result = kaya.parse_intent("reset models")
+
+        assert result['intent'] == 'set_model'
+        assert result['slots']['raw_value'] == ''
+
+    def test_patterns_compiled_in_declaration_order(self):
+        """Test the compiled pattern list keeps INTENT_PATTERNS order."""
+        intents = [intent for _, intent, _ in KayaAgent._INTENT_PATTERN_LIST]
+        expected = [
+            intent
+            for intent, patterns in KayaAgent.INTENT_PATTERNS.items()
+            for _ in patterns
+        ]
+
+        assert intents == expected
+
+    def test_parse_does_not_compile_patterns(self, kaya):
+        """Test parsing uses the class-level compiled regex, not the re module."""
+        with patch('agent_system.agents.kaya.re') as mock_re:
+            result = kaya.parse_intent("Write a test for Checkout")
+
+        assert mock_re.mock_calls == []
+        assert result['intent'] == 'create_test'
+        assert result['slots']['raw_value'] == 'Checkout'
+
+    def test_every_pattern_has_trigger_word(self):
+        """Test the keyword prefilter cannot reject a command some pattern matches."""
+        for patterns in KayaAgent.INTENT_PATTERNS.values():
+            for pattern in patterns:
+                assert KayaAgent._INTENT_TRIGGER_REGEX.search(pattern), pattern
+
+    def test_unknown_command_skips_intent_regex(self, kaya):
+        """Test commands without any trigger word never reach the full regex."""
+        with patch.object(KayaAgent, '_INTENT_PATTERN_LIST', MagicMock()) as mock_patterns, \
+                patch.object(KayaAgent, '_INTENT_RE2_PATTERNS', None):
+            result = kaya.parse_intent("hello there, how are you?")
+
+        mock_patterns.__iter__.assert_not_called()
+        assert result['success'] is False
+
+    def test_pattern_list_matches_like_stdlib_patterns(self, kaya):
+        """Test the per-pattern (RE2) path parses commands like the stdlib path."""
+        import re
+        from agent_system.agents.kaya import _compile_intent_pattern_list
+
+        commands = [
+            "Write a test for Checkout",
+            "run tests in create test for checkout",
+            "use Opus for scribe",
+            "reset models",
+            "status",
+            "status task t_123",
+            "validate tests/login.spec.ts",
+            "fix all failures in tests/cart",
+            "hello there",
+            "run the thing",
+        ]
+        with patch.object(KayaAgent, '_INTENT_RE2_PATTERNS', None):
+            expected = [kaya._match_intent(command) for command in commands]
+
+        pattern_list = _compile_intent_pattern_list(KayaAgent.INTENT_PATTERNS, re)
+        with patch.object(KayaAgent, '_INTENT_RE2_PATTERNS', pattern_list), \
+                patch.object(KayaAgent, 'RE2_MIN_COMMAND_LENGTH', 0):
+            assert [kaya._match_intent(command) for command in commands] == expected
+
+    def test_short_commands_skip_re2(self, kaya):
+        """Test RE2 patterns are only searched for long commands."""
+        re2_patterns = MagicMock()
+        with patch.object(KayaAgent, '_INTENT_RE2_PATTERNS', re2_patterns):
+            result = kaya._match_intent("Write a test for Checkout")
+
+        re2_patterns.__iter__.assert_not_called()
+        assert result['intent'] == 'create_test'
+
+
+class TestIntentCache:
+    """Test the LFU cache of parsed intents."""
+
+    def test_repeated_command_skips_matching(self, kaya):
+        """Test a repeated command is served from the cache."""
+        first = kaya.parse_intent("status task t_123")
+
+        with patch.object(kaya, '_match_intent') as mock_match:
+            second = kaya.parse_intent("  status task t_123  ")
+
+        mock_match.assert_not_called()
+        assert second == first
+
+    def test_cached_slots_not_shared(self, kaya):
+        """Test mutating returned slots does not corrupt the cache."""
+        kaya.parse_intent("run tests in tests/Login.spec.ts")['slots']['raw_value'] = 'mutated'
+
+        assert kaya.parse_intent("run tests in tests/Login.spec.ts")['slots']['raw_value'] == 'tests/Login.spec.ts'
+
+    def test_least_frequent_command_evicted(self, kaya):
+        """Test eviction drops the least frequently used command."""
+        kaya.INTENT_CACHE_SIZE = 2
+        for _ in range(3):
+            kaya.parse_intent("status")
+        kaya.parse_intent("status task a")
+        kaya.parse_intent("status task b")
+
+        assert set(kaya._intent_cache) == {"status", "status task b"}
+
+    def test_miss_on_full_cache_does_not_scan(self, kaya):
+        """Test eviction on a full cache picks the victim without scanning every entry."""
+        kaya.INTENT_CACHE_SIZE = 64
+        for i in range(kaya.INTENT_CACHE_SIZE):
+            kaya.parse_intent(f"status task t_{i}")
+        kaya.parse_intent("status task t_0")
+
+        with patch('builtins.min', side_effect=AssertionError('min() scan')):
+            for i in range(kaya.INTENT_CACHE_SIZE, 3 * kaya.INTENT_CACHE_SIZE):
+                kaya.parse_intent(f"status task t_{i}")
+
+        assert len(kaya._intent_cache) == kaya.INTENT_CACHE_SIZE
+        # The one command seen twice outlives the single-use ones
+        assert "status task t_0" in kaya._intent_cache
+        assert sum(len(bucket) for bucket in kaya._intent_freq.values()) == kaya.INTENT_CACHE_SIZE
+
+
 # ============================================================================
 # TEST: Routing Integration - create_test
 # ============================================================================
@@ -339,6 +482,42 @@ class TestRoutingCreateTest:
         # Feature is lowercased by parse_intent
         assert 'oauth flow with token refresh' in result.data['feature'].lower()
 
+    def test_dispatch_error_traceback_only_in_debug(self, kaya, mock_routing_decision, caplog):
+        """Test failed dispatches log a traceback only when DEBUG is enabled."""
+        import logging
+
+        decision = mock_routing_decision()
+        kaya.router.route.return_value = decision
+        failing = Mock()
+        failing.execute.side_effect = RuntimeError('boom')
+
+        with patch.object(kaya, '_get_agent', return_value=failing):
+            with caplog.at_level(logging.INFO, logger='agent_system.agents.kaya'):
+                result = kaya._handle_run_test({'raw_value': 'tests/a.spec.ts'}, None)
+            assert not caplog.records[-1].exc_info
+
+            caplog.clear()
+            with caplog.at_level(logging.DEBUG, logger='agent_system.agents.kaya'):
+                kaya._handle_run_test({'raw_value': 'tests/a.spec.ts'}, None)
+            assert caplog.records[-1].exc_info
+
+        assert result.success is False
+        assert result.error == 'Failed to execute test: boom'
+        assert result.metadata['routing_decision'] is decision
+
+    def test_create_test_output_path_strips_punctuation(self, kaya, mock_routing_decision):
+        """Test the test file name uses the first three words without punctuation."""
+        kaya.router.route.return_value = mock_routing_decision()
+        kaya.metrics = Mock()
+        scribe = Mock()
+        scribe.execute.return_value = AgentResult(success=True, data={'test_path': 'x'}, cost_usd=0.0)
+
+        with patch.object(kaya, '_get_agent', return_value=scribe), \
+             patch('agent_system.agents.kaya.emit_event'):
+            kaya._handle_create_test({'raw_value': 'Login, "Checkout" (v2) flow'}, None)
+
+        assert scribe.execute.call_args.kwargs['output_path'] == 'tests/login_checkout_v2.spec.ts'
+
     def test_route_create_test_with_routing_metadata(self, kaya, mock_routing_decision):
         """Test that routing decision is included in metadata."""
         decision = mock_routing_decision()
@@ -463,6 +642,18 @@ class TestRoutingValidate:
         assert result.success is True
         assert 'checkout-payment' in result.data['test_path']
 
+    def test_validate_metadata_keeps_decision(self, kaya, mock_routing_decision):
+        """Test the routing decision is attached as-is rather than copied."""
+        gemini_decision = mock_routing_decision(agent='gemini', model='2.5_pro')
+        kaya.router.route.return_value = gemini_decision
+        gemini = Mock()
+        gemini.execute.return_value = AgentResult(success=True, data={}, cost_usd=0.0)
+
+        with patch.object(kaya, '_get_agent', return_value=gemini):
+            result = kaya._handle_validate({'raw_value': 'tests/checkout.spec.ts'}, None)
+
+        assert result.metadata['routing_decision'] is gemini_decision
+
 
 # ============================================================================
 # TEST: Status Inquiry
@@ -489,6 +680,67 @@ class TestStatusInquiry:
         # Router should not be called for status inquiries
         kaya.router.route.assert_not_called()
 
+    def test_task_history_bounded_but_totals_kept(self, kaya):
+        """Test old tasks are evicted from history without skewing session totals."""
+        kaya.task_history = collections.deque(maxlen=3)
+        kaya.check_budget = Mock(return_value={'status': 'ok'})
+
+        for _ in range(5):
+            kaya.execute("status")
+
+        stats = kaya.get_session_stats()
+        assert 'task_history' not in stats
+        assert stats['task_count'] == 3
+        assert stats['total_tasks'] == 5
+        history = kaya.get_session_stats(include_history=True)['task_history']
+        assert len(history) == 3
+        assert set(history[0]) == {'command', 'intent', 'success', 'cost', 'timestamp'}
+        assert stats['intent_stats']['status'] == {'total': 5, 'success': 5, 'cost': 0.0}
+
+    def test_status_reports_last_five_tasks_in_order(self, kaya):
+        """Test status returns the five most recent tasks, oldest first."""
+        kaya.check_budget = Mock(return_value={'status': 'ok'})
+        for i in range(8):
+            kaya._record_task(TaskRecord(f'cmd {i}', 'status', True, 0.0, float(i)))
+
+        result = kaya.execute("status")
+
+        assert [task['command'] for task in result.data['task_history']] == [f'cmd {i}' for i in range(3, 8)]
+
+    def test_history_window_sets_task_history_capacity(self):
+        """Test the history_window argument bounds task_history."""
+        with patch('agent_system.agents.kaya.Router'):
+            assert KayaAgent().task_history.maxlen == KayaAgent.TASK_HISTORY_SIZE
+            assert KayaAgent(history_window=10).task_history.maxlen == 10
+
+    def test_session_stats_cached_until_task_or_cost_changes(self, kaya):
+        """Test get_session_stats reuses its aggregate between recorded tasks."""
+        kaya.check_budget = Mock(return_value={'status': 'ok'})
+
+        first = kaya.get_session_stats()
+        second = kaya.get_session_stats()
+        assert first == second
+        assert first is not second
+        assert kaya.check_budget.call_count == 1
+
+        kaya._record_task(TaskRecord('status', 'status', True, 0.0, 0.0))
+        assert kaya.get_session_stats()['total_tasks'] == 1
+
+        kaya.session_cost = 1.5
+        assert kaya.get_session_stats()['session_cost'] == 1.5
+        assert kaya.check_budget.call_count == 3
+
+    def test_success_rate_tracked_incrementally(self, kaya):
+        """Test success_rate follows recorded tasks and is 0.0 before any."""
+        assert kaya.get_session_stats()['success_rate'] == 0.0
+
+        kaya._record_task(TaskRecord('status', 'status', True, 0.0, 0.0))
+        kaya._record_task(TaskRecord('status', 'status', False, 0.0, 0.0))
+        kaya._record_task(TaskRecord('status', 'status', True, 0.0, 0.0))
+        kaya._record_task(TaskRecord('status', 'status', True, 0.0, 0.0))
+
+        assert kaya.get_session_stats()['success_rate'] == 0.75
+
 
 # ============================================================================
 # TEST: Cost Tracking
@@ -715,6 +967,215 @@ class TestAgentDispatch:
         assert result.data['action'] == 'route_to_gemini'
         assert result.data['agent'] == 'gemini'
 
+    def test_full_pipeline_warms_up_gemini(self, kaya):
+        """Test Gemini is warmed up in the background before validation."""
+        kaya.metrics = Mock()
+        agents = {'critic': Mock(), 'gemini': Mock()}
+        agents['critic'].execute.return_value = AgentResult(success=True, cost_usd=0.0)
+        calls = []
+        agents['gemini'].warmup.side_effect = lambda: calls.append('warmup')
+
+        def validate(slots, context):
+            calls.append('validate')
+            return AgentResult(success=True, cost_usd=0.0)
+
+        kaya._lifecycle = Mock(active_tasks={})
+        kaya._lifecycle.is_shutting_down.return_value = False
+
+        with patch.object(kaya, '_get_agent', side_effect=agents.__getitem__), \
+             patch.object(kaya, '_handle_create_test', return_value=AgentResult(
+                success=True, data={'test_path': 'tests/signup.spec.ts'}, cost_usd=0.0)), \
+             patch.object(kaya, '_handle_run_test', return_value=AgentResult(success=True, cost_usd=0.0)), \
+             patch.object(kaya, '_handle_validate', side_effect=validate):
+            result = kaya._handle_full_pipeline({'raw_value': 'signup'}, None)
+
+        assert result.success is True
+        assert calls == ['warmup', 'validate']
+        kaya._lifecycle.remove_active_task.assert_called_once()
+        kaya.metrics.record_batch.assert_called_once()
+        events = dict(kaya.metrics.record_batch.call_args[0][0])
+        assert events['critic_decision']['decision'] == 'approved'
+        duration_ms = events['feature_completion']['duration_ms']
+        assert isinstance(duration_ms, int) and duration_ms >= 0
+
+    def test_critic_rejection_cancels_background_steps(self, kaya):
+        """Test warmup and Runner preparation are cancelled when the pipeline stops early."""
+        kaya.metrics = Mock()
+        kaya.router.get_fallback.return_value = 'return_to_scribe'
+        critic = Mock()
+        critic.execute.return_value = AgentResult(success=False, error='bad selectors', cost_usd=0.0)
+        futures = [Mock(), Mock()]
+        kaya._pool = Mock()
+        kaya._pool.submit.side_effect = futures
+        kaya._lifecycle = Mock(active_tasks={})
+        kaya._lifecycle.is_shutting_down.return_value = False
+
+        with patch.object(kaya, '_get_agent', return_value=critic), \
+             patch.object(kaya, '_handle_create_test', return_value=AgentResult(
+                success=True, data={'test_path': 'tests/signup.spec.ts'}, cost_usd=0.0)):
+            result = kaya._handle_full_pipeline({'raw_value': 'signup'}, None)
+
+        assert result.success is False
+        for future in futures:
+            future.cancel.assert_called_once_with()
+            future.result.assert_not_called()
+
+    def test_full_pipeline_prepares_runner_before_step_3(self, kaya, mock_routing_decision):
+        """Test Runner routing and loading finish in the background before Runner runs."""
+        kaya.metrics = Mock()
+        decision = mock_routing_decision(agent='runner', model='haiku')
+        kaya.router.route.return_value = decision
+        agents = {'critic': Mock(), 'gemini': Mock(), 'runner': Mock()}
+        agents['critic'].execute.return_value = AgentResult(success=True, cost_usd=0.0)
+        loaded = []
+        seen_at_run = {}
+
+        def get_agent(name):
+            loaded.append(name)
+            return agents[name]
+
+        def run_test(slots, context):
+            seen_at_run['routed'] = kaya.router.route.call_count
+            seen_at_run['loaded'] = list(loaded)
+            return AgentResult(success=True, cost_usd=0.0)
+
+        kaya._lifecycle = Mock(active_tasks={})
+        kaya._lifecycle.is_shutting_down.return_value = False
+
+        with patch.object(kaya, '_get_agent', side_effect=get_agent), \
+             patch.object(kaya, '_handle_create_test', return_value=AgentResult(
+                success=True, data={'test_path': 'tests/signup.spec.ts'}, cost_usd=0.0)), \
+             patch.object(kaya, '_handle_run_test', side_effect=run_test), \
+             patch.object(kaya, '_handle_validate', return_value=AgentResult(success=True, cost_usd=0.0)):
+            result = kaya._handle_full_pipeline({'raw_value': 'signup'}, None)
+
+        assert result.success is True
+        assert seen_at_run['routed'] == 1
+        assert 'runner' in seen_at_run['loaded']
+        kaya.router.route.assert_called_once_with(
+            task_type='execute_test', task_description='tests/signup.spec.ts'
+        )
+
+    def test_pipeline_messages(self, kaya):
+        """Test pipeline status messages per final stage."""
+        results = [('scribe', None), ('runner', None), ('medic', None), ('runner_retry', None)]
+
+        assert kaya._build_pipeline_message('completed', results) == \
+            "Pipeline completed successfully: scribe → runner → medic → runner_retry"
+        assert kaya._build_pipeline_message('execution_failed', results) == \
+            "Pipeline failed: Test execution failed after 1 Medic attempts"
+        assert kaya._build_pipeline_message('scribe_failed', results) == \
+            "Pipeline failed at Scribe (test writing)"
+        assert kaya._build_pipeline_message('shutdown_interrupted', results[:1]) == \
+            "Pipeline in progress: scribe"
+
+    def test_agents_shared_across_instances(self, kaya):
+        """Test agents are built once and shared by every KayaAgent."""
+        from agent_system.agents import kaya as kaya_module
+
+        kaya_module._get_agent_cached.cache_clear()
+        with patch('agent_system.agents.critic.CriticAgent') as mock_critic_class:
+            first = kaya._get_agent('critic')
+            second = KayaAgent()._get_agent('critic')
+        kaya_module._get_agent_cached.cache_clear()
+
+        mock_critic_class.assert_called_once()
+        assert first is second
+
+    def test_preload_agents_loads_in_background(self, kaya):
+        """Test preload_agents builds each agent once on the pool and _get_agent reuses it."""
+        from agent_system.agents import kaya as kaya_module
+
+        agents = {name: Mock(name=name) for name in KayaAgent.AGENT_NAMES}
+        with patch.object(kaya_module, '_get_agent_cached', side_effect=agents.get) as mock_cached:
+            kaya.preload_agents()
+            kaya.preload_agents()
+            loaded = {name: kaya._get_agent(name) for name in KayaAgent.AGENT_NAMES}
+
+        assert loaded == agents
+        assert mock_cached.call_count == len(KayaAgent.AGENT_NAMES)
+
+    def test_close_shuts_down_pool(self, kaya):
+        """Test close() stops the background pool accepting work."""
+        kaya.close()
+
+        with pytest.raises(RuntimeError):
+            kaya.preload_agents()
+
+    def test_cli_batch_mode_reads_piped_commands(self, monkeypatch, capsys):
+        """Test piped stdin runs each command until 'quit'."""
+        import io
+        from agent_system.agents import kaya as kaya_module
+
+        monkeypatch.setattr('sys.argv', ['kaya'])
+        monkeypatch.setattr('sys.stdin', io.StringIO("status\n\nfoo\nquit\nstatus\n"))
+        with patch.object(kaya_module, 'KayaAgent') as mock_kaya_class:
+            mock_kaya_class.return_value.execute.return_value = AgentResult(success=False, error='nope')
+            kaya_module.main()
+
+        executed = [c.args[0] for c in mock_kaya_class.return_value.execute.call_args_list]
+        assert executed == ['status', 'foo']
+        assert capsys.readouterr().out.count('Error: nope') == 2
+        mock_kaya_class.return_value.close.assert_called_once()
+
+    def test_cli_json_mode_writes_one_line_per_result(self, monkeypatch, capsys):
+        """Test --json emits one JSON object per piped command."""
+        import io
+        import json
+        from agent_system.agents import kaya as kaya_module
+
+        monkeypatch.setattr('sys.argv', ['kaya', '--json'])
+        monkeypatch.setattr('sys.stdin', io.StringIO("status\nfoo\n"))
+        with patch.object(kaya_module, 'KayaAgent') as mock_kaya_class:
+            mock_kaya_class.return_value.execute.side_effect = [
+                AgentResult(success=True, data={'path': Path('tests/a.spec.ts')}),
+                AgentResult(success=False, error='nope'),
+            ]
+            kaya_module.main()
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert lines[0]['success'] is True
+        assert lines[0]['data'] == {'path': 'tests/a.spec.ts'}
+        assert lines[1] == {
+            'success': False, 'data': None, 'error': 'nope',
+            'cost_usd': 0.0, 'execution_time_ms': 0
+        }
+
+    def test_default_project_dir_checked_once(self):
+        """Test the default coverage project directory is probed once per process."""
+        from agent_system.agents import kaya as kaya_module
+
+        kaya_module._default_project_dir.cache_clear()
+        try:
+            with patch('agent_system.agents.kaya.os.path.exists', return_value=False) as mock_exists:
+                assert kaya_module._default_project_dir() is None
+                assert kaya_module._default_project_dir() is None
+            mock_exists.assert_called_once()
+        finally:
+            kaya_module._default_project_dir.cache_clear()
+
+    def test_import_does_not_load_coverage_analyzer(self):
+        """Test the coverage analyzer is only imported by the coverage handler."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, agent_system.agents.kaya; "
+            "print('agent_system.coverage_analyzer' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == 'False'
+
+    def test_every_intent_has_handler(self, kaya):
+        """Test each parseable intent maps to a workflow handler."""
+        assert set(kaya._handlers) == set(KayaAgent.INTENT_PATTERNS)
+
+    def test_parsed_intent_is_pattern_key_object(self, kaya):
+        """Test parsed intents reuse the INTENT_PATTERNS key strings, not copies."""
+        keys = {key: key for key in KayaAgent.INTENT_PATTERNS}
+        intent = kaya.parse_intent('status')['intent']
+        assert intent is keys['status']
+
 
 # ============================================================================
 # TEST: Context Handling
@@ -325,10 +325,10 @@ class TestTimeoutHandling:
     """Test timeout handling."""
 
     @patch('agent_system.agents.runner.subprocess.run')
-    @patch('agent_system.agents.runner.time.time')
+    @patch('agent_system.agents.runner.time.perf_counter_ns')
     def test_execute_timeout(self, mock_time, mock_run, runner_agent):
         """Test execution timeout handling."""
-        mock_time.side_effect = [1000.0, 1060.0]
+        mock_time.side_effect = [1_000_000_000_000, 1_060_000_000_000]
         mock_run.side_effect = subprocess.TimeoutExpired(
             cmd=['npx', 'playwright', 'test', 'tests/slow.spec.ts'],
             timeout=60
@@ -451,10 +451,10 @@ class TestExecutionMetrics:
 
     @patch('agent_system.agents.runner.subprocess.run')
     @patch('agent_system.agents.runner.RunnerAgent._collect_artifacts')
-    @patch('agent_system.agents.runner.time.time')
+    @patch('agent_system.agents.runner.time.perf_counter_ns')
     def test_execution_time_tracking(self, mock_time, mock_artifacts, mock_run, runner_agent):
         """Test execution time is tracked correctly."""
-        mock_time.side_effect = [1000.0, 1002.5]  # 2.5 seconds
+        mock_time.side_effect = [1_000_000_000_000, 1_002_500_000_000]  # 2.5 seconds
 
         mock_result = MagicMock()
         mock_result.stdout = "1 passed (2.5s)"
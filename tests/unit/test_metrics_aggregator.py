@@ -210,6 +210,35 @@ class TestMetricsAggregator:
         record_value = list(record_dict.keys())[0]
         assert 'test_002|0|3000|0.05' in record_value
 
+    def test_record_batch_single_round_trip(self, aggregator, mock_redis_client):
+        """Test batched metrics are written through one Redis pipeline."""
+        pipe = Mock()
+        mock_redis_client.client.pipeline = Mock(return_value=pipe)
+
+        result = aggregator.record_batch([
+            ('critic_decision', {'test_id': 'tests/a.spec.ts', 'decision': 'approved', 'reason': None}),
+            ('agent_activity', {'agent': 'critic', 'duration_ms': 500, 'cost_usd': 0.01, 'model': 'haiku'}),
+            ('validation_result', {'test_id': 'tests/a.spec.ts', 'passed': True}),
+            ('feature_completion', {'feature': 'login', 'total_cost': 0.5, 'duration_ms': 9000, 'retry_count': 1}),
+        ])
+
+        assert result is True
+        pipe.execute.assert_called_once()
+        assert pipe.zadd.call_count == 5  # Model usage adds a second activity write
+        mock_redis_client.client.zadd.assert_not_called()
+
+        keys = [call[0][0] for call in pipe.zadd.call_args_list]
+        assert keys[0].startswith('metrics:critic_decisions:')
+        assert keys[2].startswith('metrics:model_usage:haiku:')
+        assert keys[4].startswith('metrics:feature_completion:')
+
+    def test_record_batch_empty(self, aggregator, mock_redis_client):
+        """Test an empty batch does not touch Redis."""
+        mock_redis_client.client.pipeline = Mock()
+
+        assert aggregator.record_batch([]) is True
+        mock_redis_client.client.pipeline.assert_not_called()
+
     def test_get_metrics_summary_empty(self, aggregator, mock_redis_client):
         """Test getting metrics summary with no data."""
         summary = aggregator.get_metrics_summary(window_hours=1)
@@ -638,6 +638,49 @@ class TestHaikuRatioTarget:
 # TEST: Edge Cases
 # ============================================================================
 
+class TestRouteCache:
+    """Test memoization of routing decisions."""
+
+    def test_identical_inputs_reuse_decision(self, router_with_mock_policy, mock_complexity_estimator):
+        """Test repeated routing of the same task skips complexity estimation."""
+        mock_complexity_estimator.estimate.return_value = Mock(score=2, difficulty='easy')
+
+        first = router_with_mock_policy.route('write_test', 'login form', test_path='tests/login.spec.ts')
+        second = router_with_mock_policy.route('write_test', 'login form', test_path='tests/login.spec.ts')
+        other = router_with_mock_policy.route('write_test', 'signup form')
+
+        assert second is first
+        assert other is not first
+        assert mock_complexity_estimator.estimate.call_count == 2
+
+    def test_cache_is_bounded_and_clearable(self, router_with_mock_policy, mock_complexity_estimator):
+        """Test the oldest decision is evicted at capacity and clear_route_cache empties it."""
+        mock_complexity_estimator.estimate.return_value = Mock(score=2, difficulty='easy')
+        router_with_mock_policy.ROUTE_CACHE_SIZE = 2
+
+        first = router_with_mock_policy.route('write_test', 'a')
+        router_with_mock_policy.route('write_test', 'b')
+        router_with_mock_policy.route('write_test', 'c')
+
+        assert len(router_with_mock_policy._route_cache) == 2
+        assert router_with_mock_policy.route('write_test', 'a') is not first
+
+        router_with_mock_policy.clear_route_cache()
+        assert router_with_mock_policy._route_cache == {}
+
+    def test_concurrent_routes_stay_bounded(self, router_with_mock_policy, mock_complexity_estimator):
+        """Test routing from many threads never grows the cache past its size."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_complexity_estimator.estimate.return_value = Mock(score=2, difficulty='easy')
+        router_with_mock_policy.ROUTE_CACHE_SIZE = 8
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: router_with_mock_policy.route('write_test', str(i % 32)), range(400)))
+
+        assert len(router_with_mock_policy._route_cache) <= 8
+
+
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 